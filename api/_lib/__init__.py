@@ -10,14 +10,17 @@ from .location import (
     find_nearby_schools,
     find_nearby_pois,
     find_nearby_attractions,
+    has_fresh_location,
+    fetch_neighborhood,
     enhance_property_with_location_data,
     extract_poi_type_from_query
 )
 
 from .search import (
-    cosine_similarity,
     find_property_by_name,
     extract_property_name_from_results,
+    get_query_embedding,
+    filter_rows_by_preferences,
     search_properties
 )
 
@@ -35,6 +38,16 @@ from .email import (
     send_tour_confirmation_email
 )
 
+from .turn import TurnContext
+
+from .timing import (
+    StageTimer,
+    start_turn_timer,
+    current_turn_timer,
+    timed_stage,
+    pipeline_stage
+)
+
 from .constants import (
     system_message,
 )
@@ -48,11 +61,14 @@ __all__ = [
     'find_nearby_schools',
     'find_nearby_pois',
     'find_nearby_attractions',
+    'has_fresh_location',
+    'fetch_neighborhood',
     'enhance_property_with_location_data',
     'extract_poi_type_from_query',
-    'cosine_similarity',
     'find_property_by_name',
     'extract_property_name_from_results',
+    'get_query_embedding',
+    'filter_rows_by_preferences',
     'search_properties',
     'extract_parsed_filters',
     'extract_user_preferences',
@@ -63,4 +79,10 @@ __all__ = [
     'send_email',
     'send_tour_confirmation_email',
     'system_message',
+    'TurnContext',
+    'StageTimer',
+    'start_turn_timer',
+    'current_turn_timer',
+    'timed_stage',
+    'pipeline_stage',
 ]
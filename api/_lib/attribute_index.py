@@ -0,0 +1,109 @@
+from typing import List, Dict, Any
+import numpy as np
+
+
+def _to_float(value) -> float:
+    """Coerce a catalog numeric field to float, NaN when missing or malformed"""
+    if value is None or isinstance(value, bool):
+        return np.nan
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return np.nan
+
+
+def _label(value) -> str:
+    """Lowercased label for a categorical field that may be a string or {"name": ...}"""
+    if isinstance(value, dict):
+        value = value.get("name")
+    if value is None:
+        return ""
+    return str(value).lower()
+
+
+class _Categorical:
+    """Interned codes for a low-cardinality string column"""
+
+    def __init__(self, values: List[str]):
+        self.vocabulary: List[str] = []
+        lookup: Dict[str, int] = {}
+        codes = np.empty(len(values), dtype=np.int32)
+        for row, value in enumerate(values):
+            code = lookup.get(value)
+            if code is None:
+                code = lookup[value] = len(self.vocabulary)
+                self.vocabulary.append(value)
+            codes[row] = code
+        self.codes = codes
+
+    def contains(self, needle: str) -> np.ndarray:
+        """Mask of rows whose value contains ``needle`` (checked once per distinct value)"""
+        matching = [code for code, value in enumerate(self.vocabulary) if needle in value]
+        return np.isin(self.codes, matching)
+
+
+class AttributeIndex:
+    """Columnar side-index over the filterable property attributes.
+
+    Numeric columns are NumPy arrays so callers can fuse predicates into a single
+    boolean mask (e.g. ``index.for_sale & (index.bedrooms == 2)``). String
+    predicates run on categorical codes or on pre-lowercased text for the rows
+    that survive the numeric mask.
+    """
+
+    def __init__(self, properties: List[Dict[str, Any]]):
+        self.size = len(properties)
+        self.bedrooms = np.array([_to_float(p.get("bedroomCount")) for p in properties], dtype=np.float64)
+        self.bathrooms = np.array([_to_float(p.get("bathCount")) for p in properties], dtype=np.float64)
+        self.sales_price = np.array([_to_float(p.get("salesPrice")) for p in properties], dtype=np.float64)
+        self.monthly_rent = np.nan_to_num(
+            np.array([_to_float(p.get("monthlyRent", 0)) for p in properties], dtype=np.float64))
+        self.for_sale = np.array([bool(p.get("salesPrice")) for p in properties], dtype=bool)
+        self.lease = np.array([bool(p.get("leaseProperty")) for p in properties], dtype=bool)
+
+        self.property_type = _Categorical([_label(p.get("propertyType")) for p in properties])
+        self.city = _Categorical([_label(p.get("city")) for p in properties])
+        self.neighborhood = _Categorical([_label(p.get("neighborhood")) for p in properties])
+
+        self._address = [_label(p.get("fullAddress")) for p in properties]
+        self._text = [
+            "\x1f".join((_label(p.get("name")), _label(p.get("fullAddress")), _label(p.get("description"))))
+            for p in properties
+        ]
+
+    def __len__(self) -> int:
+        return self.size
+
+    def all(self) -> np.ndarray:
+        """Mask selecting every row"""
+        return np.ones(self.size, dtype=bool)
+
+    def equals(self, column: np.ndarray, value) -> np.ndarray:
+        """Mask of rows where a numeric column equals ``value``"""
+        value = _to_float(value)
+        if np.isnan(value):
+            return np.zeros(self.size, dtype=bool)
+        return column == value
+
+    def property_type_contains(self, text: str) -> np.ndarray:
+        """Mask of rows whose propertyType contains ``text`` (case-insensitive)"""
+        return self.property_type.contains(text.lower())
+
+    def location_rows(self, rows: np.ndarray, text: str) -> np.ndarray:
+        """Subset of ``rows`` whose fullAddress, city or neighborhood contains ``text``"""
+        needle = text.lower()
+        matched = (self.city.contains(needle) | self.neighborhood.contains(needle))[rows]
+        address = self._address
+        for i in np.flatnonzero(~matched):
+            matched[i] = needle in address[rows[i]]
+        return rows[matched]
+
+    def text_rows(self, rows: np.ndarray, text: str) -> np.ndarray:
+        """Subset of ``rows`` whose name, fullAddress or description contains ``text``"""
+        needle = text.lower()
+        haystack = self._text
+        return rows[np.fromiter((needle in haystack[row] for row in rows), dtype=bool, count=rows.size)]
+
+    def rows(self, mask: np.ndarray) -> np.ndarray:
+        """Row ids selected by a mask, in catalog order"""
+        return np.flatnonzero(mask)
@@ -0,0 +1,314 @@
+from functools import cached_property
+from typing import List, Dict, Any, Optional, Tuple
+import hashlib
+import json
+import os
+import time
+import numpy as np
+
+from .vector_store import VectorStore
+from .attribute_index import AttributeIndex
+from .lookup import CatalogLookup
+from .embedding_file import sidecar_paths, EmbeddingSidecarWriter, load_embedding_sidecar
+from .jsonstream import iter_json_records, JsonRecordWriter
+from .records import PropertyRecord, build_records
+from .projections import Projections
+from .locations import apply_location, load_locations, locations_path
+
+PARTS_MANIFEST_FORMAT = 1
+# Per-listing text and hashes only the embedding pipeline reads
+BLOB_FIELDS = ("embedding_text", "embedding_hash", "seoDescription")
+SPLIT_FIELDS = ("embedding",) + BLOB_FIELDS
+
+
+def part_paths(data_file: str) -> Tuple[str, str]:
+    """Paths of the listings and text-blob parts written next to ``data_file``"""
+    stem, _ = os.path.splitext(data_file)
+    return f"{stem}.listings.json", f"{stem}.texts.json"
+
+
+def parts_manifest_path(data_file: str) -> str:
+    """Path of the manifest tying the split parts to the ``data_file`` they were built from"""
+    stem, _ = os.path.splitext(data_file)
+    return f"{stem}.parts.json"
+
+
+def _file_sha1(path: str) -> str:
+    digest = hashlib.sha1()
+    with open(path, "rb") as file:
+        for chunk in iter(lambda: file.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def source_stamp(data_file: str) -> Optional[Dict[str, Any]]:
+    """Size, mtime and SHA-1 of ``data_file``, or None when it does not exist"""
+    try:
+        stat = os.stat(data_file)
+    except FileNotFoundError:
+        return None
+    return {"size": stat.st_size, "mtime_ns": stat.st_mtime_ns, "sha1": _file_sha1(data_file)}
+
+
+def write_parts_manifest(data_file: str) -> None:
+    """Record which ``data_file`` the parts on disk were built from"""
+    path = parts_manifest_path(data_file)
+    with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+        json.dump({"format": PARTS_MANIFEST_FORMAT, "source": source_stamp(data_file)}, file)
+    os.replace(f"{path}.tmp", path)
+
+
+def parts_are_current(data_file: str) -> bool:
+    """True when the split parts exist and were built from ``data_file`` as it is now.
+
+    Parts without a manifest, or whose manifest names a different size or
+    content, are stale. A matching size with another mtime (a fresh git
+    checkout) is settled by hashing the file. Parts shipped without their
+    ``data_file`` have nothing to be stale against and are used as they are.
+    """
+    if not os.path.exists(part_paths(data_file)[0]):
+        return False
+    try:
+        stat = os.stat(data_file)
+    except FileNotFoundError:
+        return True
+    try:
+        with open(parts_manifest_path(data_file), "r", encoding="utf-8") as file:
+            manifest = json.load(file)
+    except (FileNotFoundError, json.JSONDecodeError):
+        return False
+    source = manifest.get("source") if manifest.get("format") == PARTS_MANIFEST_FORMAT else None
+    if not source or source.get("size") != stat.st_size:
+        return False
+    return source.get("mtime_ns") == stat.st_mtime_ns or source.get("sha1") == _file_sha1(data_file)
+
+
+def catalog_version(data_file: str) -> str:
+    """Short fingerprint of the catalog files on disk (name, size and mtime of each part)"""
+    digest = hashlib.sha1()
+    for path in (data_file, *part_paths(data_file), parts_manifest_path(data_file), *sidecar_paths(data_file),
+                 locations_path(data_file)):
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            continue
+        digest.update(f"{os.path.basename(path)}:{stat.st_size}:{stat.st_mtime_ns}\n".encode("utf-8"))
+    return digest.hexdigest()[:12]
+
+
+def listing_record(prop: Dict[str, Any]) -> Dict[str, Any]:
+    return {key: value for key, value in prop.items() if key not in SPLIT_FIELDS}
+
+
+def text_blob(prop: Dict[str, Any]) -> Dict[str, Any]:
+    return {field: prop[field] for field in BLOB_FIELDS if field in prop}
+
+
+class CatalogPartsWriter:
+    """Write the listings, text-blob and embedding parts one property at a time.
+
+    ``count`` must be the number of properties that will be added (the
+    embedding sidecar is preallocated). Nothing replaces the previous parts
+    until ``close``; the listings part and then the parts manifest go last,
+    and the manifest stamps ``data_file`` as it is at that moment, so a
+    caller rewriting ``data_file`` too must have replaced it by then.
+    """
+
+    def __init__(self, data_file: str, count: int, model: Optional[str] = None):
+        self.data_file = data_file
+        listings_path, texts_path = part_paths(data_file)
+        self.embeddings = EmbeddingSidecarWriter(data_file, count, model=model)
+        self.texts = JsonRecordWriter(texts_path, keyed=True)
+        self.listings = JsonRecordWriter(listings_path)
+
+    def add(self, prop: Dict[str, Any]) -> None:
+        self.embeddings.add(prop.get("id"), prop.get("embedding"))
+        self.texts.write(text_blob(prop), key=prop.get("id"))
+        self.listings.write(listing_record(prop))
+
+    def close(self) -> None:
+        self.embeddings.close()
+        self.texts.close()
+        self.listings.close()
+        write_parts_manifest(self.data_file)
+
+    def abort(self) -> None:
+        self.embeddings.abort()
+        self.texts.abort()
+        self.listings.abort()
+
+    def __enter__(self) -> "CatalogPartsWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+
+def write_catalog_parts(data_file: str, properties: List[Dict[str, Any]], model: Optional[str] = None) -> None:
+    """Split a full catalog into listings, text blobs and the float32 embedding sidecar"""
+    with CatalogPartsWriter(data_file, len(properties), model=model) as writer:
+        for prop in properties:
+            writer.add(prop)
+
+
+def rebuild_catalog_parts(data_file: str, model: Optional[str] = None) -> int:
+    """Rebuild the split parts from ``data_file`` in two streaming passes; returns the listing count.
+
+    Without ``model`` the sidecar keeps the embedding model its previous
+    manifest recorded.
+    """
+    if model is None:
+        try:
+            with open(sidecar_paths(data_file)[1], "r", encoding="utf-8") as file:
+                model = json.load(file).get("model")
+        except (FileNotFoundError, json.JSONDecodeError):
+            pass
+    count = sum(1 for _ in iter_json_records(data_file))
+    with CatalogPartsWriter(data_file, count, model=model) as writer:
+        for prop in iter_json_records(data_file):
+            writer.add(prop)
+    return count
+
+
+class _RowBuffer:
+    """Growable float32 matrix for embeddings read one record at a time"""
+
+    def __init__(self):
+        self.matrix = np.zeros((0, 0), dtype=np.float32)
+        self.has_embedding = []
+
+    def append(self, embedding) -> None:
+        row = len(self.has_embedding)
+        if embedding and self.matrix.shape[1] == 0:
+            self.matrix = np.zeros((max(row + 1, 1024), len(embedding)), dtype=np.float32)
+        if row >= self.matrix.shape[0]:
+            grown = np.zeros((self.matrix.shape[0] * 2 or 1024, self.matrix.shape[1]), dtype=np.float32)
+            grown[:row] = self.matrix[:row]
+            self.matrix = grown
+        present = bool(embedding) and len(embedding) == self.matrix.shape[1]
+        if present:
+            self.matrix[row] = embedding
+        self.has_embedding.append(present)
+
+    def finish(self) -> Tuple[np.ndarray, np.ndarray]:
+        rows = len(self.has_embedding)
+        matrix = self.matrix[:rows].copy() if self.matrix.shape[0] != rows else self.matrix
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        matrix /= norms
+        return matrix, np.array(self.has_embedding, dtype=bool)
+
+
+class Catalog:
+    """Property catalog whose parts load on first use.
+
+    A Vercel function that only lists properties never touches the
+    embeddings, so each part (listings, indexes, vector store, text blobs) is
+    read the first time something asks for it. Without current split parts
+    on disk (missing, or built from an older ``data_file``) the full
+    ``data_file`` (a JSON array or JSON Lines) is streamed once, record by
+    record, and everything is derived from it. Listings are
+    held as compact ``PropertyRecord`` objects rather than raw JSON dicts,
+    with the precomputed location fields of the locations part merged in.
+    Their public card and detail views are built once per load; with
+    ``preserialize`` they are also kept as JSON bytes.
+    """
+
+    def __init__(self, data_file: str, preserialize: bool = False):
+        self.data_file = str(data_file)
+        self.preserialize = preserialize
+        self.listings_path, self.texts_path = part_paths(self.data_file)
+        self.version = catalog_version(self.data_file)
+        self.created_at = time.time()
+
+    def _load_json(self, path: str):
+        try:
+            with open(path, "r", encoding="utf-8") as file:
+                return json.load(file)
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise RuntimeError(f"Failed to load property data: {e}")
+
+    def _load_records(self, path: str) -> List[PropertyRecord]:
+        try:
+            return build_records(self._located(prop) for prop in iter_json_records(path))
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise RuntimeError(f"Failed to load property data: {e}")
+
+    def _located(self, prop: Dict[str, Any]) -> Dict[str, Any]:
+        """A listing dict with its precomputed location fields, when they match its address"""
+        return apply_location(prop, self.locations.get(str(prop.get("id"))))
+
+    @cached_property
+    def is_split(self) -> bool:
+        """Whether the split parts are read instead of streaming ``data_file``, decided once per catalog"""
+        return parts_are_current(self.data_file)
+
+    @cached_property
+    def _full(self) -> Dict[str, Any]:
+        """Every part, derived in one streaming pass over ``data_file``"""
+        listings, texts, embeddings = [], {}, _RowBuffer()
+        try:
+            for prop in iter_json_records(self.data_file):
+                embeddings.append(prop.get("embedding"))
+                texts[prop.get("id")] = text_blob(prop)
+                listings.append(PropertyRecord(self._located(listing_record(prop))))
+        except (FileNotFoundError, json.JSONDecodeError) as e:
+            raise RuntimeError(f"Failed to load property data: {e}")
+        matrix, has_embedding = embeddings.finish()
+        return {"listings": listings, "texts": texts, "matrix": matrix, "has_embedding": has_embedding}
+
+    @cached_property
+    def listings(self) -> List[PropertyRecord]:
+        if self.is_split:
+            return self._load_records(self.listings_path)
+        return self._full["listings"]
+
+    @cached_property
+    def locations(self) -> Dict[str, Dict[str, Any]]:
+        """Precomputed coordinates and neighborhood data by listing id (the optional locations part)"""
+        return load_locations(self.data_file)
+
+    @cached_property
+    def attribute_index(self) -> AttributeIndex:
+        return AttributeIndex(self.listings)
+
+    @cached_property
+    def lookup(self) -> CatalogLookup:
+        return CatalogLookup(self.listings)
+
+    @cached_property
+    def projections(self) -> Projections:
+        return Projections(self.listings, serialize=self.preserialize)
+
+    @cached_property
+    def vector_store(self) -> VectorStore:
+        sidecar = load_embedding_sidecar(self.data_file, self.listings) if self.is_split else None
+        if sidecar is None:
+            sidecar = self._full["matrix"], self._full["has_embedding"]
+        return VectorStore(self.listings, matrix=sidecar[0], has_embedding=sidecar[1])
+
+    @cached_property
+    def texts(self) -> Dict[str, Dict[str, Any]]:
+        if self.is_split and os.path.exists(self.texts_path):
+            return self._load_json(self.texts_path)
+        return self._full["texts"]
+
+    def warm(self) -> "Catalog":
+        """Load every part the search paths read, so a swapped-in catalog serves its first request warm"""
+        self.listings
+        self.attribute_index
+        self.lookup
+        self.projections
+        self.vector_store
+        return self
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "version": self.version,
+            "data_file": os.path.basename(self.data_file),
+            "listings": len(self.listings) if "listings" in self.__dict__ else None,
+            "created_at": self.created_at,
+        }
@@ -0,0 +1,114 @@
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import gzip
+import threading
+
+try:
+    import brotli
+except ImportError:  # pragma: no cover - brotli is optional, gzip covers every client
+    brotli = None
+
+BROTLI_AVAILABLE = brotli is not None
+# Preferred first when a client accepts both at the same quality
+ENCODINGS = ("br", "gzip") if BROTLI_AVAILABLE else ("gzip",)
+# Below about one packet the headers and CPU cost more than the bytes saved
+DEFAULT_MIN_SIZE = 1024
+GZIP_LEVEL = 6
+BROTLI_QUALITY = 5
+
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """The content coding to answer an Accept-Encoding header with, or None for identity"""
+    if not accept_encoding:
+        return None
+    qualities = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.strip().partition(";")
+        coding = coding.strip().lower()
+        quality = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0
+        qualities[coding] = quality
+
+    best, best_quality = None, 0.0
+    for coding in ENCODINGS:
+        quality = qualities.get(coding, qualities.get("*", 0.0))
+        if quality > best_quality:
+            best, best_quality = coding, quality
+    return best
+
+
+def compress(body: bytes, encoding: str) -> bytes:
+    """``body`` in the given content coding ("br" or "gzip")"""
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY, mode=brotli.MODE_TEXT)
+    if encoding == "gzip":
+        # mtime=0 keeps the output byte-identical for identical bodies
+        return gzip.compress(body, compresslevel=GZIP_LEVEL, mtime=0)
+    raise ValueError(f"Unsupported content coding: {encoding}")
+
+
+class CompressedBodyCache:
+    """Compressed copies of recently served bodies, keyed by request.
+
+    Meant for hot listing pages: the same path and query string usually
+    produces the same bytes until the catalog changes. Each entry keeps the
+    uncompressed body it was made from and is reused only while a new body
+    compares equal, so a catalog reload can never serve a stale page. The
+    comparison is a memcmp, far cheaper than compressing again.
+    """
+
+    def __init__(self, max_entries: int = 128):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple[Any, str], Tuple[bytes, bytes]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def compress(self, key, body: bytes, encoding: str) -> bytes:
+        """``compress(body, encoding)``, reusing the cached result for ``key`` when the body is unchanged"""
+        cache_key = (key, encoding)
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == body:
+                self._entries.move_to_end(cache_key)
+                self.hits += 1
+                return entry[1]
+            self.misses += 1
+        compressed = compress(body, encoding)
+        with self._lock:
+            self._entries[cache_key] = (body, compressed)
+            self._entries.move_to_end(cache_key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return compressed
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else None,
+        }
+
+
+def encode_body(body: bytes, accept_encoding: Optional[str], min_size: int = DEFAULT_MIN_SIZE,
+                cache: Optional[CompressedBodyCache] = None, cache_key=None) -> Tuple[bytes, Optional[str]]:
+    """``(body, content_coding)`` for a response: compressed when negotiated and worth it.
+
+    ``content_coding`` is None when the body goes out as is. Pass ``cache``
+    and ``cache_key`` for responses that repeat, such as listing pages.
+    """
+    if len(body) < min_size:
+        return body, None
+    encoding = negotiate_encoding(accept_encoding)
+    if encoding is None:
+        return body, None
+    if cache is not None and cache_key is not None:
+        return cache.compress(cache_key, body, encoding), encoding
+    return compress(body, encoding), encoding
@@ -1,9 +1,16 @@
 import os
-import json
 from pathlib import Path
 import logging
 import sys
 
+from .catalog import Catalog
+from .embedding_cache import QueryEmbeddingCache
+from .compression import CompressedBodyCache
+from .geocode_cache import GeocodeCache
+from .poi_index import PoiIndex
+from .poi_tiles import PoiTileCache
+from .providers import get_provider_name, create_llm, create_embeddings_model
+
 logging.basicConfig(
     level=logging.INFO,
     format="%(asctime)s - %(levelname)s - %(message)s",
@@ -11,18 +18,63 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Load property data (always needed)
+# Property data loads part by part on first access, so a function that only
+# lists properties never reads the embeddings
 data_file_path = Path(__file__).parent / "data_with_embeddings.json"
-try:
-    with open(data_file_path, "r", encoding="utf-8") as file:
-        property_metadata = json.load(file)
-except (FileNotFoundError, json.JSONDecodeError) as e:
-    raise RuntimeError(f"Failed to load property data: {e}")
+PRESERIALIZE_RESPONSES = os.getenv("PRESERIALIZE_RESPONSES", "").lower() in ("1", "true", "yes")
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "").lower() in ("1", "true", "yes")
+# Negotiated br/gzip for bodies of at least COMPRESSION_MIN_SIZE bytes; on unless disabled
+COMPRESS_RESPONSES = os.getenv("COMPRESS_RESPONSES", "true").lower() in ("1", "true", "yes")
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+compressed_body_cache = CompressedBodyCache(int(os.getenv("COMPRESSION_CACHE_SIZE", 128)))
+catalog = Catalog(str(data_file_path), preserialize=PRESERIALIZE_RESPONSES)
+CATALOG_PARTS = {
+    "property_metadata": "listings",
+    "vector_store": "vector_store",
+    "attribute_index": "attribute_index",
+    "catalog_lookup": "lookup",
+    "projections": "projections",
+}
+
+
+def __getattr__(name):
+    """Lazy load catalog parts"""
+    if name in CATALOG_PARTS:
+        return getattr(catalog, CATALOG_PARTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 # Caches
-embedding_cache = {}
 location_cache = {}
 CACHE_SIZE_LIMIT = 1000
+# Precomputed location fields older than this are refetched at request time
+LOCATION_DATA_MAX_AGE = float(os.getenv("LOCATION_DATA_MAX_AGE_DAYS", 30)) * 86400
+# Overpass answers per geohash cell, shared by every property in the cell
+poi_tile_cache = PoiTileCache(
+    precision=int(os.getenv("POI_TILE_PRECISION", 6)),
+    max_tiles=int(os.getenv("POI_TILE_CACHE_SIZE", 128)),
+    ttl=float(os.getenv("POI_TILE_TTL_HOURS", 24)) * 3600
+)
+# A pois.sqlite3 built by backend/ingest_pois.py can ship next to the data
+# file; points outside the extracts it covers still go to Overpass
+_bundled_pois = Path(__file__).parent / "pois.sqlite3"
+POI_INDEX_PATH = os.getenv("POI_INDEX_PATH") or (str(_bundled_pois) if _bundled_pois.exists() else None)
+poi_index = PoiIndex(POI_INDEX_PATH)
+# A geocodes.sqlite3 built by backend/geocode_catalog.py can ship next to the
+# data file; the deployment bundle is read-only, so it is only read there
+_bundled_geocodes = Path(__file__).parent / "geocodes.sqlite3"
+GEOCODE_CACHE_PATH = os.getenv("GEOCODE_CACHE_PATH") or (str(_bundled_geocodes) if _bundled_geocodes.exists() else None)
+geocode_cache = GeocodeCache(
+    GEOCODE_CACHE_PATH,
+    ttl=float(os.getenv("GEOCODE_CACHE_TTL_DAYS", 90)) * 86400,
+    negative_ttl=float(os.getenv("GEOCODE_NEGATIVE_TTL_HOURS", 24)) * 3600
+)
+LLM_PROVIDER = get_provider_name()
+EMBEDDINGS_MODEL = os.getenv("EMBEDDINGS_MODEL", "text-embedding-ada-002")
+embedding_cache = QueryEmbeddingCache(
+    EMBEDDINGS_MODEL if LLM_PROVIDER == "openai" else f"{LLM_PROVIDER}/{EMBEDDINGS_MODEL}",
+    max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", CACHE_SIZE_LIMIT)),
+    path=os.getenv("EMBEDDING_CACHE_PATH")
+)
 
 # Lazy-loaded instances
 _llm = None
@@ -30,15 +82,19 @@ _embeddings_model = None
 _geolocator = None
 
 
+def _require_api_key():
+    """OpenAI key for the selected provider (the fake provider needs none)"""
+    api_key = os.getenv("OPENAI_API_KEY")
+    if LLM_PROVIDER == "openai" and not api_key:
+        raise ValueError("OPENAI_API_KEY environment variable is required")
+    return api_key
+
+
 def get_llm():
     """Lazy load LLM instance"""
     global _llm
     if _llm is None:
-        from langchain_openai import ChatOpenAI
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is required")
-        _llm = ChatOpenAI(temperature=0, model_name="gpt-4o", api_key=api_key)
+        _llm = create_llm(LLM_PROVIDER, api_key=_require_api_key())
     return _llm
 
 
@@ -46,12 +102,7 @@ def get_embeddings_model():
     """Lazy load embeddings model"""
     global _embeddings_model
     if _embeddings_model is None:
-        from langchain_openai import OpenAIEmbeddings
-        api_key = os.getenv("OPENAI_API_KEY")
-        if not api_key:
-            raise ValueError("OPENAI_API_KEY environment variable is required")
-        model = os.getenv("EMBEDDINGS_MODEL", "text-embedding-ada-002")
-        _embeddings_model = OpenAIEmbeddings(model=model, api_key=api_key)
+        _embeddings_model = create_embeddings_model(LLM_PROVIDER, EMBEDDINGS_MODEL, api_key=_require_api_key())
     return _embeddings_model
 
 
@@ -0,0 +1,122 @@
+from typing import List, Dict, Any, Optional, Tuple
+import json
+import os
+import numpy as np
+
+MANIFEST_FORMAT = 1
+
+
+def sidecar_paths(data_file: str) -> Tuple[str, str]:
+    """Paths of the float32 matrix and row manifest written next to ``data_file``"""
+    stem, _ = os.path.splitext(data_file)
+    return f"{stem}.embeddings.npy", f"{stem}.embeddings.json"
+
+
+def _replace_atomically(path: str, write) -> None:
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as file:
+        write(file)
+    os.replace(tmp_path, path)
+
+
+class EmbeddingSidecarWriter:
+    """Write the float32 sidecar one property at a time for a catalog of ``count`` rows.
+
+    Rows go straight into a memory-mapped ``.npy`` file, normalized as they
+    arrive, so no list of vectors is ever held in memory. Both files replace
+    the previous sidecar only on ``close``.
+    """
+
+    def __init__(self, data_file: str, count: int, model: Optional[str] = None):
+        self.matrix_path, self.manifest_path = sidecar_paths(data_file)
+        self.count = count
+        self.model = model
+        self.ids: List[Any] = []
+        self.missing: List[Any] = []
+        self._matrix = None
+
+    def add(self, property_id, embedding) -> None:
+        row = len(self.ids)
+        self.ids.append(property_id)
+        if embedding and self._matrix is None:
+            self._matrix = np.lib.format.open_memmap(
+                f"{self.matrix_path}.tmp", mode="w+", dtype=np.float32, shape=(self.count, len(embedding)))
+        if not embedding or len(embedding) != self._matrix.shape[1]:
+            self.missing.append(property_id)
+            return
+        vector = np.asarray(embedding, dtype=np.float32)
+        norm = np.linalg.norm(vector)
+        self._matrix[row] = vector / norm if norm else vector
+
+    def close(self) -> Tuple[str, str]:
+        if len(self.ids) != self.count:
+            raise ValueError(f"Expected {self.count} embedding rows, got {len(self.ids)}")
+        if self._matrix is None:
+            empty = np.zeros((self.count, 0), dtype=np.float32)
+            _replace_atomically(self.matrix_path, lambda file: np.save(file, empty, allow_pickle=False))
+            dimension = 0
+        else:
+            dimension = self._matrix.shape[1]
+            self._matrix.flush()
+            self._matrix = None
+            os.replace(f"{self.matrix_path}.tmp", self.matrix_path)
+        manifest = {
+            "format": MANIFEST_FORMAT,
+            "model": self.model,
+            "dimension": dimension,
+            "count": self.count,
+            "ids": self.ids,
+            "missing": self.missing,
+        }
+        _replace_atomically(self.manifest_path, lambda file: file.write(json.dumps(manifest).encode("utf-8")))
+        return self.matrix_path, self.manifest_path
+
+    def abort(self) -> None:
+        """Discard the partly written matrix and leave the previous sidecar untouched"""
+        self._matrix = None
+        if os.path.exists(f"{self.matrix_path}.tmp"):
+            os.remove(f"{self.matrix_path}.tmp")
+
+
+def write_embedding_sidecar(data_file: str, properties: List[Dict[str, Any]], model: Optional[str] = None) -> Tuple[str, str]:
+    """Write the catalog embeddings as an L2-normalized float32 ``.npy`` matrix plus a row manifest.
+
+    Row ``i`` of the matrix belongs to ``manifest["ids"][i]``. Properties without
+    an embedding keep a zero row and are listed under ``missing``.
+    """
+    writer = EmbeddingSidecarWriter(data_file, len(properties), model=model)
+    for prop in properties:
+        writer.add(prop.get("id"), prop.get("embedding"))
+    return writer.close()
+
+
+def load_embedding_sidecar(data_file: str, properties: List[Dict[str, Any]]) -> Optional[Tuple[np.ndarray, np.ndarray]]:
+    """Memory-map the sidecar for ``data_file`` as ``(matrix, has_embedding)`` aligned to ``properties``.
+
+    Returns None when there is no sidecar or it does not cover the catalog, so
+    callers can fall back to the embeddings in the JSON file. When the row
+    order matches the catalog the matrix stays a read-only memory map shared
+    through the page cache; otherwise the rows are gathered into memory.
+    """
+    matrix_path, manifest_path = sidecar_paths(data_file)
+    if not (os.path.exists(matrix_path) and os.path.exists(manifest_path)):
+        return None
+    with open(manifest_path, "r", encoding="utf-8") as file:
+        manifest = json.load(file)
+    if manifest.get("format") != MANIFEST_FORMAT:
+        return None
+
+    matrix = np.load(matrix_path, mmap_mode="r", allow_pickle=False)
+    if matrix.dtype != np.float32 or matrix.shape != (manifest["count"], manifest["dimension"]):
+        return None
+
+    ids = [prop.get("id") for prop in properties]
+    if ids != manifest["ids"]:
+        row_of = {property_id: row for row, property_id in enumerate(manifest["ids"])}
+        if len(row_of) != len(manifest["ids"]) or any(property_id not in row_of for property_id in ids):
+            return None
+        matrix = np.ascontiguousarray(matrix[[row_of[property_id] for property_id in ids]])
+
+    missing = set(manifest["missing"])
+    has_embedding = np.fromiter((property_id not in missing for property_id in ids), dtype=bool, count=len(ids))
+    return matrix, has_embedding
@@ -0,0 +1,33 @@
+from collections.abc import Mapping
+import json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is in the requirements, json is the fallback
+    orjson = None
+
+FAST_JSON_AVAILABLE = orjson is not None
+
+
+def _default(value):
+    """Values orjson has no native encoding for: catalog records and NumPy scalars"""
+    if isinstance(value, Mapping):
+        return dict(value)
+    if hasattr(value, "item"):
+        return value.item()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def dumps(data) -> bytes:
+    """Compact UTF-8 JSON, with orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(data, default=_default, option=orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, ensure_ascii=False, allow_nan=False, separators=(",", ":"),
+                      default=_default).encode("utf-8")
+
+
+def response_body(data, fast: bool = False) -> bytes:
+    """Body of a JSON response: ``dumps`` on the fast path, else the stdlib encoding used so far"""
+    if fast:
+        return dumps(data)
+    return json.dumps(data).encode()
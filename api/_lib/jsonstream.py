@@ -0,0 +1,146 @@
+from typing import Dict, Any, Iterator, Optional
+import json
+import os
+
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+CHUNK_SIZE = 1 << 20
+WHITESPACE = " \t\r\n"
+
+
+def is_json_lines(path: str) -> bool:
+    return os.path.splitext(path)[1].lower() in JSON_LINES_EXTENSIONS
+
+
+def _iter_json_lines(file) -> Iterator[Dict[str, Any]]:
+    for line in file:
+        if line.strip():
+            yield json.loads(line)
+
+
+def _iter_json_array(file, buffer: str) -> Iterator[Dict[str, Any]]:
+    """Decode the elements of a top-level JSON array one at a time from a chunked read"""
+    decoder = json.JSONDecoder()
+    pos = buffer.index("[") + 1
+    chunk_size = CHUNK_SIZE
+    expect_value = True
+    while True:
+        while pos < len(buffer) and buffer[pos] in WHITESPACE:
+            pos += 1
+        if pos == len(buffer):
+            more = file.read(chunk_size)
+            if not more:
+                raise json.JSONDecodeError("Unterminated array", buffer, pos)
+            buffer, pos = more, 0
+            continue
+
+        if buffer[pos] == "]":
+            return
+        if not expect_value:
+            if buffer[pos] != ",":
+                raise json.JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            pos += 1
+            expect_value = True
+            continue
+
+        try:
+            record, end = decoder.raw_decode(buffer, pos)
+        except json.JSONDecodeError:
+            # The element runs past the buffered text; read more (in growing
+            # chunks, so one huge element is not re-parsed too often)
+            more = file.read(chunk_size)
+            if not more:
+                raise
+            buffer = buffer[pos:] + more
+            pos = 0
+            chunk_size *= 2
+            continue
+        yield record
+        pos = end
+        expect_value = False
+        chunk_size = CHUNK_SIZE
+        if pos > CHUNK_SIZE:
+            buffer, pos = buffer[pos:], 0
+
+
+def iter_json_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Yield the records of a catalog file one at a time.
+
+    Accepts JSON Lines (one record per line) and a top-level JSON array, which
+    is parsed incrementally, so only one record is held in memory at a time
+    whichever format the file uses.
+    """
+    with open(path, "r", encoding="utf-8") as file:
+        if is_json_lines(path):
+            yield from _iter_json_lines(file)
+            return
+        head = file.read(CHUNK_SIZE)
+        start = head.lstrip(WHITESPACE + "\ufeff")[:1]
+        if start == "[":
+            yield from _iter_json_array(file, head)
+        elif start == "{":
+            yield from _iter_json_lines(_chain_lines(head, file))
+        elif start:
+            raise json.JSONDecodeError("Expecting a JSON array or JSON Lines", head, 0)
+
+
+def _chain_lines(head: str, file) -> Iterator[str]:
+    """Lines of ``file`` when ``head`` has already been read from it"""
+    lines = head.splitlines(keepends=True)
+    if lines and not lines[-1].endswith("\n"):
+        lines[-1] += file.readline()
+    yield from lines
+    yield from file
+
+
+class JsonRecordWriter:
+    """Write records one at a time, replacing ``path`` atomically on a clean close.
+
+    Paths ending in ``.jsonl`` / ``.ndjson`` get JSON Lines; anything else gets
+    a JSON array with one record per line. With ``keyed=True`` the output is a
+    JSON object and records are written with ``write(value, key=...)``.
+    """
+
+    def __init__(self, path: str, keyed: bool = False):
+        self.path = path
+        self.keyed = keyed
+        self.lines = is_json_lines(path) and not keyed
+        self.count = 0
+        self._tmp_path = f"{path}.tmp"
+        self._file = open(self._tmp_path, "w", encoding="utf-8")
+        if not self.lines:
+            self._file.write("{" if keyed else "[")
+
+    def write(self, record, key: Optional[str] = None) -> None:
+        encoded = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+        if self.lines:
+            self._file.write(encoded + "\n")
+        else:
+            if self.keyed:
+                if not isinstance(key, str):
+                    key = json.dumps(key)  # same key coercion as json.dump
+                encoded = f"{json.dumps(key, ensure_ascii=False)}:{encoded}"
+            self._file.write(("\n" if self.count == 0 else ",\n") + encoded)
+        self.count += 1
+
+    def close(self) -> None:
+        if self._file.closed:
+            return
+        if not self.lines:
+            self._file.write("\n}" if self.keyed else "\n]")
+        self._file.close()
+        os.replace(self._tmp_path, self.path)
+
+    def abort(self) -> None:
+        """Discard what was written and leave ``path`` untouched"""
+        self._file.close()
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+
+    def __enter__(self) -> "JsonRecordWriter":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
@@ -1,9 +1,14 @@
 from typing import List, Dict, Any, Optional, Tuple
-import geopy.distance
 import requests
 import os
 
-from .config import property_metadata, location_cache, get_geolocator, logger
+from .config import (
+    catalog, property_metadata, location_cache, geocode_cache, poi_index, poi_tile_cache, get_geolocator, logger, LOCATION_DATA_MAX_AGE
+)
+from .turn import TurnContext
+from .timing import pipeline_stage
+from .locations import location_is_fresh
+from .neighborhood import NEIGHBORHOOD_RADIUS, Place, neighborhood_query, parse_places, select_schools, select_pois, select_attractions
 
 OVERPASS_URL = os.getenv("OVERPASS_URL", "http://overpass-api.de/api/interpreter")
 
@@ -35,271 +40,103 @@ def get_available_locations() -> List[str]:
     return sorted([loc for loc in locations if loc and len(loc) > 2 and loc != "None"])
 
 
-def get_coordinates_from_address(address: str) -> Optional[Tuple[float, float]]:
+@pipeline_stage("geocoding")
+def get_coordinates_from_address(address: str, turn: Optional[TurnContext] = None) -> Optional[Tuple[float, float]]:
     """Get latitude and longitude from an address using geocoding"""
-    try:
-        geolocator = get_geolocator()
-        location = geolocator.geocode(address, timeout=10)
-        if location:
-            return (location.latitude, location.longitude)
-        return None
-    except Exception as e:
-        logger.error(f"Geocoding error for {address}: {str(e)}")
-        return None
-
-
+    if turn is not None and address in turn.coordinates:
+        return turn.coordinates[address]
+    found, coords = geocode_cache.lookup(address)
+    if not found:
+        try:
+            geolocator = get_geolocator()
+            location = geolocator.geocode(address, timeout=10)
+        except Exception as e:
+            # Not cached: a timeout or rate limit says nothing about the address
+            logger.error(f"Geocoding error for {address}: {str(e)}")
+            return None
+        coords = geocode_cache.put(address, (location.latitude, location.longitude) if location else None)
+    if turn is not None:
+        turn.coordinates[address] = coords
+    return coords
+
+
+def fetch_neighborhood(property_coords: Tuple[float, float]) -> List[Place]:
+    """Every school, attraction and POI around a point.
+
+    The answer comes from the point's geohash cell in ``poi_tile_cache``,
+    loaded once per cell for a circle that covers NEIGHBORHOOD_RADIUS from
+    anywhere inside it, so nearby properties share it. A cell inside the
+    offline ``poi_index`` is read from its R-tree; any other is fetched
+    from Overpass. Callers apply their own radius and filters locally.
+    Errors are raised, not swallowed.
+    """
+    tile = poi_tile_cache.tile(property_coords)
+    places = poi_tile_cache.get(tile)
+    if places is None:
+        lat, lng, radius = poi_tile_cache.covering_circle(tile, NEIGHBORHOOD_RADIUS)
+        if poi_index.covers((lat, lng), radius):
+            places = poi_tile_cache.put(tile, poi_index.places_within((lat, lng), radius))
+        else:
+            response = requests.post(OVERPASS_URL, data=neighborhood_query(lat, lng, radius), timeout=15)
+            response.raise_for_status()
+            places = poi_tile_cache.put(tile, parse_places(response.json()))
+    return places
+
+
+@pipeline_stage("enrichment")
 def find_nearby_schools(property_coords: Tuple[float, float], property_address: str) -> List[Dict[str, Any]]:
     """Find nearby schools using Overpass API (OpenStreetMap data)"""
     try:
-        lat, lng = property_coords
-        overpass_url = OVERPASS_URL
-        radius = 3000
-        query = f"""
-        [out:json][timeout:25];
-        (
-          node["amenity"="school"](around:{radius},{lat},{lng});
-          way["amenity"="school"](around:{radius},{lat},{lng});
-          relation["amenity"="school"](around:{radius},{lat},{lng});
-        );
-        out center tags;
-        """
-
-        response = requests.post(overpass_url, data=query, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-
-        schools = []
-        for element in data.get('elements', []):
-            if element['type'] == 'node':
-                school_lat, school_lng = element['lat'], element['lon']
-            elif 'center' in element:
-                school_lat, school_lng = element['center']['lat'], element['center']['lon']
-            else:
-                continue
-
-            distance_km = geopy.distance.distance((lat, lng), (school_lat, school_lng)).kilometers
-            distance_miles = distance_km * 0.621371
-            tags = element.get('tags', {})
-            name = tags.get('name', 'Unnamed School')
-            school_type = "School"
-
-            if 'school:type' in tags:
-                school_type = tags['school:type'].title() + " School"
-            elif 'isced:level' in tags:
-                level = tags['isced:level']
-                if '0' in level or '1' in level:
-                    school_type = "Elementary School"
-                elif '2' in level:
-                    school_type = "Middle School"
-                elif '3' in level:
-                    school_type = "High School"
-
-            if distance_miles > 5:
-                continue
-
-            schools.append({
-                "name": name,
-                "type": school_type,
-                "distance": round(distance_miles, 2),
-                "rating": None,
-                "description": f"{school_type} in the area"
-            })
-
-        schools.sort(key=lambda x: x['distance'])
-        return schools[:5]
-
+        places = fetch_neighborhood(property_coords)
+        return select_schools(places, property_coords)
     except Exception as e:
         logger.error(f"Error finding nearby schools: {str(e)}")
         return []
 
 
+@pipeline_stage("enrichment")
 def find_nearby_pois(property_coords: Tuple[float, float], property_address: str, poi_type: str = "all") -> List[Dict[str, Any]]:
     """Find nearby POIs of specific type using Overpass API (OpenStreetMap data)"""
     try:
-        lat, lng = property_coords
-        overpass_url = OVERPASS_URL
-        poi_queries = {
-            "hospitals": 'node["amenity"="hospital"]',
-            "schools": 'node["amenity"="school"]',
-            "parks": 'node["leisure"="park"]',
-            "restaurants": 'node["amenity"~"^(restaurant|cafe|fast_food)$"]',
-            "shopping": 'node["shop"]',
-            "banks": 'node["amenity"="bank"]',
-            "pharmacies": 'node["amenity"="pharmacy"]',
-            "gas_stations": 'node["amenity"="fuel"]',
-            "attractions": 'node["tourism"~"^(attraction|museum|gallery)$"]; node["amenity"~"^(restaurant|cafe|hospital|pharmacy|bank|shopping|supermarket)$"]; node["leisure"~"^(park|playground|sports_centre|swimming_pool)$"]',
-            "all": 'node["amenity"~"^(restaurant|cafe|hospital|pharmacy|bank|shopping|supermarket|school)$"]; node["leisure"~"^(park|playground|sports_centre|swimming_pool)$"]; node["shop"~"^(supermarket|mall)$"]; node["tourism"~"^(attraction|museum|gallery)$"]'
-        }
-        poi_query = poi_queries.get(poi_type.lower(), poi_queries["all"])
-        radius = 3000
-        query = f"""
-        [out:json][timeout:25];
-        (
-          {poi_query}(around:{radius},{lat},{lng});
-        );
-        out center tags;
-        """
-
-        response = requests.post(overpass_url, data=query, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-
-        pois = []
-        for element in data.get('elements', []):
-            if element['type'] == 'node':
-                poi_lat, poi_lng = element['lat'], element['lon']
-            elif 'center' in element:
-                poi_lat, poi_lng = element['center']['lat'], element['center']['lon']
-            else:
-                continue
-
-            distance_km = geopy.distance.distance((lat, lng), (poi_lat, poi_lng)).kilometers
-            distance_miles = distance_km * 0.621371
-            tags = element.get('tags', {})
-            name = tags.get('name', 'Unnamed Location')
-            poi_category = "Point of Interest"
-            description = "Location in the area"
-
-            if 'amenity' in tags:
-                amenity = tags['amenity']
-                if amenity == 'hospital':
-                    poi_category = "Hospital"
-                    description = "Medical facility"
-                elif amenity == 'school':
-                    poi_category = "School"
-                    description = "Educational institution"
-                elif amenity in ['restaurant', 'cafe', 'fast_food']:
-                    poi_category = "Restaurant/Dining"
-                    description = "Dining establishment"
-                elif amenity == 'pharmacy':
-                    poi_category = "Pharmacy"
-                    description = "Pharmacy/Drugstore"
-                elif amenity == 'bank':
-                    poi_category = "Bank"
-                    description = "Banking services"
-                elif amenity == 'fuel':
-                    poi_category = "Gas Station"
-                    description = "Fuel station"
-                elif amenity == 'park':
-                    poi_category = "Park"
-                    description = "Public park"
-            elif 'leisure' in tags:
-                leisure = tags['leisure']
-                if leisure in ['park', 'playground', 'garden']:
-                    poi_category = "Park/Recreation"
-                    description = "Recreational area"
-                elif leisure in ['sports_centre', 'swimming_pool']:
-                    poi_category = "Sports/Fitness"
-                    description = "Sports facility"
-            elif 'shop' in tags:
-                poi_category = "Shopping"
-                description = "Retail establishment"
-            elif 'tourism' in tags:
-                poi_category = "Tourism/Culture"
-                description = "Tourist attraction"
-
-            if distance_miles > 5:
-                continue
-
-            pois.append({
-                "name": name,
-                "type": poi_category,
-                "distance": round(distance_miles, 2),
-                "description": description
-            })
-
-        pois.sort(key=lambda x: x['distance'])
-        return pois[:10]
-
+        places = fetch_neighborhood(property_coords)
+        return select_pois(places, property_coords, poi_type)
     except Exception as e:
         logger.error(f"Error finding nearby POIs: {str(e)}")
         return []
 
 
+@pipeline_stage("enrichment")
 def find_nearby_attractions(property_coords: Tuple[float, float], property_address: str) -> List[Dict[str, Any]]:
     """Find nearby attractions and amenities using Overpass API (OpenStreetMap data)"""
     try:
-        lat, lng = property_coords
-        overpass_url = OVERPASS_URL
-        radius = 2000
-        query = f"""
-        [out:json][timeout:25];
-        (
-          node["amenity"~"^(restaurant|cafe|hospital|pharmacy|bank|shopping|supermarket|park)$"](around:{radius},{lat},{lng});
-          node["leisure"~"^(park|playground|sports_centre|swimming_pool)$"](around:{radius},{lat},{lng});
-          node["shop"~"^(supermarket|mall|shopping_centre)$"](around:{radius},{lat},{lng});
-          node["tourism"~"^(attraction|museum|gallery)$"](around:{radius},{lat},{lng});
-          way["amenity"~"^(restaurant|cafe|hospital|pharmacy|bank|shopping|supermarket)$"](around:{radius},{lat},{lng});
-          way["leisure"~"^(park|playground|sports_centre|swimming_pool)$"](around:{radius},{lat},{lng});
-        );
-        out center tags;
-        """
-
-        response = requests.post(overpass_url, data=query, timeout=15)
-        response.raise_for_status()
-        data = response.json()
-
-        attractions = []
-        for element in data.get('elements', []):
-            if element['type'] == 'node':
-                attr_lat, attr_lng = element['lat'], element['lon']
-            elif 'center' in element:
-                attr_lat, attr_lng = element['center']['lat'], element['center']['lon']
-            else:
-                continue
-
-            distance_km = geopy.distance.distance((lat, lng), (attr_lat, attr_lng)).kilometers
-            distance_miles = distance_km * 0.621371
-            tags = element.get('tags', {})
-            name = tags.get('name', 'Unnamed Location')
-            attr_type = "Point of Interest"
-
-            if 'amenity' in tags:
-                amenity = tags['amenity']
-                if amenity in ['restaurant', 'cafe']:
-                    attr_type = "Restaurant/Dining"
-                elif amenity in ['hospital', 'pharmacy']:
-                    attr_type = "Healthcare"
-                elif amenity in ['bank']:
-                    attr_type = "Banking"
-                elif amenity in ['supermarket', 'shopping']:
-                    attr_type = "Shopping"
-            elif 'leisure' in tags:
-                leisure = tags['leisure']
-                if leisure in ['park', 'playground']:
-                    attr_type = "Park/Recreation"
-                elif leisure in ['sports_centre', 'swimming_pool']:
-                    attr_type = "Sports/Fitness"
-            elif 'shop' in tags:
-                attr_type = "Shopping"
-            elif 'tourism' in tags:
-                attr_type = "Tourism/Culture"
-
-            if distance_miles > 3:
-                continue
-
-            attractions.append({
-                "name": name,
-                "type": attr_type,
-                "distance": round(distance_miles, 2),
-                "description": f"{attr_type} in the area"
-            })
-
-        attractions.sort(key=lambda x: x['distance'])
-        return attractions[:8]
-
+        places = fetch_neighborhood(property_coords)
+        return select_attractions(places, property_coords)
     except Exception as e:
         logger.error(f"Error finding nearby attractions: {str(e)}")
         return []
 
 
-def enhance_property_with_location_data(property_data: Dict[str, Any]) -> Dict[str, Any]:
+def has_fresh_location(prop: Dict[str, Any]) -> bool:
+    """True when the catalog listing behind ``prop`` carries fresh precomputed location fields.
+
+    The freshness timestamp is kept off the public projections, so a detail
+    or search result is resolved to its catalog record by id.
+    """
+    record = catalog.lookup.get(prop.get("id"))
+    return record is not None and location_is_fresh(record, LOCATION_DATA_MAX_AGE)
+
+
+def enhance_property_with_location_data(property_data: Dict[str, Any], turn: Optional[TurnContext] = None) -> Dict[str, Any]:
     """Enhance property data with nearby schools and attractions"""
     try:
         address = property_data.get("fullAddress", "")
         if not address:
             return property_data
 
+        # Filled in offline by enrich_locations.py; only new or stale listings go to the network
+        if has_fresh_location(property_data):
+            return property_data
+
         address_hash = hash(address)
         if address_hash in location_cache:
             cached_data = location_cache[address_hash]
@@ -307,21 +144,19 @@ def enhance_property_with_location_data(property_data: Dict[str, Any]) -> Dict[s
             enhanced_property.update(cached_data)
             return enhanced_property
 
-        coords = get_coordinates_from_address(address)
+        coords = get_coordinates_from_address(address, turn)
         if not coords:
             return property_data
 
         schools = []
         attractions = []
         try:
-            schools = find_nearby_schools(coords, address)
-        except Exception as e:
-            logger.warning(f"Failed to fetch schools for {address}: {str(e)}")
-
-        try:
-            attractions = find_nearby_attractions(coords, address)
+            # One Overpass round trip answers both lists
+            places = fetch_neighborhood(coords)
+            schools = select_schools(places, coords)
+            attractions = select_attractions(places, coords)
         except Exception as e:
-            logger.warning(f"Failed to fetch attractions for {address}: {str(e)}")
+            logger.warning(f"Failed to fetch neighborhood for {address}: {str(e)}")
 
         location_data = {
             "coordinates": {"lat": coords[0], "lng": coords[1]},
@@ -0,0 +1,60 @@
+from collections.abc import Mapping
+from typing import Dict, Any, Optional, Tuple
+import json
+import os
+import time
+
+from .geocode_cache import normalize_address
+from .projections import LOCATION_FIELDS
+
+# When a listing's precomputed location fields were fetched (epoch seconds);
+# kept on the catalog record only, never in public projections
+UPDATED_FIELD = "location_updated_at"
+
+
+def locations_path(data_file: str) -> str:
+    """Path of the precomputed location part written next to ``data_file``"""
+    stem, _ = os.path.splitext(data_file)
+    return f"{stem}.locations.json"
+
+
+def location_entry(address: str, location_data: Dict[str, Any], updated_at: Optional[float] = None) -> Dict[str, Any]:
+    """One listing's entry in the location part, tied to the address it was computed for"""
+    entry = {"address": normalize_address(address)}
+    entry.update({key: location_data[key] for key in LOCATION_FIELDS if key in location_data})
+    entry["updated_at"] = time.time() if updated_at is None else updated_at
+    return entry
+
+
+def load_locations(data_file: str) -> Dict[str, Dict[str, Any]]:
+    """Location entries by listing id, or an empty dict when the part was never built"""
+    path = locations_path(data_file)
+    try:
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+    except FileNotFoundError:
+        return {}
+    except json.JSONDecodeError as e:
+        raise RuntimeError(f"Failed to load location data: {e}")
+
+
+def apply_location(prop: Dict[str, Any], entry: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Copy an entry's location fields into a listing dict, unless its address has changed since"""
+    if entry and entry.get("address") == normalize_address(prop.get("fullAddress") or ""):
+        prop.update({key: entry[key] for key in LOCATION_FIELDS if key in entry})
+        prop[UPDATED_FIELD] = entry.get("updated_at")
+    return prop
+
+
+def location_is_fresh(prop, max_age: float) -> bool:
+    """True when a listing carries precomputed location fields younger than ``max_age`` seconds"""
+    updated_at = prop.get(UPDATED_FIELD)
+    return updated_at is not None and time.time() - updated_at < max_age
+
+
+def precomputed_coordinates(prop) -> Optional[Tuple[float, float]]:
+    """``(lat, lng)`` from a listing's ``coordinates`` field, if it has one"""
+    coords = prop.get("coordinates")
+    if isinstance(coords, Mapping) and coords.get("lat") is not None and coords.get("lng") is not None:
+        return coords["lat"], coords["lng"]
+    return None
@@ -4,8 +4,10 @@ import json
 from langchain_core.output_parsers import JsonOutputParser
 
 from .config import get_llm, logger
+from .timing import pipeline_stage
 
 
+@pipeline_stage("extract_filters")
 def extract_parsed_filters(message: str, history: List[Dict[str, str]]) -> Optional[Dict[str, Any]]:
     """Extract parsed filters for frontend filter updates"""
     recent_context = ""
@@ -60,6 +62,7 @@ def extract_parsed_filters(message: str, history: List[Dict[str, str]]) -> Optio
         return None
 
 
+@pipeline_stage("extract_preferences")
 def extract_user_preferences(message: str, history: List[Dict[str, str]], conversation_state: Dict[str, Any]) -> Dict[str, Any]:
     """Extract and update user preferences from current message and conversation history"""
     recent_context = ""
@@ -115,6 +118,7 @@ def extract_user_preferences(message: str, history: List[Dict[str, str]], conver
         return {}
 
 
+@pipeline_stage("response_generation")
 def generate_smart_clarification(message: str, conversation_state: Dict[str, Any]) -> str:
     """Generate contextual clarification questions with location suggestions"""
     from .location import get_available_locations
@@ -175,6 +179,7 @@ def generate_smart_clarification(message: str, conversation_state: Dict[str, Any
         return "I'd be happy to help you find properties! Could you tell me a bit more about what you're looking for?"
 
 
+@pipeline_stage("extract_filters")
 def validate_search_criteria(query: str) -> Dict[str, Any]:
     """Validate if the query contains sufficient search criteria"""
 
@@ -222,6 +227,7 @@ def validate_search_criteria(query: str) -> Dict[str, Any]:
         return {"is_sufficient": False, "missing_criteria": ["transaction_type", "location", "bedrooms", "price"]}
 
 
+@pipeline_stage("intent")
 def detect_unified_intent(context, query: str) -> Dict[str, Any]:
     """Detect intent with unified categories and extract relevant information"""
 
@@ -302,6 +308,7 @@ def detect_unified_intent(context, query: str) -> Dict[str, Any]:
         return {"intent": "CONVERSATIONAL_QUERY", "transaction_type": "unknown", "property_name": ""}
 
 
+@pipeline_stage("response_generation")
 def get_gpt_response(query: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Generate a conversational response about property search results"""
 
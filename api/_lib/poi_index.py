@@ -0,0 +1,145 @@
+from typing import Dict, Any, Iterable, List, Optional, Tuple
+import json
+import math
+import os
+import sqlite3
+import threading
+
+from .poi_tiles import EARTH_RADIUS_M
+
+# (south, west, north, east) of an area the extract holds every POI of
+Box = Tuple[float, float, float, float]
+# (element type, lat, lng, tags), the places the neighborhood selectors read
+Place = Tuple[str, float, float, Dict[str, str]]
+
+_SCHEMA = (
+    "CREATE TABLE places (id INTEGER PRIMARY KEY, kind TEXT NOT NULL, lat REAL NOT NULL, lng REAL NOT NULL, tags TEXT NOT NULL)",
+    "CREATE VIRTUAL TABLE places_rtree USING rtree(id, min_lat, max_lat, min_lng, max_lng)",
+    "CREATE TABLE coverage (south REAL NOT NULL, west REAL NOT NULL, north REAL NOT NULL, east REAL NOT NULL)",
+)
+
+
+def radius_box(coords: Tuple[float, float], radius: float) -> Box:
+    """Bounding box of the circle of ``radius`` meters around a point"""
+    lat_delta = math.degrees(radius / EARTH_RADIUS_M)
+    lng_delta = math.degrees(radius / (EARTH_RADIUS_M * max(math.cos(math.radians(coords[0])), 1e-6)))
+    return coords[0] - lat_delta, coords[1] - lng_delta, coords[0] + lat_delta, coords[1] + lng_delta
+
+
+class PoiIndexWriter:
+    """Builds a POI index file: places, their R-tree and the covered areas.
+
+    Everything is written to ``{path}.tmp`` and moved over ``path`` on a
+    clean exit, so readers never see a half-built index.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self._tmp_path = f"{path}.tmp"
+        self.count = 0
+        self.coverage: List[Box] = []
+
+    def __enter__(self) -> "PoiIndexWriter":
+        if os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+        self._db = sqlite3.connect(self._tmp_path)
+        for statement in _SCHEMA:
+            self._db.execute(statement)
+        return self
+
+    def add(self, places: Iterable[Place]) -> int:
+        """Store places; returns how many were added"""
+        added = 0
+        for kind, lat, lng, tags in places:
+            self.count += 1
+            added += 1
+            self._db.execute("INSERT INTO places (id, kind, lat, lng, tags) VALUES (?, ?, ?, ?, ?)",
+                             (self.count, kind, lat, lng, json.dumps(tags, ensure_ascii=False)))
+            self._db.execute("INSERT INTO places_rtree VALUES (?, ?, ?, ?, ?)", (self.count, lat, lat, lng, lng))
+        return added
+
+    def add_coverage(self, box: Box):
+        """Record an area whose POIs are all in the index"""
+        self.coverage.append(box)
+        self._db.execute("INSERT INTO coverage (south, west, north, east) VALUES (?, ?, ?, ?)", box)
+
+    def __exit__(self, exc_type, exc, tb):
+        if exc_type is None:
+            self._db.commit()
+            self._db.execute("VACUUM")
+        self._db.close()
+        if exc_type is None:
+            os.replace(self._tmp_path, self.path)
+        elif os.path.exists(self._tmp_path):
+            os.remove(self._tmp_path)
+        return False
+
+
+class PoiIndex:
+    """Offline POIs from an OpenStreetMap extract, queried by radius.
+
+    Reads a SQLite file built by backend/ingest_pois.py: the places the
+    neighborhood query selects, an R-tree over their coordinates and the
+    boxes the extracts cover. A search circle is answered locally only when
+    it lies wholly inside one covered box, so a result is never cut off at
+    the edge of an extract; anything else goes to Overpass. The file is
+    opened read-only; without one the index covers nothing.
+    """
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path
+        self.local = 0
+        self.remote = 0
+        self.coverage: List[Box] = []
+        self._count = 0
+        self._lock = threading.Lock()
+        self._db = None
+        if path and os.path.exists(path):
+            self._db = self._connect(path)
+
+    def _connect(self, path: str):
+        try:
+            db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+            self.coverage = [tuple(row) for row in db.execute("SELECT south, west, north, east FROM coverage")]
+            self._count = db.execute("SELECT COUNT(*) FROM places").fetchone()[0]
+            return db
+        except sqlite3.Error:
+            self.coverage = []
+            return None
+
+    def __len__(self) -> int:
+        return self._count
+
+    def covers(self, coords: Tuple[float, float], radius: float) -> bool:
+        """True when every place within ``radius`` meters of the point is in the index"""
+        if self._db is None:
+            return False
+        south, west, north, east = radius_box(coords, radius)
+        covered = any(box[0] <= south and box[1] <= west and north <= box[2] and east <= box[3]
+                      for box in self.coverage)
+        with self._lock:
+            if covered:
+                self.local += 1
+            else:
+                self.remote += 1
+        return covered
+
+    def places_within(self, coords: Tuple[float, float], radius: float) -> List[Place]:
+        """Places in the bounding box of the search circle; callers filter by exact distance"""
+        south, west, north, east = radius_box(coords, radius)
+        with self._lock:
+            rows = self._db.execute(
+                "SELECT p.kind, p.lat, p.lng, p.tags FROM places_rtree r JOIN places p ON p.id = r.id "
+                "WHERE r.min_lat >= ? AND r.max_lat <= ? AND r.min_lng >= ? AND r.max_lng <= ? ORDER BY p.id",
+                (south, north, west, east)).fetchall()
+        return [(kind, lat, lng, json.loads(tags)) for kind, lat, lng, tags in rows]
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.local + self.remote
+        return {
+            "places": self._count,
+            "coverage_boxes": len(self.coverage),
+            "local": self.local,
+            "remote": self.remote,
+            "local_rate": round(self.local / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,145 @@
+from collections.abc import Mapping
+from typing import Dict, Any, Iterator, List
+import sys
+
+# Listing fields held in slots, in the order records iterate them. Any other
+# field lands in the per-record ``extra`` dict.
+FIELDS = (
+    "id", "name", "description", "salesPrice", "leasePrice", "monthlyRent", "leaseProperty",
+    "fullAddress", "addressCity", "city", "neighborhood", "bedroomCount", "bathCount",
+    "propertyType", "squareFeet", "livingSpaceSize", "amenities", "nearby_schools", "slug",
+    "media", "embedding_model",
+)
+NUMERIC_FIELDS = frozenset((
+    "salesPrice", "leasePrice", "monthlyRent", "bedroomCount", "bathCount", "squareFeet", "livingSpaceSize",
+))
+CATEGORICAL_FIELDS = frozenset((
+    "addressCity", "city", "neighborhood", "propertyType", "embedding_model",
+))
+
+# Nested strings up to this length (school names, amenity tags) are interned;
+# longer ones (image URLs, descriptions) are mostly unique
+INTERN_MAX_LENGTH = 40
+
+_MISSING = object()
+
+
+def _number(value):
+    """Numeric value of a field that may arrive as a string; other values are kept as-is"""
+    if not isinstance(value, str):
+        return value
+    text = value.strip().replace(",", "")
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return value
+
+
+def _intern(value):
+    if isinstance(value, str):
+        return sys.intern(value)
+    if isinstance(value, dict) and isinstance(value.get("name"), str):
+        return {**value, "name": sys.intern(value["name"])}
+    return value
+
+
+def _compact(value):
+    """Nested lists become tuples, dict keys and short strings are interned"""
+    if isinstance(value, list):
+        return tuple(_compact(item) for item in value)
+    if isinstance(value, dict):
+        return {sys.intern(key): _compact(item) for key, item in value.items()}
+    if isinstance(value, str) and len(value) <= INTERN_MAX_LENGTH:
+        return sys.intern(value)
+    return value
+
+
+def _normalize(key: str, value):
+    if key in NUMERIC_FIELDS:
+        return _number(value)
+    if key in CATEGORICAL_FIELDS:
+        return _intern(value)
+    if isinstance(value, (list, dict)):
+        return _compact(value)
+    return value
+
+
+class PropertyRecord(Mapping):
+    """Read-only listing with its fields in slots instead of a per-record dict.
+
+    Numeric fields are coerced once when the record is built (``"1200"``
+    becomes ``1200``) and categorical strings are interned, so a catalog of
+    listings shares one copy of each city, neighborhood and property type.
+    Nested values (amenities, media, schools) are stored as tuples of dicts
+    with interned keys.
+
+    Records behave like the dicts they replace (``get``, ``items``, ``in``);
+    use ``dict(record)`` where a real dict is needed, e.g. for ``json.dumps``.
+    """
+
+    __slots__ = FIELDS + ("extra",)
+
+    def __init__(self, data: Dict[str, Any]):
+        extra = None
+        for key in FIELDS:
+            object.__setattr__(self, key, _MISSING)
+        for key, value in data.items():
+            value = _normalize(key, value)
+            if key in _SLOT_NAMES:
+                object.__setattr__(self, key, value)
+            else:
+                if extra is None:
+                    extra = {}
+                extra[sys.intern(key)] = value
+        object.__setattr__(self, "extra", extra)
+
+    def __setattr__(self, key, value):
+        raise AttributeError("PropertyRecord is read-only")
+
+    def __getitem__(self, key: str):
+        if key in _SLOT_NAMES:
+            value = getattr(self, key)
+            if value is not _MISSING:
+                return value
+        elif self.extra is not None and key in self.extra:
+            return self.extra[key]
+        raise KeyError(key)
+
+    def get(self, key: str, default=None):
+        if key in _SLOT_NAMES:
+            value = getattr(self, key)
+            return default if value is _MISSING else value
+        if self.extra is not None:
+            return self.extra.get(key, default)
+        return default
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+    def __iter__(self) -> Iterator[str]:
+        for key in FIELDS:
+            if getattr(self, key) is not _MISSING:
+                yield key
+        if self.extra is not None:
+            yield from self.extra
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"PropertyRecord({dict(self)!r})"
+
+    def __reduce__(self):
+        return PropertyRecord, (dict(self),)
+
+
+_SLOT_NAMES = frozenset(FIELDS)
+
+
+def build_records(properties) -> List[PropertyRecord]:
+    """Normalized records for an iterable of listing dicts"""
+    return [PropertyRecord(prop) for prop in properties]
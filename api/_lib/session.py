@@ -1,6 +1,8 @@
 from typing import Dict, Any, Optional, Tuple
 from uuid import uuid4
 
+from .timing import current_turn_timer
+
 
 def get_default_conversation_state() -> Dict[str, Any]:
     """Return default conversation state structure"""
@@ -58,5 +60,8 @@ def create_chat_response(session_id: str, latest_property_results: list, convers
         "latest_property_results": latest_property_results,
         "conversation_state": conversation_state
     }
+    timer = current_turn_timer()
+    if timer is not None:
+        response_data["metadata"] = {**response_data.get("metadata", {}), "timings_ms": timer.summary()}
 
     return response_data
@@ -0,0 +1,68 @@
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Optional
+import functools
+import time
+
+
+class StageTimer:
+    """Wall-clock time spent per pipeline stage during one chat turn.
+
+    A stage that runs more than once accumulates. Stages that overlap (e.g.
+    concurrent extractors) are each timed in full, so their sum can exceed
+    the turn total.
+    """
+
+    def __init__(self):
+        self.started = time.perf_counter()
+        self.stages: Dict[str, float] = {}
+
+    @contextmanager
+    def stage(self, name: str):
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            self.stages[name] = self.stages.get(name, 0.0) + elapsed_ms
+
+    def summary(self) -> Dict[str, float]:
+        timings = {name: round(ms, 2) for name, ms in self.stages.items()}
+        timings["total"] = round((time.perf_counter() - self.started) * 1000, 2)
+        return timings
+
+
+_turn_timer: ContextVar[Optional[StageTimer]] = ContextVar("turn_timer", default=None)
+
+
+def start_turn_timer() -> StageTimer:
+    """Begin timing a chat turn in the current context"""
+    timer = StageTimer()
+    _turn_timer.set(timer)
+    return timer
+
+
+def current_turn_timer() -> Optional[StageTimer]:
+    return _turn_timer.get()
+
+
+@contextmanager
+def timed_stage(name: str):
+    """Time a block against the current turn's timer (no-op outside a turn)"""
+    timer = _turn_timer.get()
+    if timer is None:
+        yield
+        return
+    with timer.stage(name):
+        yield
+
+
+def pipeline_stage(name: str):
+    """Decorator timing every call of a function as stage ``name``"""
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with timed_stage(name):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -0,0 +1,35 @@
+from dataclasses import dataclass, field
+from typing import List, Dict, Any, Optional, Tuple
+
+
+@dataclass
+class TurnContext:
+    """Everything one chat turn has already computed, shared by every stage.
+
+    ``handle_chat`` fills in the intent once; search and location helpers read
+    it and memoize their own results (query embeddings, geocoded addresses)
+    here so no later stage in the same turn repeats the work.
+    """
+    message: str
+    context: str
+    conversation_state: Dict[str, Any]
+    history: List[Dict[str, str]] = field(default_factory=list)
+    intent_data: Dict[str, Any] = field(default_factory=dict)
+    query_embeddings: Dict[str, Any] = field(default_factory=dict)
+    coordinates: Dict[str, Optional[Tuple[float, float]]] = field(default_factory=dict)
+
+    @property
+    def intent(self) -> str:
+        return self.intent_data.get("intent", "CONVERSATIONAL_QUERY")
+
+    @property
+    def transaction_type(self) -> str:
+        return self.intent_data.get("transaction_type", "unknown")
+
+    @property
+    def property_name(self) -> str:
+        return self.intent_data.get("property_name", "")
+
+    @property
+    def preferences(self) -> Dict[str, Any]:
+        return self.conversation_state.get("user_preferences", {})
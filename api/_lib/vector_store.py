@@ -0,0 +1,70 @@
+from typing import List, Dict, Any, Optional
+import numpy as np
+
+
+class VectorStore:
+    """In-memory store of L2-normalized float32 property embeddings.
+
+    Row ``i`` of ``matrix`` belongs to ``properties[i]``. Properties without an
+    embedding keep a zero row and are excluded from scoring via ``has_embedding``.
+    A prebuilt normalized ``matrix`` (e.g. a memory-mapped sidecar) is used as-is.
+    """
+
+    def __init__(self, properties: List[Dict[str, Any]], dimension: Optional[int] = None,
+                 matrix: Optional[np.ndarray] = None, has_embedding: Optional[np.ndarray] = None):
+        self.properties = properties
+        if matrix is not None:
+            self.matrix = matrix
+            self.dimension = matrix.shape[1]
+            self.has_embedding = (has_embedding if has_embedding is not None
+                                  else np.ones(len(properties), dtype=bool))
+            return
+
+        if dimension is None:
+            dimension = next(
+                (len(prop["embedding"]) for prop in properties if prop.get("embedding")), 0)
+        self.dimension = dimension
+
+        self.matrix = np.zeros((len(properties), dimension), dtype=np.float32)
+        self.has_embedding = np.zeros(len(properties), dtype=bool)
+        for row, prop in enumerate(properties):
+            embedding = prop.get("embedding")
+            if embedding and len(embedding) == dimension:
+                self.matrix[row] = embedding
+                self.has_embedding[row] = True
+
+        norms = np.linalg.norm(self.matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        self.matrix /= norms
+
+    def __len__(self) -> int:
+        return len(self.properties)
+
+    def normalize_query(self, query_embedding) -> np.ndarray:
+        """Convert a query embedding to a unit-length float32 vector"""
+        query = np.asarray(query_embedding, dtype=np.float32)
+        norm = np.linalg.norm(query)
+        return query / norm if norm else query
+
+    def top_k(self, query_embedding, rows: Optional[np.ndarray] = None, k: int = 5) -> List[int]:
+        """Return up to ``k`` row ids ordered by descending cosine similarity"""
+        if rows is None:
+            rows = np.flatnonzero(self.has_embedding)
+        else:
+            rows = np.asarray(rows, dtype=np.intp)
+            rows = rows[self.has_embedding[rows]]
+        if rows.size == 0 or k <= 0:
+            return []
+
+        query = self.normalize_query(query_embedding)
+        if rows.size * 2 > len(self.properties):
+            # Large subsets: one contiguous matvec beats gathering rows first
+            scores = (self.matrix @ query)[rows]
+        else:
+            scores = self.matrix[rows] @ query
+        if rows.size > k:
+            candidates = np.argpartition(scores, -k)[-k:]
+        else:
+            candidates = np.arange(rows.size)
+        ordered = candidates[np.argsort(-scores[candidates], kind="stable")]
+        return rows[ordered].tolist()
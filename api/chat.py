@@ -22,8 +22,16 @@ from _lib import (
     find_nearby_pois,
     find_nearby_schools,
     send_tour_confirmation_email,
+    TurnContext,
+    start_turn_timer,
+    timed_stage,
 )
-from _lib.config import get_llm, logger, property_metadata
+from _lib.config import (
+    get_llm, logger, property_metadata, projections, FAST_JSON_RESPONSES,
+    COMPRESS_RESPONSES, COMPRESSION_MIN_SIZE
+)
+from _lib.fastjson import response_body
+from _lib.compression import encode_body
 
 
 def extract_date_time(message: str) -> dict:
@@ -146,9 +154,9 @@ def improved_handle_property_interest(property_name: str, latest_results: list,
                 break
 
     if not found_property:
-        for prop in property_metadata:
+        for row, prop in enumerate(property_metadata):
             if property_name.lower() in prop.get("name", "").lower():
-                found_property = prop
+                found_property = dict(projections.details[row])
                 break
 
     if found_property:
@@ -181,6 +189,7 @@ def improved_handle_property_interest(property_name: str, latest_results: list,
 def handle_chat(request_data: dict) -> dict:
     """Main handler for chat interactions"""
     start_time = datetime.now(timezone.utc)
+    start_turn_timer()
 
     message = request_data.get("message", "").strip()
     history = request_data.get("history", [])
@@ -207,9 +216,16 @@ def handle_chat(request_data: dict) -> dict:
         context = "\n".join(context_messages)
 
         intent_data = detect_unified_intent(context, message)
-        intent = intent_data.get("intent", "CONVERSATIONAL_QUERY")
-        transaction_type = intent_data.get("transaction_type", "unknown")
-        property_name = intent_data.get("property_name", "")
+        turn = TurnContext(
+            message=message,
+            context=context,
+            conversation_state=conversation_state,
+            history=history,
+            intent_data=intent_data
+        )
+        intent = turn.intent
+        transaction_type = turn.transaction_type
+        property_name = turn.property_name
 
         if intent != "PROPERTY_INTEREST" and intent != "FOLLOWUP_QUERY":
             conversation_state["tour_scheduling"] = {
@@ -376,7 +392,7 @@ def handle_chat(request_data: dict) -> dict:
                     parsed_filters=parsed_filters
                 )
 
-            results = search_properties(context, message, conversation_state)
+            results = search_properties(turn, message)
             filtered_results = results
 
             if results:
@@ -398,7 +414,8 @@ def handle_chat(request_data: dict) -> dict:
 
                 assistant:
                 """
-                enhanced_response = get_llm().invoke(prompt).content.strip()
+                with timed_stage("response_generation"):
+                    enhanced_response = get_llm().invoke(prompt).content.strip()
 
                 return create_chat_response(
                     session_id, filtered_results, conversation_state,
@@ -433,7 +450,8 @@ def handle_chat(request_data: dict) -> dict:
 
                 assistant: [Respond very concisely (2-3 sentences maximum) about the properties. Answer their question directly and ask one brief follow-up.]
                 """
-                follow_up_response = get_llm().invoke(follow_up_prompt).content
+                with timed_stage("response_generation"):
+                    follow_up_response = get_llm().invoke(follow_up_prompt).content
 
                 return create_chat_response(
                     session_id, latest_property_results, conversation_state,
@@ -465,7 +483,7 @@ def handle_chat(request_data: dict) -> dict:
                         extracted_address = match.group(1).strip()
 
                 if extracted_address and extracted_address.upper() != "NONE":
-                    coordinates = get_coordinates_from_address(extracted_address)
+                    coordinates = get_coordinates_from_address(extracted_address, turn)
 
                     if coordinates:
                         lat, lng = coordinates
@@ -565,11 +583,21 @@ class handler(BaseHTTPRequestHandler):
                 self.end_headers()
                 self.wfile.write(json.dumps({"detail": result["error"]}).encode())
             else:
+                body = response_body(result, FAST_JSON_RESPONSES)
+                encoding = None
+                compressible = COMPRESS_RESPONSES and len(body) >= COMPRESSION_MIN_SIZE
+                if compressible:
+                    body, encoding = encode_body(body, self.headers.get('Accept-Encoding'), COMPRESSION_MIN_SIZE)
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
+                if encoding:
+                    self.send_header('Content-Encoding', encoding)
+                if compressible:
+                    self.send_header('Vary', 'Accept-Encoding')
+                self.send_header('Content-Length', str(len(body)))
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
-                self.wfile.write(json.dumps(result).encode())
+                self.wfile.write(body)
 
         except json.JSONDecodeError:
             self.send_response(400)
@@ -3,10 +3,59 @@ import json
 from urllib.parse import urlparse, parse_qs
 import sys
 import os
+import numpy as np
 
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
-from _lib.config import property_metadata, logger
+from _lib.config import (
+    attribute_index, projections, FAST_JSON_RESPONSES, logger,
+    COMPRESS_RESPONSES, COMPRESSION_MIN_SIZE, compressed_body_cache
+)
+from _lib.fastjson import response_body
+from _lib.compression import encode_body
+
+
+def filter_listing_rows(
+    search: str = None,
+    price_min: float = None,
+    price_max: float = None,
+    bedrooms: int = None,
+    bathrooms: int = None,
+    location: str = None,
+    property_type: str = None,
+    transaction_type: str = None
+) -> np.ndarray:
+    """Select catalog rows for the listing filters with one fused boolean mask"""
+    index = attribute_index
+    mask = index.all()
+
+    if price_min is not None:
+        mask &= index.for_sale & (index.sales_price >= price_min)
+
+    if price_max is not None:
+        mask &= index.for_sale & (index.sales_price <= price_max)
+
+    if bedrooms is not None:
+        mask &= index.equals(index.bedrooms, bedrooms)
+
+    if bathrooms is not None:
+        mask &= index.equals(index.bathrooms, bathrooms)
+
+    if property_type:
+        mask &= index.property_type_contains(property_type)
+
+    if transaction_type:
+        if transaction_type.lower() == 'buy':
+            mask &= index.for_sale
+        elif transaction_type.lower() == 'rent':
+            mask &= ~index.for_sale
+
+    rows = index.rows(mask)
+    if search:
+        rows = index.text_rows(rows, search)
+    if location:
+        rows = index.location_rows(rows, location)
+    return rows
 
 
 def get_all_properties(params: dict) -> dict:
@@ -32,104 +81,36 @@ def get_all_properties(params: dict) -> dict:
         if bathrooms:
             bathrooms = int(bathrooms)
 
-        filtered_properties = list(property_metadata)
-
-        if search:
-            search_lower = search.lower()
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if (search_lower in prop.get('name', '').lower() or
-                    search_lower in prop.get('fullAddress', '').lower() or
-                    search_lower in prop.get('description', '').lower())
-            ]
-
-        if price_min is not None:
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if prop.get('salesPrice') and float(prop.get('salesPrice', 0)) >= price_min
-            ]
-
-        if price_max is not None:
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if prop.get('salesPrice') and float(prop.get('salesPrice', 0)) <= price_max
-            ]
-
-        if bedrooms is not None:
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if prop.get('bedroomCount') == bedrooms
-            ]
-
-        if bathrooms is not None:
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if prop.get('bathCount') == bathrooms
-            ]
-
-        if location:
-            location_lower = location.lower()
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if (location_lower in prop.get('fullAddress', '').lower() or
-                    location_lower in (prop.get('city') or '').lower() or
-                    location_lower in (prop.get('neighborhood') or '').lower())
-            ]
-
-        if property_type:
-            type_lower = property_type.lower()
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if type_lower in prop.get('propertyType', '').lower()
-            ]
-
-        if transaction_type:
-            if transaction_type.lower() == 'buy':
-                filtered_properties = [
-                    prop for prop in filtered_properties
-                    if prop.get('salesPrice') is not None and prop.get('salesPrice') != 0
-                ]
-            elif transaction_type.lower() == 'rent':
-                filtered_properties = [
-                    prop for prop in filtered_properties
-                    if prop.get('salesPrice') is None or prop.get('salesPrice') == 0
-                ]
-
-        total = len(filtered_properties)
+        rows = filter_listing_rows(
+            search=search,
+            price_min=price_min,
+            price_max=price_max,
+            bedrooms=bedrooms,
+            bathrooms=bathrooms,
+            location=location,
+            property_type=property_type,
+            transaction_type=transaction_type
+        )
+
+        total = int(rows.size)
         total_pages = (total + limit - 1) // limit
         start_idx = (page - 1) * limit
         end_idx = start_idx + limit
-        paginated_properties = filtered_properties[start_idx:end_idx]
-
-        formatted_properties = []
-        for prop in paginated_properties:
-            formatted_prop = {
-                "id": prop.get("id", ""),
-                "name": prop.get("name", ""),
-                "description": prop.get("description", ""),
-                "salesPrice": prop.get("salesPrice"),
-                "fullAddress": prop.get("fullAddress", ""),
-                "location": prop.get("fullAddress", ""),
-                "bedroomCount": prop.get("bedroomCount"),
-                "bathCount": prop.get("bathCount"),
-                "squareFeet": prop.get("livingSpaceSize"),
-                "livingSpaceSize": prop.get("livingSpaceSize"),
-                "image": prop.get("media", []),
-                "media": prop.get("media", []),
-                "slug": prop.get("slug", "")
-            }
-            formatted_properties.append(formatted_prop)
+        page_rows = rows[start_idx:end_idx]
+        pagination = {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "totalPages": total_pages,
+            "hasNext": page < total_pages,
+            "hasPrev": page > 1
+        }
 
+        if projections.serialized:
+            return projections.listing_page_json(page_rows, pagination)
         return {
-            "properties": formatted_properties,
-            "pagination": {
-                "page": page,
-                "limit": limit,
-                "total": total,
-                "totalPages": total_pages,
-                "hasNext": page < total_pages,
-                "hasPrev": page > 1
-            }
+            "properties": [projections.cards[row] for row in page_rows],
+            "pagination": pagination
         }
 
     except Exception as e:
@@ -145,18 +126,29 @@ class handler(BaseHTTPRequestHandler):
 
             result = get_all_properties(params)
 
-            if result.get("error"):
+            if isinstance(result, dict) and result.get("error"):
                 self.send_response(result.get("status_code", 500))
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
                 self.wfile.write(json.dumps({"detail": result["error"]}).encode())
             else:
+                body = result if isinstance(result, bytes) else response_body(result, FAST_JSON_RESPONSES)
+                encoding = None
+                compressible = COMPRESS_RESPONSES and len(body) >= COMPRESSION_MIN_SIZE
+                if compressible:
+                    body, encoding = encode_body(body, self.headers.get('Accept-Encoding'), COMPRESSION_MIN_SIZE,
+                                                 compressed_body_cache, self.path)
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
+                if encoding:
+                    self.send_header('Content-Encoding', encoding)
+                if compressible:
+                    self.send_header('Vary', 'Accept-Encoding')
+                self.send_header('Content-Length', str(len(body)))
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
-                self.wfile.write(json.dumps(result).encode())
+                self.wfile.write(body)
 
         except Exception as e:
             self.send_response(500)
@@ -6,34 +6,31 @@ import os
 
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from _lib.config import property_metadata, logger
+from _lib.config import (
+    catalog_lookup, projections, FAST_JSON_RESPONSES, logger,
+    COMPRESS_RESPONSES, COMPRESSION_MIN_SIZE, compressed_body_cache
+)
+from _lib.fastjson import response_body
+from _lib.compression import encode_body
 from _lib.location import enhance_property_with_location_data
 
 
 def get_property_by_id(property_id: str) -> dict:
-    """Get a specific property by its ID"""
+    """Get a specific property by its ID (or slug)"""
     try:
         logger.info(f"Property detail request: {property_id}")
-        property_detail = None
-
-        for prop in property_metadata:
-            if prop.get("id") == property_id:
-                property_detail = prop.copy()
-                break
+        property_detail = catalog_lookup.get(property_id) or catalog_lookup.get_by_slug(property_id)
 
         if not property_detail:
             logger.warning(f"Property not found: {property_id}")
             return {"error": f"Property {property_id} not found", "status_code": 404}
 
-        excluded_keys = {"embedding", "seoDescription"}
-        cleaned_property = {
-            key: value for key, value in property_detail.items()
-            if key not in excluded_keys
-        }
-
-        enhanced_property = enhance_property_with_location_data(cleaned_property)
+        row = projections.row(property_detail)
+        enhanced_property = enhance_property_with_location_data(projections.details[row])
 
         logger.info(f"Property detail served successfully: {property_id}")
+        if projections.serialized:
+            return projections.detail_json(row, enhanced_property)
         return enhanced_property
 
     except Exception as e:
@@ -59,18 +56,29 @@ class handler(BaseHTTPRequestHandler):
 
             result = get_property_by_id(property_id)
 
-            if result.get("error"):
+            if isinstance(result, dict) and result.get("error"):
                 self.send_response(result.get("status_code", 500))
                 self.send_header('Content-type', 'application/json')
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
                 self.wfile.write(json.dumps({"detail": result["error"]}).encode())
             else:
+                body = result if isinstance(result, bytes) else response_body(result, FAST_JSON_RESPONSES)
+                encoding = None
+                compressible = COMPRESS_RESPONSES and len(body) >= COMPRESSION_MIN_SIZE
+                if compressible:
+                    body, encoding = encode_body(body, self.headers.get('Accept-Encoding'), COMPRESSION_MIN_SIZE,
+                                                 compressed_body_cache, self.path)
                 self.send_response(200)
                 self.send_header('Content-type', 'application/json')
+                if encoding:
+                    self.send_header('Content-Encoding', encoding)
+                if compressible:
+                    self.send_header('Vary', 'Accept-Encoding')
+                self.send_header('Content-Length', str(len(body)))
                 self.send_header('Access-Control-Allow-Origin', '*')
                 self.end_headers()
-                self.wfile.write(json.dumps(result).encode())
+                self.wfile.write(body)
 
         except Exception as e:
             self.send_response(500)
@@ -1,34 +1,85 @@
 import os
 from dotenv import load_dotenv
-import json
-from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from geopy.geocoders import Nominatim
 import structlog
 import logging
 import sys
+from store import CatalogReloader, CompressedBodyCache, GeocodeCache, PoiIndex, PoiTileCache, QueryEmbeddingCache
+from providers import get_provider_name, create_llm, create_embeddings_model
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 EMBEDDINGS_MODEL = os.getenv("EMBEDDINGS_MODEL", "text-embedding-ada-002")
 DATA_FILE = os.getenv("DATA_FILE", "data_with_embeddings.json")
+EMBEDDING_CACHE_PATH = os.getenv("EMBEDDING_CACHE_PATH")
+CATALOG_WATCH_INTERVAL = float(os.getenv("CATALOG_WATCH_INTERVAL", 0))
+ADMIN_TOKEN = os.getenv("ADMIN_TOKEN")
+PRESERIALIZE_RESPONSES = os.getenv("PRESERIALIZE_RESPONSES", "").lower() in ("1", "true", "yes")
+FAST_JSON_RESPONSES = os.getenv("FAST_JSON_RESPONSES", "").lower() in ("1", "true", "yes")
+# Negotiated br/gzip for bodies of at least COMPRESSION_MIN_SIZE bytes; on unless disabled
+COMPRESS_RESPONSES = os.getenv("COMPRESS_RESPONSES", "true").lower() in ("1", "true", "yes")
+COMPRESSION_MIN_SIZE = int(os.getenv("COMPRESSION_MIN_SIZE", 1024))
+compressed_body_cache = CompressedBodyCache(int(os.getenv("COMPRESSION_CACHE_SIZE", 128)))
+LLM_PROVIDER = get_provider_name()
 
-if not OPENAI_API_KEY:
-    raise ValueError("OPENAI_API_KEY environment variable is required")
+if LLM_PROVIDER == "openai":
+    if not OPENAI_API_KEY:
+        raise ValueError("OPENAI_API_KEY environment variable is required")
+    os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY
 
-os.environ["OPENAI_API_KEY"] = OPENAI_API_KEY
+llm = create_llm(LLM_PROVIDER)
+embeddings_model = create_embeddings_model(LLM_PROVIDER, EMBEDDINGS_MODEL)
 
-llm = ChatOpenAI(temperature=0, model_name="gpt-4o")
-embeddings_model = OpenAIEmbeddings(model=EMBEDDINGS_MODEL)
-
-embedding_cache = {}
 location_cache = {}
 CACHE_SIZE_LIMIT = 1000
+# Precomputed location fields older than this are refetched at request time
+LOCATION_DATA_MAX_AGE = float(os.getenv("LOCATION_DATA_MAX_AGE_DAYS", 30)) * 86400
+# Overpass answers per geohash cell, shared by every property in the cell
+poi_tile_cache = PoiTileCache(
+    precision=int(os.getenv("POI_TILE_PRECISION", 6)),
+    max_tiles=int(os.getenv("POI_TILE_CACHE_SIZE", 128)),
+    ttl=float(os.getenv("POI_TILE_TTL_HOURS", 24)) * 3600
+)
+# Offline POIs built from OSM extracts by ingest_pois.py; Overpass answers the rest
+POI_INDEX_PATH = os.getenv("POI_INDEX_PATH", "pois.sqlite3")
+poi_index = PoiIndex(POI_INDEX_PATH or None)
+# Address -> coordinates, kept across restarts; fill it offline with geocode_catalog.py
+GEOCODE_CACHE_PATH = os.getenv("GEOCODE_CACHE_PATH", "geocodes.sqlite3")
+geocode_cache = GeocodeCache(
+    GEOCODE_CACHE_PATH or None,
+    ttl=float(os.getenv("GEOCODE_CACHE_TTL_DAYS", 90)) * 86400,
+    negative_ttl=float(os.getenv("GEOCODE_NEGATIVE_TTL_HOURS", 24)) * 3600
+)
+embedding_cache = QueryEmbeddingCache(
+    EMBEDDINGS_MODEL if LLM_PROVIDER == "openai" else f"{LLM_PROVIDER}/{EMBEDDINGS_MODEL}",
+    max_entries=int(os.getenv("EMBEDDING_CACHE_SIZE", CACHE_SIZE_LIMIT)),
+    path=EMBEDDING_CACHE_PATH
+)
+
+# Catalog parts (listings, embeddings, indexes) load on first access. The
+# reloader can swap in a rebuilt catalog at runtime, so request handlers take
+# one snapshot with get_catalog() instead of importing the parts directly.
+catalog_reloader = CatalogReloader(DATA_FILE, preserialize=PRESERIALIZE_RESPONSES)
+CATALOG_PARTS = {
+    "property_metadata": "listings",
+    "vector_store": "vector_store",
+    "attribute_index": "attribute_index",
+    "catalog_lookup": "lookup",
+    "projections": "projections",
+}
+
+
+def get_catalog():
+    """The live catalog; hold on to it for the rest of the request"""
+    return catalog_reloader.current
+
 
-try:
-    with open(DATA_FILE, "r", encoding="utf-8") as file:
-        property_metadata = json.load(file)
-except (FileNotFoundError, json.JSONDecodeError) as e:
-    raise RuntimeError(f"Failed to load property data: {e}")
+def __getattr__(name):
+    if name == "catalog":
+        return catalog_reloader.current
+    if name in CATALOG_PARTS:
+        return getattr(catalog_reloader.current, CATALOG_PARTS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 sessions = {}
 geolocator = Nominatim(user_agent="ai-broker-app")
@@ -0,0 +1,29 @@
+from config.config import catalog_reloader, ADMIN_TOKEN, logger
+from fastapi import HTTPException
+import hmac
+
+
+def check_admin_token(token: str):
+    """Reject admin calls unless ADMIN_TOKEN is configured and matches"""
+    if not ADMIN_TOKEN:
+        raise HTTPException(status_code=403, detail="Admin endpoints are disabled")
+    if not token or not hmac.compare_digest(token, ADMIN_TOKEN):
+        raise HTTPException(status_code=401, detail="Invalid admin token")
+
+
+async def reload_catalog(token: str, force: bool = False):
+    """Rebuild the catalog from DATA_FILE in the background and swap it in"""
+    check_admin_token(token)
+    previous_version = catalog_reloader.current.version
+    try:
+        catalog = await catalog_reloader.areload(force=force)
+    except Exception as e:
+        logger.error("Catalog reload failed", error=str(e))
+        raise HTTPException(status_code=500, detail=f"Catalog reload failed: {e}")
+
+    logger.info("Catalog reload requested", previous_version=previous_version, version=catalog.version)
+    return {
+        "status": "reloaded" if catalog.version != previous_version or force else "unchanged",
+        "previous_version": previous_version,
+        "catalog": catalog_reloader.stats()
+    }
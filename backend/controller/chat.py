@@ -1,16 +1,160 @@
 
 from schema.chat import ChatRequest
-from config.config import llm, logger
+from config.config import llm, get_catalog, logger
+from store.locations import precomputed_coordinates
 from datetime import datetime, timezone
 from utils import *
 from fastapi import HTTPException
+from langchain_core.output_parsers import JsonOutputParser
+import asyncio
+import json
+import re
+
+
+def extract_date_time(message: str) -> dict:
+    """Extract date and time from message"""
+    result = {"date": "", "time": "", "has_both": False}
+
+    date_patterns = [
+        r'\b(\d{1,2}[/-]\d{1,2}[/-]\d{2,4})\b',
+        r'\b(january|february|march|april|may|june|july|august|september|october|november|december)\s+\d{1,2}(?:st|nd|rd|th)?,?\s*\d{0,4}\b',
+        r'\b(tomorrow|today|next\s+\w+day)\b',
+    ]
+
+    time_patterns = [
+        r'\b(\d{1,2}:\d{2}\s*(?:am|pm)?)\b',
+        r'\b(\d{1,2}\s*(?:am|pm))\b',
+    ]
+
+    for pattern in date_patterns:
+        match = re.search(pattern, message, re.IGNORECASE)
+        if match:
+            result["date"] = match.group(0)
+            break
+
+    for pattern in time_patterns:
+        match = re.search(pattern, message, re.IGNORECASE)
+        if match:
+            result["time"] = match.group(0)
+            break
+
+    result["has_both"] = bool(result["date"] and result["time"])
+    return result
+
+
+def extract_name_email(message: str) -> dict:
+    """Extract name and email from message"""
+    result = {"name": "", "email": ""}
+
+    email_pattern = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
+    email_match = re.search(email_pattern, message)
+    if email_match:
+        result["email"] = email_match.group(0)
+
+    name_patterns = [
+        r"(?:my name is|i'm|i am|name's|call me)\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)",
+        r"^([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)$",
+    ]
+
+    for pattern in name_patterns:
+        match = re.search(pattern, message, re.IGNORECASE)
+        if match:
+            result["name"] = match.group(1).strip()
+            break
+
+    return result
+
+
+async def handle_tour_scheduling(message: str, history: list, conversation_state: dict) -> dict:
+    """Handle tour scheduling conversation flow"""
+    tour_state = conversation_state.get("tour_scheduling", {})
+    status = tour_state.get("status", "")
+
+    if status == "awaiting_time":
+        instruction = "Ask for their preferred date and time for the tour. Be helpful and suggest flexible options. Keep response to 2-3 sentences."
+        situation = "The user is scheduling a tour and needs to provide a date and time."
+    elif status == "awaiting_date":
+        instruction = "Acknowledge the time and ask for their preferred date. Keep response to 2 sentences."
+        situation = "The user provided a time but still needs to provide a date."
+    elif status == "awaiting_name":
+        instruction = "Ask for their name to complete the booking. Keep it brief and friendly."
+        situation = "The user needs to provide their name for the tour booking."
+    elif status == "awaiting_email":
+        instruction = "Ask for their email address so you can send the confirmation. Keep it brief."
+        situation = "The user needs to provide their email for the tour confirmation."
+    else:
+        instruction = "Help them continue with the tour scheduling. Ask for any missing information."
+        situation = "The user is in the tour scheduling process."
+
+    prompt = f"""
+    system: {system_message}
+    
+    user: {situation} Their message: "{message}"
+    
+    assistant: [{instruction}]
+    """
 
+    try:
+        response = (await llm.ainvoke(prompt)).content.strip()
+    except Exception as e:
+        logger.error("Error in tour scheduling", error=str(e))
+        response = "I'd be happy to help schedule your tour. Could you tell me your preferred date and time?"
+
+    return {"response": response}
+
+
+async def improved_handle_property_interest(property_name: str, latest_results: list, history: list, conversation_state: dict,
+                                           catalog=None) -> dict:
+    """Handle when user expresses interest in a specific property"""
+    found_property = None
+    name_lower = property_name.lower()
+
+    for prop in latest_results or []:
+        if name_lower in prop.get("name", "").lower():
+            found_property = prop
+            break
+
+    if not found_property:
+        found_property = find_property_by_name(property_name, catalog) or None
+
+    if not found_property:
+        catalog = catalog or get_catalog()
+        for row, prop in enumerate(catalog.listings):
+            if name_lower in prop.get("name", "").lower():
+                found_property = dict(catalog.projections.details[row])
+                break
+
+    if not found_property:
+        return {
+            "found": False,
+            "property": None,
+            "response": f"I couldn't find a property named '{property_name}'. Could you clarify which property you're interested in?"
+        }
 
+    conversation_state["property_of_interest"] = found_property
+    conversation_state["awaiting_tour_confirmation"] = True
+
+    prompt = f"""
+    system: {system_message}
+    
+    user: The user is interested in {found_property.get('name', 'this property')}.
+    Property details: {json.dumps(found_property, indent=2)}
+    
+    assistant: [Provide a brief, enthusiastic response about this property highlighting key features. Ask if they'd like to schedule a tour. Keep to 3-4 sentences.]
+    """
+
+    try:
+        response = (await llm.ainvoke(prompt)).content.strip()
+    except Exception:
+        response = f"Great choice! {found_property.get('name')} is a wonderful property. Would you like to schedule a tour?"
+
+    return {"found": True, "property": found_property, "response": response}
 
 
 async def handle_chat(request: ChatRequest):
     """Main endpoint to handle chat interactions with intelligent broker-like behavior"""
     start_time = datetime.now(timezone.utc)
+    start_turn_timer()
     session_id, session_data = get_or_create_session(request.session_id)
     latest_property_results = session_data["latest_property_results"]
     conversation_state = session_data["conversation_state"]
@@ -32,10 +176,18 @@ async def handle_chat(request: ChatRequest):
             context_messages.append(f"{role}: {content}")
         context_messages.append(f"user: {message}")
         context = "\n".join(context_messages)
-        intent_data = detect_unified_intent(context, message)
-        intent = intent_data.get("intent", "CONVERSATIONAL_QUERY")
-        transaction_type = intent_data.get("transaction_type", "unknown")
-        property_name = intent_data.get("property_name", "")
+        intent_data = await detect_unified_intent(context, message)
+        turn = TurnContext(
+            message=message,
+            context=context,
+            conversation_state=conversation_state,
+            history=request.history,
+            intent_data=intent_data,
+            catalog=get_catalog()
+        )
+        intent = turn.intent
+        transaction_type = turn.transaction_type
+        property_name = turn.property_name
 
         if intent != "PROPERTY_INTEREST" and intent != "FOLLOWUP_QUERY":
             conversation_state["tour_scheduling"] = {
@@ -69,7 +221,7 @@ async def handle_chat(request: ChatRequest):
                 conversation_state["tour_scheduling"]["time"] = extracted_time
             else:
 
-                tour_result = handle_tour_scheduling(message, request.history, conversation_state)
+                tour_result = await handle_tour_scheduling(message, request.history, conversation_state)
                 assistant_message = {
                     "role": "assistant",
                     "content": tour_result["response"]
@@ -89,7 +241,8 @@ async def handle_chat(request: ChatRequest):
 
                 conversation_state["tour_scheduling"]["status"] = "confirmed"
                 try:
-                    send_tour_confirmation_email(
+                    await asyncio.to_thread(
+                        send_tour_confirmation_email,
                         conversation_state["tour_scheduling"]["email"],
                         conversation_state["tour_scheduling"]["name"],
                         conversation_state["tour_scheduling"]["property"].get(
@@ -111,8 +264,7 @@ async def handle_chat(request: ChatRequest):
                 """
 
                 try:
-                    confirmation_response = llm.invoke(
-                        confirmation_prompt).content.strip()
+                    confirmation_response = (await llm.ainvoke(confirmation_prompt)).content.strip()
                 except Exception as e:
                     logger.error("Error generating confirmation", error=str(e))
                     confirmation_response = f"Great! I've scheduled your tour for {property_name} on {conversation_state['tour_scheduling']['date']} at {conversation_state['tour_scheduling']['time']}. A confirmation email has been sent to {conversation_state['tour_scheduling']['email']}. Is there anything specific you'd like to know about the property before the tour?"
@@ -137,7 +289,7 @@ async def handle_chat(request: ChatRequest):
                     conversation_state["tour_scheduling"]["status"] = "awaiting_date"
                 elif not conversation_state["tour_scheduling"]["time"]:
                     conversation_state["tour_scheduling"]["status"] = "awaiting_time"
-                tour_result = handle_tour_scheduling(message, request.history, conversation_state)
+                tour_result = await handle_tour_scheduling(message, request.history, conversation_state)
                 assistant_message = {
                     "role": "assistant",
                     "content": tour_result["response"]
@@ -156,8 +308,7 @@ async def handle_chat(request: ChatRequest):
             Return only "yes" or "no".
             """
 
-            wants_tour = llm.invoke(
-                tour_interest_prompt).content.strip().lower() == "yes"
+            wants_tour = (await llm.ainvoke(tour_interest_prompt)).content.strip().lower() == "yes"
 
             if wants_tour:
 
@@ -185,7 +336,7 @@ async def handle_chat(request: ChatRequest):
                 assistant: [Create a concise response (2-3 sentences) confirming their interest and asking about their availability. Ask specifically about what date and time works for them.]
                 """
 
-                tour_response = llm.invoke(tour_prompt).content.strip()
+                tour_response = (await llm.ainvoke(tour_prompt)).content.strip()
                 assistant_message = {
                     "role": "assistant",
                     "content": tour_response
@@ -210,7 +361,7 @@ async def handle_chat(request: ChatRequest):
             assistant: [Respond like a professional real estate broker to this initial inquiry. Ask 1 specific qualifying question about preferences. Be conversational but very concise (2-3 sentences maximum).]
             """
 
-            response_text = llm.invoke(prompt).content.strip()
+            response_text = (await llm.ainvoke(prompt)).content.strip()
             assistant_message = {
                 "role": "assistant",
                 "content": response_text
@@ -230,8 +381,7 @@ async def handle_chat(request: ChatRequest):
             Return only "yes" or "no".
             """
 
-            wants_tour = llm.invoke(
-                tour_intent_prompt).content.strip().lower() == "yes"
+            wants_tour = (await llm.ainvoke(tour_intent_prompt)).content.strip().lower() == "yes"
             if wants_tour:
 
                 property_found = False
@@ -275,7 +425,7 @@ async def handle_chat(request: ChatRequest):
                     assistant: [Create a concise response (2-3 sentences) confirming their interest and asking about their availability. Ask specifically about what date and time works for them.]
                     """
 
-                    tour_response = llm.invoke(tour_prompt).content.strip()
+                    tour_response = (await llm.ainvoke(tour_prompt)).content.strip()
                     assistant_message = {
                         "role": "assistant",
                         "content": tour_response
@@ -300,7 +450,7 @@ async def handle_chat(request: ChatRequest):
                     assistant: [Create a concise response (2-3 sentences) asking which specific property they'd like to tour. If appropriate, remind them of the most recently discussed property.]
                     """
 
-                    response_text = llm.invoke(prompt).content.strip()
+                    response_text = (await llm.ainvoke(prompt)).content.strip()
                     assistant_message = {
                         "role": "assistant",
                         "content": response_text
@@ -327,8 +477,7 @@ async def handle_chat(request: ChatRequest):
                         assistant: [Create a concise response (2-3 sentences) confirming their interest in this property and asking if they'd like to schedule a tour.]
                         """
 
-                        interest_response = llm.invoke(
-                            interest_prompt).content.strip()
+                        interest_response = (await llm.ainvoke(interest_prompt)).content.strip()
                         assistant_message = {
                             "role": "assistant",
                             "content": interest_response
@@ -355,7 +504,7 @@ async def handle_chat(request: ChatRequest):
                         assistant: [Create a concise response (2-3 sentences) asking which specific property they're interested in from among {property_list}.]
                         """
 
-                        response_text = llm.invoke(prompt).content.strip()
+                        response_text = (await llm.ainvoke(prompt)).content.strip()
                         assistant_message = {
                             "role": "assistant",
                             "content": response_text
@@ -381,8 +530,7 @@ async def handle_chat(request: ChatRequest):
                         assistant: [Create a concise response (2-3 sentences) confirming their interest in this property and asking if they'd like to schedule a tour.]
                         """
 
-                        interest_response = llm.invoke(
-                            interest_prompt).content.strip()
+                        interest_response = (await llm.ainvoke(interest_prompt)).content.strip()
                         assistant_message = {
                             "role": "assistant",
                             "content": interest_response
@@ -406,7 +554,7 @@ async def handle_chat(request: ChatRequest):
                     assistant: [Respond like a professional real estate broker who needs more information. Keep it very concise (2-3 sentences) asking what type of property they're interested in.]
                     """
 
-                    response_text = llm.invoke(prompt).content.strip()
+                    response_text = (await llm.ainvoke(prompt)).content.strip()
                     assistant_message = {
                         "role": "assistant",
                         "content": response_text
@@ -418,8 +566,8 @@ async def handle_chat(request: ChatRequest):
                         response=response_text,
                         results=[]
                     )
-            interest_result = improved_handle_property_interest(
-                property_name, latest_property_results, request.history, conversation_state)
+            interest_result = await improved_handle_property_interest(
+                property_name, latest_property_results, request.history, conversation_state, turn.catalog)
             if interest_result["found"]:
                 prompt = f"""
                 system: {system_message}
@@ -432,7 +580,7 @@ async def handle_chat(request: ChatRequest):
                 assistant: [Rewrite this to be much more concise (3-4 sentences maximum). Keep the key information and ask just one follow-up question about their interest.]
                 """
 
-                enhanced_response = llm.invoke(prompt).content.strip()
+                enhanced_response = (await llm.ainvoke(prompt)).content.strip()
                 interest_result["response"] = enhanced_response
             assistant_message = {
                 "role": "assistant",
@@ -448,8 +596,19 @@ async def handle_chat(request: ChatRequest):
             )
         elif intent == "PROPERTY_QUERY" or intent == "PROPERTY_REJECTION":
 
-            parsed_filters = extract_parsed_filters(message, request.history)
-            extract_user_preferences(message, request.history, conversation_state)
+            # The query embedding overlaps the extractors, but only a search
+            # turn waits for it: a clarification cancels it, and its errors
+            # never fail the extractors
+            embedding_task = asyncio.create_task(get_query_embedding(message))
+            embedding_task.add_done_callback(lambda task: task.cancelled() or task.exception())
+            try:
+                async with asyncio.TaskGroup() as tg:
+                    filters_task = tg.create_task(extract_parsed_filters(message, request.history))
+                    tg.create_task(extract_user_preferences(message, request.history, conversation_state))
+            except BaseException:
+                embedding_task.cancel()
+                raise
+            parsed_filters = filters_task.result()
             prefs = conversation_state["user_preferences"]
             has_transaction = prefs["transaction_type"] is not None
             has_location = prefs["location"] is not None
@@ -458,8 +617,9 @@ async def handle_chat(request: ChatRequest):
                            prefs["property_type"] is not None)
             
             if not (has_transaction):
+                embedding_task.cancel()
 
-                clarification_response = generate_smart_clarification(message, conversation_state)
+                clarification_response = await generate_smart_clarification(message, conversation_state)
                 assistant_message = {
                     "role": "assistant", 
                     "content": clarification_response
@@ -472,12 +632,13 @@ async def handle_chat(request: ChatRequest):
                     results=[],
                     parsed_filters=parsed_filters
                 )
-            results = search_properties(context, message, conversation_state)
+            turn.query_embeddings[message] = await embedding_task
+            results = await search_properties(turn, message)
             filtered_results = results
 
             if results:
 
-                gpt_result = get_gpt_response(message, results)
+                gpt_result = await get_gpt_response(message, results)
                 natural_text = gpt_result["text"]
                 property_ids = gpt_result.get("property_ids", [])
 
@@ -493,7 +654,8 @@ async def handle_chat(request: ChatRequest):
                 
                 assistant:
                 """
-                enhanced_response = llm.invoke(prompt).content.strip()
+                with timed_stage("response_generation"):
+                    enhanced_response = (await llm.ainvoke(prompt)).content.strip()
                 assistant_message = {
                     "role": "assistant",
                     "content": enhanced_response
@@ -508,22 +670,10 @@ async def handle_chat(request: ChatRequest):
                 relaxed_results = []
                 if location_prefs:
 
-                    location_lower = location_prefs.lower()
-                    location_matches = [
-                        prop for prop in property_metadata 
-                        if (location_lower in prop.get("city", "").lower() or
-                            location_lower in prop.get("fullAddress", "").lower())
-                    ]
-                    
-                    if location_matches:
-
-                        if prefs.get("transaction_type") == "rent":
-                            relaxed_results = [p for p in location_matches if p.get("leaseProperty")]
-                        elif prefs.get("transaction_type") == "buy":
-                            relaxed_results = [p for p in location_matches if p.get("salesPrice")]
-                        else:
-                            relaxed_results = location_matches
-                        relaxed_results = relaxed_results[:3]
+                    relaxed_rows = filter_rows_by_preferences(
+                        {"transaction_type": prefs.get("transaction_type"), "location": location_prefs},
+                        catalog=turn.catalog)
+                    relaxed_results = [turn.catalog.listings[row] for row in relaxed_rows[:3]]
                 
                 if relaxed_results:
                     no_results_prompt = f"""
@@ -544,7 +694,7 @@ async def handle_chat(request: ChatRequest):
                     assistant:
                     """
 
-                response_text = llm.invoke(no_results_prompt).content.strip()
+                response_text = (await llm.ainvoke(no_results_prompt)).content.strip()
                 assistant_message = {
                     "role": "assistant",
                     "content": response_text
@@ -559,9 +709,10 @@ async def handle_chat(request: ChatRequest):
                 )
         elif intent == "FOLLOWUP_QUERY":
 
-            parsed_filters = extract_parsed_filters(message, request.history)
-
-            extract_user_preferences(message, request.history, conversation_state)
+            async with asyncio.TaskGroup() as tg:
+                filters_task = tg.create_task(extract_parsed_filters(message, request.history))
+                tg.create_task(extract_user_preferences(message, request.history, conversation_state))
+            parsed_filters = filters_task.result()
             prefs = conversation_state["user_preferences"]
             has_transaction = prefs["transaction_type"] is not None
             has_location = prefs["location"] is not None
@@ -588,12 +739,12 @@ async def handle_chat(request: ChatRequest):
                         query_parts.append(f"under ${prefs['max_price']}")
                 
                 constructed_query = " ".join(query_parts)
-                results = search_properties(context, constructed_query, conversation_state)
+                results = await search_properties(turn, constructed_query)
                 
                 if results:
 
                     latest_property_results = results
-                    gpt_result = get_gpt_response(constructed_query, results)
+                    gpt_result = await get_gpt_response(constructed_query, results)
                     natural_text = gpt_result["text"]
                     prompt = f"""
                     system: You are a real estate agent who gives extremely brief responses. Never use more than 2-3 short sentences total.
@@ -604,7 +755,8 @@ async def handle_chat(request: ChatRequest):
                     assistant:
                     """
                     
-                    enhanced_response = llm.invoke(prompt).content.strip()
+                    with timed_stage("response_generation"):
+                        enhanced_response = (await llm.ainvoke(prompt)).content.strip()
                     assistant_message = {
                         "role": "assistant",
                         "content": enhanced_response
@@ -622,7 +774,7 @@ async def handle_chat(request: ChatRequest):
                     assistant:
                     """
                     
-                    response_text = llm.invoke(no_results_prompt).content.strip()
+                    response_text = (await llm.ainvoke(no_results_prompt)).content.strip()
                     assistant_message = {
                         "role": "assistant",
                         "content": response_text
@@ -632,7 +784,7 @@ async def handle_chat(request: ChatRequest):
                     return create_chat_response(session_id, latest_property_results, conversation_state, response=response_text, results=[], parsed_filters=parsed_filters)
             else:
 
-                clarification_response = generate_smart_clarification(message, conversation_state)
+                clarification_response = await generate_smart_clarification(message, conversation_state)
                 assistant_message = {
                     "role": "assistant",
                     "content": clarification_response
@@ -655,7 +807,7 @@ async def handle_chat(request: ChatRequest):
             """
             
             try:
-                response = llm.invoke(criteria_response_check).content
+                response = (await llm.ainvoke(criteria_response_check)).content
                 parser = JsonOutputParser()
                 criteria_result = parser.parse(response)
                 
@@ -668,16 +820,16 @@ async def handle_chat(request: ChatRequest):
                             break
                     if not combined_query:
                         combined_query = message
-                    combined_validation = validate_search_criteria(combined_query)
+                    combined_validation = await validate_search_criteria(combined_query)
                     
                     if combined_validation.get("is_sufficient", False):
 
-                        results = search_properties(context, combined_query, conversation_state)
+                        results = await search_properties(turn, combined_query)
                         
                         if results:
 
                             latest_property_results = results
-                            gpt_result = get_gpt_response(combined_query, results)
+                            gpt_result = await get_gpt_response(combined_query, results)
                             natural_text = gpt_result["text"]
                             prompt = f"""
                             system: You are a real estate agent who gives extremely brief responses. Never use more than 2-3 short sentences total.
@@ -688,7 +840,7 @@ async def handle_chat(request: ChatRequest):
                             assistant:
                             """
                             
-                            enhanced_response = llm.invoke(prompt).content.strip()
+                            enhanced_response = (await llm.ainvoke(prompt)).content.strip()
                             assistant_message = {
                                 "role": "assistant",
                                 "content": enhanced_response
@@ -706,7 +858,7 @@ async def handle_chat(request: ChatRequest):
                             assistant:
                             """
                             
-                            response_text = llm.invoke(no_results_prompt).content.strip()
+                            response_text = (await llm.ainvoke(no_results_prompt)).content.strip()
                             assistant_message = {
                                 "role": "assistant",
                                 "content": response_text
@@ -726,7 +878,7 @@ async def handle_chat(request: ChatRequest):
                         assistant: [Create a brief, helpful response (2 sentences) asking for the remaining missing information. Be specific but natural.]
                         """
                         
-                        response_text = llm.invoke(still_missing_prompt).content.strip()
+                        response_text = (await llm.ainvoke(still_missing_prompt)).content.strip()
                         assistant_message = {
                             "role": "assistant",
                             "content": response_text
@@ -743,16 +895,15 @@ async def handle_chat(request: ChatRequest):
             Return only "yes" or "no".
             """
 
-            wants_more = llm.invoke(
-                more_properties_check).content.strip().lower() == "yes"
+            wants_more = (await llm.ainvoke(more_properties_check)).content.strip().lower() == "yes"
 
             if wants_more:
-                results = search_properties(context, "more properties", conversation_state)
+                results = await search_properties(turn, "more properties")
                 filtered_results = results
 
                 if results:
 
-                    gpt_result = get_gpt_response(
+                    gpt_result = await get_gpt_response(
                         "Show me more properties", results)
                     natural_text = gpt_result["text"]
                     property_ids = gpt_result.get("property_ids", [])
@@ -769,7 +920,7 @@ async def handle_chat(request: ChatRequest):
                     
                     assistant:
                     """
-                    enhanced_response = llm.invoke(prompt).content.strip()
+                    enhanced_response = (await llm.ainvoke(prompt)).content.strip()
                     assistant_message = {
                         "role": "assistant",
                         "content": enhanced_response
@@ -787,8 +938,7 @@ async def handle_chat(request: ChatRequest):
                     assistant:
                     """
 
-                    response_text = llm.invoke(
-                        no_results_prompt).content.strip()
+                    response_text = (await llm.ainvoke(no_results_prompt)).content.strip()
                     assistant_message = {
                         "role": "assistant",
                         "content": response_text
@@ -813,7 +963,8 @@ async def handle_chat(request: ChatRequest):
                 assistant: [Respond very concisely (2-3 sentences maximum) about the properties. Answer their question directly and ask one brief follow-up.]
                 """
 
-                follow_up_response = llm.invoke(follow_up_prompt).content
+                with timed_stage("response_generation"):
+                    follow_up_response = (await llm.ainvoke(follow_up_prompt)).content
                 assistant_message = {
                     "role": "assistant",
                     "content": follow_up_response
@@ -843,7 +994,7 @@ async def handle_chat(request: ChatRequest):
             """
             
             try:
-                extracted_address = llm.invoke(address_extraction_prompt).content.strip()
+                extracted_address = (await llm.ainvoke(address_extraction_prompt)).content.strip()
                 logger.debug("Extracted address", address=extracted_address)
                 if not extracted_address or extracted_address.upper() == "NONE":
                     import re
@@ -856,12 +1007,12 @@ async def handle_chat(request: ChatRequest):
                 
                 if extracted_address and extracted_address.upper() != "NONE":
 
-                    coordinates = get_coordinates_from_address(extracted_address)
+                    coordinates = await get_coordinates_from_address(extracted_address, turn)
                     
                     if coordinates:
                         lat, lng = coordinates
                         poi_type = extract_poi_type_from_query(message)
-                        nearby_pois = find_nearby_pois((lat, lng), extracted_address, poi_type)
+                        nearby_pois = await find_nearby_pois((lat, lng), extracted_address, poi_type)
                         if poi_type == "all":
 
                             poi_groups = {}
@@ -913,15 +1064,17 @@ async def handle_chat(request: ChatRequest):
                             
                             if prop_address:
 
-                                prop_coordinates = get_coordinates_from_address(prop_address)
+                                prop_coordinates = precomputed_coordinates(prop) or await get_coordinates_from_address(prop_address, turn)
                                 
                                 if prop_coordinates:
                                     lat, lng = prop_coordinates
                                     try:
-                                        if poi_type == "schools":
-                                            nearby_pois = find_nearby_schools((lat, lng), prop_address)
+                                        if poi_type == "schools" and has_fresh_location(prop):
+                                            nearby_pois = prop.get("nearby_schools") or []
+                                        elif poi_type == "schools":
+                                            nearby_pois = await find_nearby_schools((lat, lng), prop_address)
                                         else:
-                                            nearby_pois = find_nearby_pois((lat, lng), prop_address, poi_type)
+                                            nearby_pois = await find_nearby_pois((lat, lng), prop_address, poi_type)
                                         
                                         response_parts.append(f"\n**{prop_name}** ({prop_address}):")
                                         
@@ -964,7 +1117,7 @@ async def handle_chat(request: ChatRequest):
             
             assistant: [Respond very concisely (2-3 sentences maximum) to this conversational query. Keep it focused on real estate and be helpful but brief.]
             """
-            response = llm.invoke(gpt_input).content
+            response = (await llm.ainvoke(gpt_input)).content
             assistant_message = {
                 "role": "assistant",
                 "content": response
@@ -990,7 +1143,7 @@ async def handle_chat(request: ChatRequest):
         """
 
         try:
-            response_text = llm.invoke(prompt).content.strip()
+            response_text = (await llm.ainvoke(prompt)).content.strip()
         except:
             response_text = "I'm sorry, I'm having trouble understanding. Could you rephrase your question about what you're looking for?"
         assistant_message = {
@@ -1,10 +1,17 @@
 
 from datetime import datetime, timezone
+from config.config import embedding_cache, geocode_cache, poi_index, poi_tile_cache, catalog_reloader, compressed_body_cache
 
 async def health_check():
     """Health check endpoint"""
     return {
         "status": "healthy",
         "timestamp": datetime.now(timezone.utc).isoformat(),
-        "version": "2.0.0"
+        "version": "2.0.0",
+        "catalog": catalog_reloader.stats(),
+        "embedding_cache": embedding_cache.stats(),
+        "geocode_cache": geocode_cache.stats(),
+        "poi_tile_cache": poi_tile_cache.stats(),
+        "poi_index": poi_index.stats(),
+        "compressed_body_cache": compressed_body_cache.stats()
     }
\ No newline at end of file
@@ -1,7 +1,53 @@
 
-from config.config import property_metadata, logger
+from config.config import get_catalog, logger
+from store import Catalog
 from utils import enhance_property_with_location_data
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
+import numpy as np
+
+
+def filter_listing_rows(
+    search: str = None,
+    price_min: float = None,
+    price_max: float = None,
+    bedrooms: int = None,
+    bathrooms: int = None,
+    location: str = None,
+    property_type: str = None,
+    transaction_type: str = None,
+    catalog: Catalog = None
+) -> np.ndarray:
+    """Select catalog rows for the listing filters with one fused boolean mask"""
+    index = (catalog or get_catalog()).attribute_index
+    mask = index.all()
+    
+    if price_min is not None:
+        mask &= index.for_sale & (index.sales_price >= price_min)
+    
+    if price_max is not None:
+        mask &= index.for_sale & (index.sales_price <= price_max)
+    
+    if bedrooms is not None:
+        mask &= index.equals(index.bedrooms, bedrooms)
+    
+    if bathrooms is not None:
+        mask &= index.equals(index.bathrooms, bathrooms)
+    
+    if property_type:
+        mask &= index.property_type_contains(property_type)
+    
+    if transaction_type:
+        if transaction_type.lower() == 'buy':
+            mask &= index.for_sale
+        elif transaction_type.lower() == 'rent':
+            mask &= ~index.for_sale
+    
+    rows = index.rows(mask)
+    if search:
+        rows = index.text_rows(rows, search)
+    if location:
+        rows = index.location_rows(rows, location)
+    return rows
 
 
 async def get_all_properties(
@@ -18,104 +64,38 @@ async def get_all_properties(
 ):
     """Get all properties with filtering and pagination"""
     try:
-
-        filtered_properties = list(property_metadata)
-        if search:
-            search_lower = search.lower()
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if (search_lower in prop.get('name', '').lower() or
-                    search_lower in prop.get('fullAddress', '').lower() or
-                    search_lower in prop.get('description', '').lower())
-            ]
-        
-        if price_min is not None:
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if prop.get('salesPrice') and float(prop.get('salesPrice', 0)) >= price_min
-            ]
-        
-        if price_max is not None:
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if prop.get('salesPrice') and float(prop.get('salesPrice', 0)) <= price_max
-            ]
-        
-        if bedrooms is not None:
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if prop.get('bedroomCount') == bedrooms
-            ]
-        
-        if bathrooms is not None:
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if prop.get('bathCount') == bathrooms
-            ]
-        
-        if location:
-            location_lower = location.lower()
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if (location_lower in prop.get('fullAddress', '').lower() or
-                    location_lower in (prop.get('city') or '').lower() or
-                    location_lower in (prop.get('neighborhood') or '').lower())
-            ]
-        
-        if property_type:
-            type_lower = property_type.lower()
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if type_lower in prop.get('propertyType', '').lower()
-            ]
-        
-        if transaction_type:
-            if transaction_type.lower() == 'buy':
-
-                filtered_properties = [
-                    prop for prop in filtered_properties
-                    if prop.get('salesPrice') is not None and prop.get('salesPrice') != 0
-                ]
-            elif transaction_type.lower() == 'rent':
-
-                filtered_properties = [
-                    prop for prop in filtered_properties
-                    if prop.get('salesPrice') is None or prop.get('salesPrice') == 0
-                ]
-        total = len(filtered_properties)
+        catalog = get_catalog()
+        rows = filter_listing_rows(
+            search=search,
+            price_min=price_min,
+            price_max=price_max,
+            bedrooms=bedrooms,
+            bathrooms=bathrooms,
+            location=location,
+            property_type=property_type,
+            transaction_type=transaction_type,
+            catalog=catalog
+        )
+        total = int(rows.size)
         total_pages = (total + limit - 1) // limit
         start_idx = (page - 1) * limit
         end_idx = start_idx + limit
-        paginated_properties = filtered_properties[start_idx:end_idx]
-        formatted_properties = []
-        for prop in paginated_properties:
-            formatted_prop = {
-                "id": prop.get("id", ""),
-                "name": prop.get("name", ""),
-                "description": prop.get("description", ""),
-                "salesPrice": prop.get("salesPrice"),
-                "fullAddress": prop.get("fullAddress", ""),
-                "location": prop.get("fullAddress", ""),
-                "bedroomCount": prop.get("bedroomCount"),
-                "bathCount": prop.get("bathCount"),
-                "squareFeet": prop.get("livingSpaceSize"),
-                "livingSpaceSize": prop.get("livingSpaceSize"),
-                "image": prop.get("media", []),
-                "media": prop.get("media", []),
-                "slug": prop.get("slug", "")
-            }
-            formatted_properties.append(formatted_prop)
-        
+        page_rows = rows[start_idx:end_idx]
+        pagination = {
+            "page": page,
+            "limit": limit,
+            "total": total,
+            "totalPages": total_pages,
+            "hasNext": page < total_pages,
+            "hasPrev": page > 1
+        }
+
+        projections = catalog.projections
+        if projections.serialized:
+            return Response(content=projections.listing_page_json(page_rows, pagination), media_type="application/json")
         return {
-            "properties": formatted_properties,
-            "pagination": {
-                "page": page,
-                "limit": limit,
-                "total": total,
-                "totalPages": total_pages,
-                "hasNext": page < total_pages,
-                "hasPrev": page > 1
-            }
+            "properties": [projections.cards[row] for row in page_rows],
+            "pagination": pagination
         }
         
     except Exception as e:
@@ -125,26 +105,22 @@ async def get_all_properties(
         raise HTTPException(status_code=500, detail="Internal server error")
 
 async def get_property_by_id(property_id: str):
-    """Get a specific property by its ID"""
+    """Get a specific property by its ID (or slug)"""
     try:
         logger.info("Property detail request", property_id=property_id)
-        property_detail = None
-        for prop in property_metadata:
-            if prop.get("id") == property_id:
-                property_detail = prop.copy()
-                break
+        catalog = get_catalog()
+        property_detail = catalog.lookup.get(property_id) or catalog.lookup.get_by_slug(property_id)
         
         if not property_detail:
             logger.warning("Property not found", property_id=property_id)
             raise HTTPException(status_code=404, detail=f"Property {property_id} not found")
-        excluded_keys = {"embedding", "seoDescription"}
-        cleaned_property = {
-            key: value for key, value in property_detail.items() 
-            if key not in excluded_keys
-        }
-        enhanced_property = enhance_property_with_location_data(cleaned_property)
+        projections = catalog.projections
+        row = projections.row(property_detail)
+        enhanced_property = await enhance_property_with_location_data(projections.details[row])
         
         logger.info("Property detail served successfully", property_id=property_id)
+        if projections.serialized:
+            return Response(content=projections.detail_json(row, enhanced_property), media_type="application/json")
         return enhanced_property
         
     except HTTPException:
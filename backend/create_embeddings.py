@@ -1,22 +1,61 @@
 #!/usr/bin/env python3
 """
 Script to create embeddings for properties using OpenAI API
+
+Properties are embedded in batches (``--batch-size`` texts per request) with
+up to ``--concurrency`` requests in flight over one pooled session; rate
+limits (429) and transient errors are retried with backoff. Each finished
+batch is appended to data_with_embeddings.checkpoint.jsonl, so rerunning an
+interrupted run only embeds what is left.
+
+Each vector is stored with ``embedding_hash``, a hash of its text and model.
+Properties whose hash matches the previous data_with_embeddings.json reuse
+that vector; ``--full`` re-embeds everything.
+
+Writes data_with_embeddings.json plus the split catalog parts the servers
+load from: listing records (data_with_embeddings.listings.json), embedding
+text blobs (.texts.json) and a float32 embedding sidecar
+(.embeddings.npy / .embeddings.json). ``--parts-only`` rebuilds just the
+parts from an existing data_with_embeddings.json. The parts are not
+committed; build them at deploy time (see the README).
+
+The input and output are streamed record by record, never loaded whole:
+either may be a JSON array or JSON Lines (``--input data.jsonl``,
+``--output data_with_embeddings.jsonl``). Vectors wait in the checkpoint
+file on disk until the output is written, so memory stays bounded by a few
+batches plus a hash and file offset per property.
 """
 
+import argparse
+import hashlib
 import json
 import os
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed, wait, FIRST_COMPLETED
 import requests
+from requests.adapters import HTTPAdapter
 from dotenv import load_dotenv
 from config.config import logger
+from store import (
+    CatalogPartsWriter, JsonRecordWriter, iter_json_records, part_paths, parts_manifest_path, rebuild_catalog_parts,
+    sidecar_paths
+)
 
 load_dotenv()
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
-EMBEDDING_URL = "https://api.openai.com/v1/embeddings"
+EMBEDDING_URL = os.getenv("EMBEDDING_URL", "https://api.openai.com/v1/embeddings")
+EMBEDDING_MODEL = "text-embedding-ada-002"
+INPUT_FILE = "data.json"
+OUTPUT_FILE = "data_with_embeddings.json"
 
-if not OPENAI_API_KEY:
-    logger.error("Error: OPENAI_API_KEY environment variable is required")
-    exit(1)
+BATCH_SIZE = 100
+CONCURRENCY = 4
+MAX_RETRIES = 6
+MAX_BACKOFF = 60
+REQUEST_TIMEOUT = 60
+RETRY_STATUSES = {429, 500, 502, 503, 504}
 
 def create_property_text(property_data):
     """Create comprehensive text representation for embedding"""
@@ -49,78 +88,304 @@ def create_property_text(property_data):
     
     return " ".join(text_parts)
 
-def create_embedding_with_curl(text, property_id):
-    """Create embedding using curl-like request"""
-    url = EMBEDDING_URL
-    
-    headers = {
+def create_session(concurrency):
+    """Pooled HTTP session shared by the batch workers"""
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=1, pool_maxsize=concurrency)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
         "Authorization": f"Bearer {OPENAI_API_KEY}",
         "Content-Type": "application/json"
-    }
-    
+    })
+    return session
+
+
+def retry_delay(response, attempt):
+    """Seconds to wait before retrying: Retry-After when the API sends it, else jittered backoff"""
+    if response is not None:
+        try:
+            return float(response.headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            pass
+    return min(MAX_BACKOFF, 2 ** attempt) * random.uniform(0.5, 1.0)
+
+
+def create_embeddings_batch(session, texts, property_ids):
+    """Embed a batch of texts in one request, retrying rate limits and transient errors"""
     data = {
-        "input": text,
-        "model": "text-embedding-ada-002"
+        "input": texts,
+        "model": EMBEDDING_MODEL
     }
-    
+
+    for attempt in range(MAX_RETRIES + 1):
+        response = None
+        try:
+            response = session.post(EMBEDDING_URL, json=data, timeout=REQUEST_TIMEOUT)
+            if response.status_code not in RETRY_STATUSES:
+                response.raise_for_status()
+                result = sorted(response.json()["data"], key=lambda item: item["index"])
+                logger.info("Created embeddings", first_property_id=property_ids[0], count=len(result))
+                return [item["embedding"] for item in result]
+            error = f"HTTP {response.status_code}"
+        except (requests.exceptions.ConnectionError, requests.exceptions.Timeout) as e:
+            error = str(e)
+        except requests.exceptions.RequestException as e:
+            logger.error("Error creating embeddings", first_property_id=property_ids[0], error=str(e))
+            return None
+
+        if attempt < MAX_RETRIES:
+            delay = retry_delay(response, attempt)
+            logger.warning("Retrying embedding batch", first_property_id=property_ids[0], error=error, delay=round(delay, 2))
+            time.sleep(delay)
+
+    logger.error("Giving up on embedding batch", first_property_id=property_ids[0], count=len(texts), error=error)
+    return None
+
+
+def checkpoint_path(output_file):
+    stem, _ = os.path.splitext(output_file)
+    return f"{stem}.checkpoint.jsonl"
+
+
+def content_hash(text, model=EMBEDDING_MODEL):
+    """Hash of the embedded text and the model that embedded it"""
+    return hashlib.sha256(f"{model}\n{text}".encode("utf-8")).hexdigest()
+
+
+class Checkpoint:
+    """Append-only JSON Lines spool of finished embeddings.
+
+    Only the byte offset of each property's line is kept in memory; vectors
+    are read back from disk one at a time when the output is written.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.offsets = {}
+        self._file = open(path, "a+b")
+
+    def load(self, property_hashes):
+        """Index entries from an earlier, interrupted run whose text and model still match"""
+        self._file.seek(0)
+        offset = 0
+        for line in self._file:
+            if not line.endswith(b"\n"):
+                # partial last line from a killed run
+                self._file.truncate(offset)
+                break
+            try:
+                entry = json.loads(line)
+            except json.JSONDecodeError:
+                entry = {}
+            if property_hashes.get(entry.get("id")) == entry.get("hash"):
+                self.offsets[entry["id"]] = offset
+            offset += len(line)
+        return len(self.offsets)
+
+    def append(self, entry):
+        self._file.seek(0, os.SEEK_END)
+        self.offsets[entry["id"]] = self._file.tell()
+        self._file.write(json.dumps(entry).encode("utf-8") + b"\n")
+
+    def flush(self):
+        self._file.flush()
+
+    def read(self, property_id):
+        offset = self.offsets.get(property_id)
+        if offset is None:
+            return None
+        self._file.seek(offset)
+        return json.loads(self._file.readline())
+
+    def __contains__(self, property_id):
+        return property_id in self.offsets
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def close(self):
+        self._file.close()
+
+
+def scan_catalog(input_file):
+    """Hash every property's embedding text in one streaming pass"""
+    property_hashes = {}
+    count = 0
+    for prop in iter_json_records(input_file):
+        property_hashes[prop.get("id")] = content_hash(create_property_text(prop))
+        count += 1
+    return property_hashes, count
+
+
+def reuse_previous_embeddings(output_file, property_hashes, checkpoint):
+    """Spool vectors from the last run's output whose hash is unchanged into the checkpoint.
+
+    Streams the previous output, so its vectors are never all in memory, and
+    returns the added/changed/removed/reused counts.
+    """
+    counts = {"added": 0, "changed": 0, "reused": 0, "removed": 0}
+    seen = set()
     try:
-        response = requests.post(url, headers=headers, json=data)
-        response.raise_for_status()
-        
-        result = response.json()
-        embedding = result["data"][0]["embedding"]
-        
-        logger.info("Created embedding", property_id=property_id, dimension=len(embedding))
-        return embedding
-        
-    except requests.exceptions.RequestException as e:
-        logger.error("Error creating embedding", property_id=property_id, error=str(e))
-        return None
+        for prop in iter_json_records(output_file):
+            property_id = prop.get("id")
+            if property_id not in property_hashes:
+                counts["removed"] += 1
+                continue
+            if not prop.get("embedding"):
+                continue
+            stored_hash = prop.get("embedding_hash")
+            if not stored_hash and "embedding_text" in prop:
+                stored_hash = content_hash(prop["embedding_text"], prop.get("embedding_model", EMBEDDING_MODEL))
+            seen.add(property_id)
+            if stored_hash != property_hashes[property_id]:
+                counts["changed"] += 1
+                continue
+            counts["reused"] += 1
+            if property_id not in checkpoint:
+                checkpoint.append({"id": property_id, "hash": stored_hash, "embedding": prop["embedding"]})
+    except FileNotFoundError:
+        pass
+    except json.JSONDecodeError as e:
+        logger.warning("Ignoring unreadable previous output", output_file=output_file, error=str(e))
+    counts["added"] = len(property_hashes) - len(seen)
+    checkpoint.flush()
+    return counts
+
+
+def iter_pending_batches(input_file, checkpoint, batch_size):
+    """Batches of ``(ids, texts)`` for the properties the checkpoint does not cover yet"""
+    ids, texts = [], []
+    for prop in iter_json_records(input_file):
+        if prop.get("id") in checkpoint:
+            continue
+        ids.append(prop.get("id"))
+        texts.append(create_property_text(prop))
+        if len(ids) == batch_size:
+            yield ids, texts
+            ids, texts = [], []
+    if ids:
+        yield ids, texts
+
+
+def embed_properties(input_file, property_hashes, checkpoint, batch_size, concurrency):
+    """Embed every property not in the checkpoint, appending each finished batch to it.
+
+    Batches are read from the input as requests complete, with at most
+    ``2 * concurrency`` in flight. Returns the number of properties whose
+    batch failed.
+    """
+    logger.info("Embedding properties", pending=len(property_hashes) - len(checkpoint), ready=len(checkpoint))
+
+    failed = 0
+    in_flight = {}
+
+    def collect(futures):
+        nonlocal failed
+        for future in futures:
+            ids = in_flight.pop(future)
+            embeddings = future.result()
+            if embeddings is None:
+                failed += len(ids)
+                continue
+            for property_id, embedding in zip(ids, embeddings):
+                checkpoint.append({"id": property_id, "hash": property_hashes[property_id], "embedding": embedding})
+            checkpoint.flush()
+            logger.info("Embedding progress", done=len(checkpoint), total=len(property_hashes))
+
+    with create_session(concurrency) as session, ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for ids, texts in iter_pending_batches(input_file, checkpoint, batch_size):
+            if len(in_flight) >= 2 * concurrency:
+                finished, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                collect(finished)
+            in_flight[pool.submit(create_embeddings_batch, session, texts, ids)] = ids
+        collect(list(as_completed(in_flight)))
+    return failed
+
+
+def write_outputs(input_file, output_file, count, checkpoint):
+    """Stream the catalog once more, attaching each vector, into the output file and its split parts"""
+    embedded_count = 0
+    # The output closes first, so the parts manifest stamps the new file
+    with CatalogPartsWriter(output_file, count, model=EMBEDDING_MODEL) as parts, \
+            JsonRecordWriter(output_file) as output:
+        for prop in iter_json_records(input_file):
+            entry = checkpoint.read(prop.get("id"))
+            if entry:
+                prop["embedding"] = entry["embedding"]
+                prop["embedding_text"] = create_property_text(prop)
+                prop["embedding_model"] = EMBEDDING_MODEL
+                prop["embedding_hash"] = entry["hash"]
+                embedded_count += 1
+            output.write(prop)
+            parts.add(prop)
+    logger.info("Saved properties with embeddings", count=count, output_file=output_file)
+    logger.info("Saved catalog parts", files=catalog_part_files(output_file))
+    return embedded_count
+
+
+def catalog_part_files(output_file):
+    return [*part_paths(output_file), parts_manifest_path(output_file), *sidecar_paths(output_file)]
+
+
+def rebuild_parts(output_file):
+    rebuild_catalog_parts(output_file, model=EMBEDDING_MODEL)
+    logger.info("Saved catalog parts", files=catalog_part_files(output_file))
+
 
 def main():
+    parser = argparse.ArgumentParser(description="Create property embeddings")
+    parser.add_argument("--input", default=INPUT_FILE, help="catalog to embed (JSON array or JSON Lines)")
+    parser.add_argument("--output", default=OUTPUT_FILE,
+                        help="catalog with embeddings; a .jsonl path writes JSON Lines")
+    parser.add_argument("--parts-only", "--sidecar-only", dest="parts_only", action="store_true",
+                        help="only rebuild the split catalog parts for the output file")
+    parser.add_argument("--batch-size", type=int, default=BATCH_SIZE, help="texts per embedding request")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="embedding requests in flight")
+    parser.add_argument("--full", action="store_true", help="re-embed everything instead of reusing the output file")
+    args = parser.parse_args()
+
+    if args.parts_only:
+        rebuild_parts(args.output)
+        return
+
+    if not OPENAI_API_KEY:
+        logger.error("Error: OPENAI_API_KEY environment variable is required")
+        exit(1)
+
     try:
-        with open("data.json", "r", encoding="utf-8") as file:
-            properties = json.load(file)
+        property_hashes, count = scan_catalog(args.input)
     except FileNotFoundError:
-        logger.error("Error: data.json file not found")
+        logger.error("Error: input file not found", input_file=args.input)
         return
     except json.JSONDecodeError as e:
-        logger.error("Error: Invalid JSON in data.json", error=str(e))
+        logger.error("Error: Invalid JSON in input file", input_file=args.input, error=str(e))
         return
     
-    logger.info("Processing properties", count=len(properties))
-    
-    properties_with_embeddings = []
-    
-    for prop in properties:
-        property_id = prop.get("id", "unknown")
-        logger.info("Processing property", property_id=property_id)
-        
-        property_text = create_property_text(prop)
-        logger.debug("Property text", text_preview=property_text[:100])
-        
-        embedding = create_embedding_with_curl(property_text, property_id)
-        
-        if embedding:
-            prop_with_embedding = prop.copy()
-            prop_with_embedding["embedding"] = embedding
-            prop_with_embedding["embedding_text"] = property_text
-            properties_with_embeddings.append(prop_with_embedding)
-        else:
-            properties_with_embeddings.append(prop)
-    
-    output_file = "data_with_embeddings.json"
+    logger.info("Processing properties", count=count)
+
+    checkpoint_file = checkpoint_path(args.output)
+    checkpoint = Checkpoint(checkpoint_file)
     try:
-        with open(output_file, "w", encoding="utf-8") as file:
-            json.dump(properties_with_embeddings, file, indent=2, ensure_ascii=False)
-        
-        logger.info("Saved properties with embeddings", count=len(properties_with_embeddings), output_file=output_file)
-        
-        embedded_count = sum(1 for p in properties_with_embeddings if "embedding" in p)
-        logger.info("Successfully created embeddings", embedded_count=embedded_count, total_count=len(properties))
-        
-    except Exception as e:
-        logger.error("Error saving embeddings", error=str(e))
+        checkpoint.load(property_hashes)
+        if not args.full:
+            counts = reuse_previous_embeddings(args.output, property_hashes, checkpoint)
+            logger.info("Embedding plan", **counts)
+        failed = embed_properties(args.input, property_hashes, checkpoint, args.batch_size, args.concurrency)
+
+        try:
+            embedded_count = write_outputs(args.input, args.output, count, checkpoint)
+            logger.info("Successfully created embeddings", embedded_count=embedded_count, total_count=count)
+        except Exception as e:
+            logger.error("Error saving embeddings", error=str(e))
+            return
+    finally:
+        checkpoint.close()
+
+    if failed:
+        logger.warning("Some embeddings failed; rerun to resume", failed_count=failed, checkpoint=checkpoint_file)
+    elif os.path.exists(checkpoint_file):
+        os.remove(checkpoint_file)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
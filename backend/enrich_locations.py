@@ -0,0 +1,147 @@
+#!/usr/bin/env python3
+"""
+Precompute coordinates and neighborhood data for every catalog listing
+
+Runs after create_embeddings.py and writes the locations part next to the
+catalog (data_with_embeddings.locations.json): for each listing id, its
+``coordinates``, ``nearby_schools`` and ``nearby_attractions`` plus the
+normalized address and time they were computed for. The servers merge the
+part into the listings when they load the catalog (a running server picks
+it up on its next reload), and property detail views serve it without any
+network calls until it is older than LOCATION_DATA_MAX_AGE_DAYS.
+
+Listings are grouped by normalized address, so the units of one building
+share a lookup. Entries from the previous run are reused while their
+address is unchanged and they are younger than ``--max-age-days``
+(``--full`` recomputes everything). Addresses are geocoded through the
+geocode cache at Nominatim's one request per second; Overpass lookups run
+``--concurrency`` addresses at a time in geohash order, so neighbouring
+addresses are answered from one combined query per POI tile.
+An address whose geocoding or Overpass query fails is left out; the
+servers fetch it at request time and the next run tries again.
+"""
+
+import argparse
+import asyncio
+import time
+from dotenv import load_dotenv
+from config.config import DATA_FILE, LOCATION_DATA_MAX_AGE, geocode_cache, poi_tile_cache, logger
+from store import JsonRecordWriter, iter_json_records, load_locations, location_entry, locations_path, normalize_address
+from geocode_catalog import NOMINATIM_DELAY, prewarm
+from utils.location import fetch_neighborhood
+from utils.neighborhood import select_schools, select_attractions
+
+load_dotenv()
+
+CONCURRENCY = 2
+
+
+def group_by_address(input_file):
+    """Listing ids by normalized address, with the first spelling of each address"""
+    groups = {}
+    for record in iter_json_records(input_file):
+        address = record.get("fullAddress")
+        if address:
+            group = groups.setdefault(normalize_address(address), {"address": address, "ids": []})
+            group["ids"].append(str(record.get("id")))
+    return groups
+
+
+def reusable_entries(groups, previous, max_age):
+    """Previous entries still valid for their address, one per normalized address"""
+    now = time.time()
+    reusable = {}
+    for key, group in groups.items():
+        for listing_id in group["ids"]:
+            entry = previous.get(listing_id)
+            if entry and entry.get("address") == key and now - entry.get("updated_at", 0) < max_age:
+                reusable[key] = entry
+                break
+    return reusable
+
+
+async def fetch_location_data(address, coords, semaphore):
+    """Location fields of one geocoded address, or None when Overpass fails"""
+    async with semaphore:
+        try:
+            places = await fetch_neighborhood(coords)
+        except Exception as e:
+            logger.warning("Neighborhood query failed", address=address, error=str(e))
+            return None
+    return {
+        "coordinates": {"lat": coords[0], "lng": coords[1]},
+        "nearby_schools": select_schools(places, coords),
+        "nearby_attractions": select_attractions(places, coords)
+    }
+
+
+async def enrich(groups, pending, concurrency):
+    """Location entries for the pending addresses, keyed by normalized address"""
+    semaphore = asyncio.Semaphore(concurrency)
+    located = {}
+    for key in pending:
+        found, coords = geocode_cache.lookup(groups[key]["address"])
+        if coords:
+            located[key] = coords
+    # Neighbours in a row share a POI tile while it is still cached
+    tasks = {}
+    for key in sorted(located, key=lambda key: poi_tile_cache.tile(located[key])):
+        tasks[key] = asyncio.create_task(fetch_location_data(groups[key]["address"], located[key], semaphore))
+
+    entries = {}
+    for done, key in enumerate(tasks, 1):
+        location_data = await tasks[key]
+        if location_data is not None:
+            entries[key] = location_entry(groups[key]["address"], location_data)
+        if done % 25 == 0:
+            logger.info("Enrichment progress", done=done, total=len(tasks))
+    return entries
+
+
+def write_locations(data_file, groups, entries):
+    """Write the locations part, one entry per listing id; returns how many listings have one"""
+    count = 0
+    with JsonRecordWriter(locations_path(data_file), keyed=True) as writer:
+        for key, group in groups.items():
+            entry = entries.get(key)
+            if entry is None:
+                continue
+            for listing_id in group["ids"]:
+                writer.write(entry, key=listing_id)
+                count += 1
+    return count
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Precompute listing coordinates and neighborhood data")
+    parser.add_argument("--input", default=DATA_FILE, help="catalog to enrich (JSON array or JSON Lines)")
+    parser.add_argument("--concurrency", type=int, default=CONCURRENCY, help="addresses queried on Overpass at once")
+    parser.add_argument("--delay", type=float, default=NOMINATIM_DELAY, help="seconds between geocoder requests")
+    parser.add_argument("--max-age-days", type=float, default=LOCATION_DATA_MAX_AGE / 86400,
+                        help="recompute entries older than this")
+    parser.add_argument("--full", action="store_true", help="recompute every listing instead of reusing the previous run")
+    args = parser.parse_args()
+
+    try:
+        groups = group_by_address(args.input)
+    except FileNotFoundError:
+        logger.error("Error: input file not found", input_file=args.input)
+        return
+
+    previous = {} if args.full else load_locations(args.input)
+    entries = reusable_entries(groups, previous, args.max_age_days * 86400)
+    pending = [key for key in groups if key not in entries]
+    logger.info("Enrichment plan", addresses=len(groups), reused=len(entries), pending=len(pending))
+
+    counts = prewarm([groups[key]["address"] for key in pending], geocode_cache, args.delay)
+    logger.info("Geocoded pending addresses", **counts)
+    entries.update(asyncio.run(enrich(groups, pending, args.concurrency)))
+
+    count = write_locations(args.input, groups, entries)
+    missing = sum(len(group["ids"]) for key, group in groups.items() if key not in entries)
+    logger.info("Saved location part", listings=count, missing=missing, output_file=locations_path(args.input))
+    logger.info("POI tile cache", **poi_tile_cache.stats())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Geocode every catalog address ahead of time into the geocode cache
+
+Reads the catalog record by record (JSON array or JSON Lines), takes one
+address per normalized key (units of the same building share one lookup)
+and geocodes the ones the cache has no fresh answer for. Requests are
+spaced ``--delay`` seconds apart, one at a time, to stay within
+Nominatim's usage policy of one request per second. Addresses Nominatim
+cannot place are cached as misses; errors are skipped and retried on the
+next run.
+
+The servers read the same SQLite file (GEOCODE_CACHE_PATH), so detail
+views and location questions start with warm coordinates. For the Vercel
+functions, copy the file to api/_lib/geocodes.sqlite3 before deploying.
+"""
+
+import argparse
+import time
+from dotenv import load_dotenv
+from config.config import DATA_FILE, GEOCODE_CACHE_PATH, geocode_cache, geolocator, logger
+from store import GeocodeCache, iter_json_records, normalize_address
+
+load_dotenv()
+
+NOMINATIM_DELAY = 1.0
+PROGRESS_EVERY = 50
+
+
+def catalog_addresses(input_file):
+    """Distinct catalog addresses, the first spelling seen for each normalized key"""
+    addresses = {}
+    for record in iter_json_records(input_file):
+        address = record.get("fullAddress")
+        if address:
+            addresses.setdefault(normalize_address(address), address)
+    return list(addresses.values())
+
+
+def prewarm(addresses, cache, delay=NOMINATIM_DELAY, retry_misses=False, refresh=False):
+    """Geocode the addresses the cache cannot answer; returns counts by outcome"""
+    counts = {"cached": 0, "found": 0, "not_found": 0, "errors": 0}
+    last_request = 0.0
+    for number, address in enumerate(addresses, 1):
+        if not refresh:
+            found, coords = cache.lookup(address)
+            if found and (coords is not None or not retry_misses):
+                counts["cached"] += 1
+                continue
+
+        wait = last_request + delay - time.monotonic()
+        if wait > 0:
+            time.sleep(wait)
+        last_request = time.monotonic()
+        try:
+            location = geolocator.geocode(address, timeout=10)
+        except Exception as e:
+            counts["errors"] += 1
+            logger.warning("Geocoding failed", address=address, error=str(e))
+            continue
+        coords = cache.put(address, (location.latitude, location.longitude) if location else None)
+        counts["found" if coords else "not_found"] += 1
+
+        if number % PROGRESS_EVERY == 0:
+            logger.info("Geocoding progress", done=number, total=len(addresses), **counts)
+    return counts
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Geocode catalog addresses into the geocode cache")
+    parser.add_argument("--input", default=DATA_FILE, help="catalog to read addresses from (JSON array or JSON Lines)")
+    parser.add_argument("--cache", default=GEOCODE_CACHE_PATH, help="SQLite geocode cache to fill")
+    parser.add_argument("--delay", type=float, default=NOMINATIM_DELAY, help="seconds between geocoder requests")
+    parser.add_argument("--retry-misses", action="store_true", help="geocode cached misses again")
+    parser.add_argument("--refresh", action="store_true", help="geocode every address, ignoring the cache")
+    args = parser.parse_args()
+
+    if not args.cache:
+        logger.error("Error: a cache file is required (--cache or GEOCODE_CACHE_PATH)")
+        exit(1)
+    cache = GeocodeCache(args.cache, ttl=geocode_cache.ttl, negative_ttl=geocode_cache.negative_ttl)
+    if cache.read_only or not cache.stats()["persistent"]:
+        logger.error("Error: geocode cache is not writable", cache=args.cache)
+        exit(1)
+
+    try:
+        addresses = catalog_addresses(args.input)
+    except FileNotFoundError:
+        logger.error("Error: input file not found", input_file=args.input)
+        return
+    logger.info("Geocoding catalog addresses", count=len(addresses), cache=args.cache)
+
+    counts = prewarm(addresses, cache, args.delay, args.retry_misses, args.refresh)
+    logger.info("Geocode cache warmed", expired_removed=cache.prune(), **counts)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Build the offline POI index from OpenStreetMap extracts
+
+Reads one or more extracts of the markets we list in, either .osm.pbf files
+(Geofabrik, BBBike) or Overpass JSON dumps (``[out:json]`` with ``out center
+tags``), keeps the elements the neighborhood query would select and writes
+them to a SQLite file with an R-tree over their coordinates (POI_INDEX_PATH).
+The servers answer school, attraction and POI lookups from it, and send
+only points outside the ingested areas to Overpass.
+
+Each extract also records the box it covers: the bounding box in a PBF
+header, or ``--bbox`` for a dump (an Overpass dump does not carry one, so
+without it the extent of its elements is used, which can fall short of the
+area that was actually queried). Ways are placed at the center of their
+bounding box, as Overpass's ``out center`` does. Reading PBF files needs
+the osmium package (pip install osmium), which computes way centers from
+node locations; school relations are only available from JSON dumps.
+
+The file is rebuilt from scratch on every run and replaced atomically;
+restart the servers to load it. For the Vercel functions, copy it to
+api/_lib/pois.sqlite3 before deploying.
+"""
+
+import argparse
+import json
+from dotenv import load_dotenv
+from config.config import POI_INDEX_PATH, logger
+from store.poi_index import PoiIndexWriter
+from utils.neighborhood import KEPT_TAGS, in_neighborhood_query, parse_places
+
+try:
+    import osmium
+except ImportError:  # Only needed for .pbf extracts
+    osmium = None
+
+load_dotenv()
+
+
+def _kept(tags):
+    return {key: tags[key] for key in KEPT_TAGS if key in tags}
+
+
+def read_overpass_dump(path):
+    """Places from an Overpass JSON dump"""
+    with open(path, "r", encoding="utf-8") as file:
+        data = json.load(file)
+    return [place for place in parse_places(data) if in_neighborhood_query(place[0], place[3])]
+
+
+def extent(places):
+    """``(south, west, north, east)`` of a list of places"""
+    lats = [place[1] for place in places]
+    lngs = [place[2] for place in places]
+    return min(lats), min(lngs), max(lats), max(lngs)
+
+
+def read_pbf(path):
+    """Places from a .osm.pbf extract and the box its header declares (or None)"""
+    if osmium is None:
+        raise RuntimeError("Reading .pbf extracts requires the osmium package (pip install osmium)")
+
+    places = []
+
+    class Handler(osmium.SimpleHandler):
+        def node(self, node):
+            tags = dict(node.tags)
+            if tags and in_neighborhood_query("node", tags) and node.location.valid():
+                places.append(("node", node.location.lat, node.location.lon, _kept(tags)))
+
+        def way(self, way):
+            tags = dict(way.tags)
+            if not tags or not in_neighborhood_query("way", tags):
+                return
+            locations = [node.location for node in way.nodes if node.location.valid()]
+            if locations:
+                lats = [location.lat for location in locations]
+                lngs = [location.lon for location in locations]
+                places.append(("way", (min(lats) + max(lats)) / 2, (min(lngs) + max(lngs)) / 2, _kept(tags)))
+
+    Handler().apply_file(path, locations=True)
+
+    reader = osmium.io.Reader(path, osmium.osm.osm_entity_bits.NOTHING)
+    box = reader.header().box()
+    reader.close()
+    bbox = (box.bottom_left.lat, box.bottom_left.lon, box.top_right.lat, box.top_right.lon) if box.valid() else None
+    return places, bbox
+
+
+def parse_bbox(value):
+    south, west, north, east = (float(part) for part in value.split(","))
+    if south >= north or west >= east:
+        raise argparse.ArgumentTypeError("bbox must be south,west,north,east")
+    return south, west, north, east
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build the offline POI index from OpenStreetMap extracts")
+    parser.add_argument("extracts", nargs="+", help=".osm.pbf files or Overpass JSON dumps")
+    parser.add_argument("--output", default=POI_INDEX_PATH, help="SQLite POI index to write")
+    parser.add_argument("--bbox", type=parse_bbox, action="append", default=[],
+                        help="south,west,north,east covered by the extract at the same position")
+    args = parser.parse_args()
+
+    if not args.output:
+        logger.error("Error: an output file is required (--output or POI_INDEX_PATH)")
+        exit(1)
+
+    with PoiIndexWriter(args.output) as writer:
+        for number, path in enumerate(args.extracts):
+            try:
+                if path.endswith(".pbf"):
+                    places, bbox = read_pbf(path)
+                else:
+                    places, bbox = read_overpass_dump(path), None
+            except FileNotFoundError:
+                logger.error("Error: extract not found", extract=path)
+                exit(1)
+            except RuntimeError as e:
+                logger.error(f"Error: {e}", extract=path)
+                exit(1)
+
+            if number < len(args.bbox):
+                bbox = args.bbox[number]
+            elif bbox is None and places:
+                bbox = extent(places)
+                logger.warning("No bbox given; using the extent of the extract's elements", extract=path, bbox=bbox)
+
+            writer.add(places)
+            if bbox is not None:
+                writer.add_coverage(bbox)
+            logger.info("Ingested extract", extract=path, places=len(places), bbox=bbox)
+
+    logger.info("Saved POI index", places=writer.count, coverage_boxes=len(writer.coverage), output_file=args.output)
+
+
+if __name__ == "__main__":
+    main()
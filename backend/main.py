@@ -6,8 +6,14 @@ from route.chat import router as chat_router
 from route.properties import router as properties_router
 from route.session import router as session_router
 from route.health import router as health_router
+from route.admin import router as admin_router
+from utils.responses import CompressionMiddleware
 
-from config.config import logger
+from config.config import (
+    logger, catalog_reloader, CATALOG_WATCH_INTERVAL,
+    COMPRESS_RESPONSES, COMPRESSION_MIN_SIZE, compressed_body_cache
+)
+import asyncio
 load_dotenv()
 
 gmaps = None
@@ -15,7 +21,12 @@ gmaps = None
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Real Estate AI Assistant")
+    watcher = None
+    if CATALOG_WATCH_INTERVAL > 0:
+        watcher = asyncio.create_task(catalog_reloader.watch(CATALOG_WATCH_INTERVAL, logger))
     yield
+    if watcher:
+        watcher.cancel()
     logger.info("Shutting down Real Estate AI Assistant")
 
 app = FastAPI(
@@ -33,6 +44,15 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if COMPRESS_RESPONSES:
+    # Listing pages repeat per catalog version, so their compressed bodies are cached
+    app.add_middleware(
+        CompressionMiddleware,
+        min_size=COMPRESSION_MIN_SIZE,
+        cache=compressed_body_cache,
+        cache_paths=("/properties",)
+    )
+
 
 
 
@@ -40,6 +60,7 @@ app.include_router(chat_router)
 app.include_router(properties_router)
 app.include_router(session_router)
 app.include_router(health_router)
+app.include_router(admin_router)
 
 
 if __name__ == "__main__":
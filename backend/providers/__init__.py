@@ -0,0 +1,62 @@
+# Chat and embedding model providers, selected with LLM_PROVIDER.
+#
+# "openai" (default) uses the OpenAI models through langchain. "fake" uses the
+# deterministic offline models in providers/fake.py, configured with:
+#   FAKE_LLM_LATENCY / FAKE_EMBEDDING_LATENCY  latency spec, e.g. lognormal:250,0.5
+#   FAKE_LATENCY_SEED                          seed for the latency distributions
+#   FAKE_EMBEDDING_DIMENSION                   embedding size (default 1536, matching the catalog)
+#   FAKE_LLM_BLOCKING                          sleep synchronously, like a blocking client would
+import os
+
+from .fake import FakeChatModel, FakeEmbeddings, LatencyModel, fake_completion, message_features
+
+PROVIDERS = ("openai", "fake")
+
+
+def get_provider_name() -> str:
+    provider = os.getenv("LLM_PROVIDER", "openai").strip().lower()
+    if provider not in PROVIDERS:
+        raise ValueError(f"Unknown LLM_PROVIDER {provider!r}, expected one of {', '.join(PROVIDERS)}")
+    return provider
+
+
+def _fake_blocking() -> bool:
+    return os.getenv("FAKE_LLM_BLOCKING", "").lower() in ("1", "true", "yes")
+
+
+def _latency(variable: str) -> LatencyModel:
+    return LatencyModel.parse(os.getenv(variable), seed=int(os.getenv("FAKE_LATENCY_SEED", 0)))
+
+
+def create_llm(provider: str, api_key: str = None):
+    """Build the chat model for ``provider``"""
+    if provider == "fake":
+        return FakeChatModel(_latency("FAKE_LLM_LATENCY"), blocking=_fake_blocking())
+    from langchain_openai import ChatOpenAI
+    return ChatOpenAI(temperature=0, model_name="gpt-4o", api_key=api_key)
+
+
+def create_embeddings_model(provider: str, model: str, api_key: str = None):
+    """Build the embeddings model for ``provider``"""
+    if provider == "fake":
+        return FakeEmbeddings(
+            model,
+            dimension=int(os.getenv("FAKE_EMBEDDING_DIMENSION", 1536)),
+            latency=_latency("FAKE_EMBEDDING_LATENCY"),
+            blocking=_fake_blocking(),
+        )
+    from langchain_openai import OpenAIEmbeddings
+    return OpenAIEmbeddings(model=model, api_key=api_key)
+
+
+__all__ = [
+    "PROVIDERS",
+    "get_provider_name",
+    "create_llm",
+    "create_embeddings_model",
+    "FakeChatModel",
+    "FakeEmbeddings",
+    "LatencyModel",
+    "fake_completion",
+    "message_features",
+]
@@ -0,0 +1,298 @@
+from typing import Any, Dict, List, Optional
+import asyncio
+import hashlib
+import json
+import re
+import time
+
+import numpy as np
+from langchain_core.messages import AIMessage
+
+
+class LatencyModel:
+    """Injected per-call latency, sampled from a seeded distribution.
+
+    Specs are ``<kind>:<params in ms>``:
+
+    - ``fixed:200``
+    - ``uniform:100,400``
+    - ``normal:250,50`` (mean, std; clipped at zero)
+    - ``lognormal:250,0.5`` (median, sigma)
+
+    Each call seeds its own generator from the request text, so the same
+    prompt always waits the same time regardless of call order.
+    """
+
+    KINDS = ("fixed", "uniform", "normal", "lognormal")
+
+    def __init__(self, kind: str = "fixed", params: Optional[List[float]] = None, seed: int = 0):
+        if kind not in self.KINDS:
+            raise ValueError(f"Unknown latency distribution {kind!r}, expected one of {', '.join(self.KINDS)}")
+        self.kind = kind
+        self.params = list(params or [0.0])
+        self.seed = seed
+
+    @classmethod
+    def parse(cls, spec: Optional[str], seed: int = 0) -> "LatencyModel":
+        if not spec:
+            return cls(seed=seed)
+        kind, _, raw = spec.partition(":")
+        if not raw:
+            kind, raw = "fixed", kind
+        params = [float(value) for value in raw.split(",") if value.strip()]
+        return cls(kind.strip().lower(), params, seed)
+
+    def sample(self, key: str = "") -> float:
+        """Latency in seconds for the call identified by ``key``"""
+        if self.kind == "fixed":
+            return max(self.params[0], 0.0) / 1000
+        rng = np.random.default_rng([self.seed, _digest(key)])
+        if self.kind == "uniform":
+            low, high = self.params[0], self.params[1] if len(self.params) > 1 else self.params[0]
+            ms = rng.uniform(low, high)
+        elif self.kind == "normal":
+            std = self.params[1] if len(self.params) > 1 else 0.0
+            ms = rng.normal(self.params[0], std)
+        else:
+            sigma = self.params[1] if len(self.params) > 1 else 0.5
+            ms = self.params[0] * rng.lognormal(0.0, sigma)
+        return max(ms, 0.0) / 1000
+
+    def __repr__(self):
+        return f"{self.kind}:{','.join(f'{p:g}' for p in self.params)}"
+
+
+def _digest(text: str) -> int:
+    return int.from_bytes(hashlib.sha1(text.encode("utf-8")).digest()[:8], "little")
+
+
+BUY_WORDS = ("buy", "purchase", "for sale", "buying", "invest")
+RENT_WORDS = ("rent", "rental", "lease", "renting", "monthly")
+PROPERTY_TYPES = (
+    ("studio", "studio"), ("townhouse", "townhouse"), ("condo", "condo"),
+    ("apartment", "apartment"), ("apt", "apartment"), ("house", "house"), ("home", "house"),
+)
+TOUR_WORDS = ("yes", "sure", "love", "of course", "tour", "visit", "schedule", "see it", "ok")
+MORE_WORDS = ("more", "other", "another", "else", "new listings", "different")
+
+_MESSAGE_PATTERNS = (
+    re.compile(r'Current message: (.*)'),
+    re.compile(r'property search query: "(.*)"'),
+    re.compile(r'Analyze this message: "(.*)"'),
+    re.compile(r'from this message: "(.*)"'),
+    re.compile(r'User Query: (.*)'),
+    re.compile(r'^\s*user: (.*)$', re.MULTILINE),
+)
+_NUMBER = r'\$?\s*(\d[\d,]*(?:\.\d+)?)\s*(k|m|million)?\b'
+_PROPERTY_NAME = re.compile(r"(?:interested in|i like|i love)\s+(?:the\s+)?(.+)", re.IGNORECASE)
+_TOUR_DETAILS = re.compile(r"\d{1,2}\s*(?:am|pm)\b|\b\d{1,2}:\d{2}\b|@|\bmy name is\b|\b(?:january|february|march|april|may|june|july|august|september|october|november|december)\b", re.IGNORECASE)
+_LOCATION = re.compile(r"\b(?:in|near|around|at|close to)\s+([A-Z0-9][\w'.-]*(?:\s+[A-Z][\w'.-]*)*)")
+
+
+def _user_message(prompt: str) -> str:
+    for pattern in _MESSAGE_PATTERNS:
+        match = pattern.search(prompt)
+        if match:
+            return match.group(1).strip()
+    return prompt.strip()
+
+
+def _amount(number: str, suffix: Optional[str]) -> float:
+    value = float(number.replace(",", ""))
+    if suffix:
+        value *= 1_000 if suffix.lower() == "k" else 1_000_000
+    return int(value) if value.is_integer() else value
+
+
+def message_features(message: str) -> Dict[str, Any]:
+    """Rule-based stand-in for what the extraction prompts ask the model to find"""
+    lower = message.lower()
+    features: Dict[str, Any] = {
+        "transaction_type": None, "property_type": None, "bedrooms": None, "bathrooms": None,
+        "location": None, "min_price": None, "max_price": None, "size": None,
+        "schools_important": "school" in lower,
+        "amenities_important": any(word in lower for word in ("park", "shopping", "restaurant", "amenit")),
+    }
+    if any(word in lower for word in BUY_WORDS):
+        features["transaction_type"] = "buy"
+    elif any(word in lower for word in RENT_WORDS):
+        features["transaction_type"] = "rent"
+
+    for keyword, property_type in PROPERTY_TYPES:
+        if keyword in lower:
+            features["property_type"] = property_type
+            break
+    if features["property_type"] == "studio":
+        features["bedrooms"] = 0
+
+    bedrooms = re.search(r'(\d+)\s*-?\s*(?:bed|br\b)', lower)
+    if bedrooms:
+        features["bedrooms"] = int(bedrooms.group(1))
+    bathrooms = re.search(r'(\d+)\s*-?\s*(?:bath|ba\b)', lower)
+    if bathrooms:
+        features["bathrooms"] = int(bathrooms.group(1))
+    size = re.search(r'(\d[\d,]*)\s*(?:sq\.?\s*ft|square feet)', lower)
+    if size:
+        features["size"] = size.group(0)
+
+    price_range = re.search(rf'(?:between|from)\s+{_NUMBER}\s*(?:and|to|-)\s*{_NUMBER}', lower)
+    if price_range:
+        features["min_price"] = _amount(price_range.group(1), price_range.group(2))
+        features["max_price"] = _amount(price_range.group(3), price_range.group(4))
+    else:
+        upper = re.search(rf'(?:under|below|less than|up to|max(?:imum)?|budget of)\s+{_NUMBER}', lower)
+        if upper:
+            features["max_price"] = _amount(upper.group(1), upper.group(2))
+        floor = re.search(rf'(?:over|above|more than|at least|min(?:imum)?)\s+{_NUMBER}', lower)
+        if floor:
+            features["min_price"] = _amount(floor.group(1), floor.group(2))
+
+    location = _LOCATION.search(message)
+    if location:
+        features["location"] = location.group(1).strip(" .,?!")
+    return features
+
+
+def _classify_intent(message: str) -> str:
+    lower = message.lower()
+    if any(phrase in lower for phrase in ("not interested", "don't like", "do not like", "no thanks")):
+        return "PROPERTY_REJECTION"
+    if any(phrase in lower for phrase in ("interested in", "i like", "i love", "sounds great")):
+        return "PROPERTY_INTEREST"
+    if any(phrase in lower for phrase in ("tell me more", "which one", "the first", "the second", "the third", "more about")):
+        return "FOLLOWUP_QUERY"
+    if _TOUR_DETAILS.search(message):
+        # Dates, times, names and emails answer the tour-booking questions
+        return "FOLLOWUP_QUERY"
+    if any(phrase in lower for phrase in ("looking for a place", "looking to move", "help me find")):
+        return "INITIAL_INQUIRY"
+    return "CONVERSATIONAL_QUERY"
+
+
+def fake_completion(prompt: str) -> str:
+    """Deterministic reply to one of the prompts the chat pipeline sends"""
+    message = _user_message(prompt)
+    features = message_features(message)
+
+    if "Extract filters that can be used in a property search interface" in prompt:
+        return json.dumps({
+            "transaction_type": features["transaction_type"],
+            "property_type": features["property_type"],
+            "bedrooms": features["bedrooms"],
+            "bathrooms": features["bathrooms"],
+            "location": features["location"],
+            "price_min": features["min_price"],
+            "price_max": features["max_price"],
+        })
+    if "Extract any mentioned preferences" in prompt:
+        return json.dumps({key: features[key] for key in (
+            "transaction_type", "location", "property_type", "bedrooms", "min_price",
+            "max_price", "size", "schools_important", "amenities_important",
+        )})
+    if "Analyze this property search query" in prompt:
+        checks = {
+            "has_transaction_type": features["transaction_type"] is not None,
+            "has_location": features["location"] is not None,
+            "has_property_type": features["property_type"] is not None,
+            "has_bedrooms": features["bedrooms"] is not None,
+            "has_price": features["min_price"] is not None or features["max_price"] is not None,
+            "has_size": features["size"] is not None,
+        }
+        score = sum(checks.values())
+        missing = [name for name, key in (
+            ("transaction_type", "has_transaction_type"), ("location", "has_location"),
+            ("bedrooms", "has_bedrooms"), ("price", "has_price"),
+        ) if not checks[key]]
+        return json.dumps({
+            **checks,
+            "specificity_score": score,
+            "missing_criteria": missing,
+            "is_sufficient": checks["has_transaction_type"] and score >= 3,
+        })
+    if "Classify this query into EXACTLY ONE" in prompt:
+        intent = _classify_intent(message)
+        named = _PROPERTY_NAME.search(message) if intent == "PROPERTY_INTEREST" else None
+        return json.dumps({
+            "intent": intent,
+            "transaction_type": features["transaction_type"] or "unknown",
+            "property_name": named.group(1).strip(" .,!?") if named else "",
+        })
+    if "is_criteria_response" in prompt:
+        has_criteria = any(features[key] is not None for key in (
+            "transaction_type", "location", "property_type", "bedrooms", "min_price", "max_price",
+        ))
+        return json.dumps({"is_criteria_response": has_criteria, "appears_complete": has_criteria})
+    if 'Return only "yes" or "no"' in prompt:
+        words = MORE_WORDS if "more property options" in prompt else TOUR_WORDS
+        return "yes" if any(word in message.lower() for word in words) else "no"
+    if "Extract the address, location, or landmark" in prompt:
+        return features["location"] or "NONE"
+    return "Here are a few options that match what you're looking for. Would you like to schedule a tour of any of them?"
+
+
+class FakeChatModel:
+    """Offline stand-in for ``ChatOpenAI`` with deterministic replies and injected latency"""
+
+    def __init__(self, latency: Optional[LatencyModel] = None, blocking: bool = False):
+        self.latency = latency or LatencyModel()
+        self.blocking = blocking
+
+    @staticmethod
+    def _prompt_text(prompt) -> str:
+        if isinstance(prompt, str):
+            return prompt
+        return "\n".join(getattr(message, "content", str(message)) for message in prompt)
+
+    def invoke(self, prompt, **kwargs) -> AIMessage:
+        text = self._prompt_text(prompt)
+        time.sleep(self.latency.sample(text))
+        return AIMessage(content=fake_completion(text))
+
+    async def ainvoke(self, prompt, **kwargs) -> AIMessage:
+        text = self._prompt_text(prompt)
+        delay = self.latency.sample(text)
+        if self.blocking:
+            time.sleep(delay)
+        else:
+            await asyncio.sleep(delay)
+        return AIMessage(content=fake_completion(text))
+
+
+class FakeEmbeddings:
+    """Offline stand-in for ``OpenAIEmbeddings``: hash-seeded unit vectors with injected latency"""
+
+    def __init__(self, model: str = "fake", dimension: int = 1536,
+                 latency: Optional[LatencyModel] = None, blocking: bool = False):
+        self.model = model
+        self.dimension = dimension
+        self.latency = latency or LatencyModel()
+        self.blocking = blocking
+
+    def vector(self, text: str) -> List[float]:
+        rng = np.random.default_rng(_digest(f"{self.model}\n{text}"))
+        vector = rng.standard_normal(self.dimension)
+        return (vector / np.linalg.norm(vector)).tolist()
+
+    def embed_query(self, text: str) -> List[float]:
+        time.sleep(self.latency.sample(text))
+        return self.vector(text)
+
+    def embed_documents(self, texts: List[str]) -> List[List[float]]:
+        time.sleep(self.latency.sample("\n".join(texts)))
+        return [self.vector(text) for text in texts]
+
+    async def aembed_query(self, text: str) -> List[float]:
+        delay = self.latency.sample(text)
+        if self.blocking:
+            time.sleep(delay)
+        else:
+            await asyncio.sleep(delay)
+        return self.vector(text)
+
+    async def aembed_documents(self, texts: List[str]) -> List[List[float]]:
+        delay = self.latency.sample("\n".join(texts))
+        if self.blocking:
+            time.sleep(delay)
+        else:
+            await asyncio.sleep(delay)
+        return [self.vector(text) for text in texts]
@@ -0,0 +1,9 @@
+from fastapi import APIRouter, Header
+from controller.admin import reload_catalog
+from utils.responses import json_response
+
+router = APIRouter()
+
+@router.post("/admin/reload-catalog")
+async def reload_catalog_endpoint(force: bool = False, x_admin_token: str = Header(None)):
+    return json_response(await reload_catalog(x_admin_token, force=force))
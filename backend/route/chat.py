@@ -1,9 +1,10 @@
 from fastapi import APIRouter
 from controller.chat import handle_chat
 from schema.chat import ChatRequest
+from utils.responses import json_response
 
 router = APIRouter()
 
 @router.post("/chat")
 async def chat_endpoint(request: ChatRequest):
-    return await handle_chat(request)
+    return json_response(await handle_chat(request))
@@ -1,8 +1,9 @@
 from fastapi import APIRouter
 from controller.health import health_check
+from utils.responses import json_response
 
 router = APIRouter()
 
 @router.get("/health")
 async def health_check_endpoint():
-    return await health_check()
+    return json_response(await health_check())
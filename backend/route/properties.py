@@ -1,5 +1,6 @@
 from fastapi import APIRouter
 from controller.properties import get_all_properties, get_property_by_id
+from utils.responses import json_response
 
 router = APIRouter()
 
@@ -16,7 +17,7 @@ async def properties_endpoint(
     property_type: str = None,
     transaction_type: str = None
 ):
-    return await get_all_properties(
+    return json_response(await get_all_properties(
         page=page,
         limit=limit,
         search=search,
@@ -27,8 +28,8 @@ async def properties_endpoint(
         location=location,
         property_type=property_type,
         transaction_type=transaction_type
-    )
+    ))
 
 @router.get("/properties/{property_id}")
 async def property_by_id_endpoint(property_id: str):
-    return await get_property_by_id(property_id)
+    return json_response(await get_property_by_id(property_id))
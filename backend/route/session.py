@@ -1,8 +1,9 @@
 from fastapi import APIRouter
 from controller.session import clear_session
+from utils.responses import json_response
 
 router = APIRouter()
 
 @router.post("/clear-session")
 async def clear_session_endpoint(request: dict):
-    return await clear_session(request)
+    return json_response(await clear_session(request))
@@ -0,0 +1,75 @@
+# Property catalog parts and the in-memory search structures built from them
+from .vector_store import VectorStore
+from .attribute_index import AttributeIndex
+from .lookup import CatalogLookup
+from .embedding_cache import QueryEmbeddingCache
+from .geocode_cache import GeocodeCache, normalize_address
+from .poi_index import PoiIndex, PoiIndexWriter
+from .poi_tiles import PoiTileCache
+from .records import PropertyRecord, build_records
+from .fastjson import response_body
+from .compression import CompressedBodyCache, encode_body, negotiate_encoding
+from .projections import Projections, card_projection, detail_projection, encode_json
+from .jsonstream import iter_json_records, JsonRecordWriter
+from .locations import location_entry, location_is_fresh, load_locations, locations_path, precomputed_coordinates
+from .embedding_file import (
+    EmbeddingSidecarWriter,
+    sidecar_paths,
+    write_embedding_sidecar,
+    load_embedding_sidecar
+)
+from .catalog import (
+    Catalog,
+    CatalogPartsWriter,
+    catalog_version,
+    part_paths,
+    parts_are_current,
+    parts_manifest_path,
+    listing_record,
+    rebuild_catalog_parts,
+    write_catalog_parts
+)
+from .reload import CatalogReloader
+
+__all__ = [
+    'VectorStore',
+    'AttributeIndex',
+    'CatalogLookup',
+    'QueryEmbeddingCache',
+    'GeocodeCache',
+    'normalize_address',
+    'PoiIndex',
+    'PoiIndexWriter',
+    'PoiTileCache',
+    'PropertyRecord',
+    'build_records',
+    'response_body',
+    'CompressedBodyCache',
+    'encode_body',
+    'negotiate_encoding',
+    'Projections',
+    'card_projection',
+    'detail_projection',
+    'encode_json',
+    'iter_json_records',
+    'JsonRecordWriter',
+    'location_entry',
+    'location_is_fresh',
+    'load_locations',
+    'locations_path',
+    'precomputed_coordinates',
+    'EmbeddingSidecarWriter',
+    'sidecar_paths',
+    'write_embedding_sidecar',
+    'load_embedding_sidecar',
+    'Catalog',
+    'CatalogPartsWriter',
+    'catalog_version',
+    'part_paths',
+    'parts_are_current',
+    'parts_manifest_path',
+    'listing_record',
+    'rebuild_catalog_parts',
+    'write_catalog_parts',
+    'CatalogReloader',
+]
@@ -0,0 +1,120 @@
+from collections import OrderedDict
+from typing import Dict, Any, Optional
+import hashlib
+import sqlite3
+import threading
+import time
+import numpy as np
+
+
+class QueryEmbeddingCache:
+    """Bounded LRU cache of query embeddings keyed by a stable content hash.
+
+    Keys are the SHA-1 of the embedding model name and the normalized query
+    text, so they are identical across processes and restarts. When ``path`` is
+    given, entries are also kept in a SQLite file that other workers and later
+    runs read through on a memory miss.
+    """
+
+    def __init__(self, model_name: str, max_entries: int = 1000, path: Optional[str] = None,
+                 max_disk_entries: int = 100_000):
+        self.model_name = model_name
+        self.max_entries = max_entries
+        self.max_disk_entries = max_disk_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._writes_since_prune = 0
+        if path:
+            self._db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            self._db.execute("PRAGMA journal_mode=WAL")
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS query_embeddings ("
+                "key TEXT PRIMARY KEY, embedding BLOB NOT NULL, last_used REAL NOT NULL)")
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS query_embeddings_last_used ON query_embeddings (last_used)")
+            self._db.commit()
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """Case- and whitespace-insensitive form of a query"""
+        return " ".join(text.lower().split())
+
+    def key(self, text: str) -> str:
+        """Stable cache key for a query under this cache's model"""
+        payload = f"{self.model_name}\n{self.normalize(text)}".encode("utf-8")
+        return hashlib.sha1(payload).hexdigest()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, text: str) -> Optional[np.ndarray]:
+        """Cached embedding for ``text``, or None on a miss"""
+        key = self.key(text)
+        with self._lock:
+            embedding = self._entries.get(key)
+            if embedding is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return embedding
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT embedding FROM query_embeddings WHERE key = ?", (key,)).fetchone()
+                if row is not None:
+                    embedding = np.frombuffer(row[0], dtype=np.float32)
+                    self._db.execute(
+                        "UPDATE query_embeddings SET last_used = ? WHERE key = ?", (time.time(), key))
+                    self._db.commit()
+                    self._remember(key, embedding)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return embedding
+
+            self.misses += 1
+            return None
+
+    def put(self, text: str, embedding) -> np.ndarray:
+        """Store the embedding for ``text`` and return it as a float32 array"""
+        key = self.key(text)
+        embedding = np.asarray(embedding, dtype=np.float32)
+        with self._lock:
+            self._remember(key, embedding)
+            if self._db is not None:
+                self._db.execute(
+                    "INSERT OR REPLACE INTO query_embeddings (key, embedding, last_used) VALUES (?, ?, ?)",
+                    (key, embedding.tobytes(), time.time()))
+                self._writes_since_prune += 1
+                if self._writes_since_prune >= 100:
+                    self._prune_disk()
+                self._db.commit()
+        return embedding
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._entries),
+            "max_entries": self.max_entries,
+            "persistent": self._db is not None,
+        }
+
+    def _remember(self, key: str, embedding: np.ndarray):
+        self._entries[key] = embedding
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _prune_disk(self):
+        self._writes_since_prune = 0
+        self._db.execute(
+            "DELETE FROM query_embeddings WHERE key IN ("
+            "SELECT key FROM query_embeddings ORDER BY last_used DESC LIMIT -1 OFFSET ?)",
+            (self.max_disk_entries,))
@@ -0,0 +1,170 @@
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Tuple
+import re
+import sqlite3
+import threading
+import time
+
+Coordinates = Tuple[float, float]
+
+DEFAULT_TTL = 90 * 24 * 3600
+# Misses are retried sooner: the address may be fixed or Nominatim may learn it
+DEFAULT_NEGATIVE_TTL = 24 * 3600
+
+# "Apt 4B", "Unit 12", "Suite 300", "#5", "Floor 2": a unit word followed by a
+# number or single letter, so "Floor Ave" or "Suite Rd" stay street names.
+# Bare "fl" is left out: it is Florida in "Miami, FL 33101"
+_UNIT = re.compile(
+    r"(?:\b(?:apt|apartment|unit|ste|suite|floor|rm|room|ph|bldg|building)\b\.?\s*#?\s*|#\s*)"
+    r"(?:\w*\d[\w-]*|[a-z]\b)")
+_PUNCTUATION = re.compile(r"[^\w\s,]")
+_ABBREVIATIONS = {
+    "street": "st", "avenue": "ave", "boulevard": "blvd", "road": "rd", "drive": "dr",
+    "place": "pl", "lane": "ln", "court": "ct", "terrace": "ter", "parkway": "pkwy",
+    "highway": "hwy", "square": "sq", "east": "e", "west": "w", "north": "n", "south": "s",
+}
+
+
+def normalize_address(address: str) -> str:
+    """Cache key form of an address: case, punctuation, spacing and unit suffixes ignored.
+
+    "350 West 50th Street, Apt 4B, New York, NY" and
+    "350 W. 50th St., New York, NY" share one key, since every unit in a
+    building geocodes to the same point.
+    """
+    text = _UNIT.sub(" ", address.lower())
+    text = _PUNCTUATION.sub(" ", text)
+    parts = []
+    for part in text.split(","):
+        words = [_ABBREVIATIONS.get(word, word) for word in part.split()]
+        if words:
+            parts.append(" ".join(words))
+    return ", ".join(parts)
+
+
+class GeocodeCache:
+    """Durable address -> coordinates cache in front of the geocoder.
+
+    Keys are ``normalize_address`` forms. Found coordinates live for ``ttl``
+    seconds and addresses the geocoder could not place for ``negative_ttl``,
+    so a bad address costs one lookup a day instead of one per request.
+    Geocoder errors (timeouts, rate limits) are not cached at all. With
+    ``path`` the entries are kept in a SQLite file shared by workers and
+    restarts; a file that cannot be written (a read-only deployment bundle)
+    is still read.
+    """
+
+    def __init__(self, path: Optional[str] = None, ttl: float = DEFAULT_TTL,
+                 negative_ttl: float = DEFAULT_NEGATIVE_TTL, max_entries: int = 10_000):
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self.hits = 0
+        self.disk_hits = 0
+        self.negative_hits = 0
+        self.misses = 0
+        self.read_only = False
+        self._entries: "OrderedDict[str, Tuple[Optional[Coordinates], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        if path:
+            self._db = self._connect(path)
+
+    def _connect(self, path: str):
+        try:
+            db = sqlite3.connect(path, timeout=5, check_same_thread=False)
+            db.execute("PRAGMA journal_mode=WAL")
+            db.execute(
+                "CREATE TABLE IF NOT EXISTS geocodes ("
+                "key TEXT PRIMARY KEY, lat REAL, lng REAL, expires_at REAL NOT NULL)")
+            db.commit()
+            return db
+        except sqlite3.Error:
+            pass
+        try:
+            db = sqlite3.connect(f"file:{path}?mode=ro", uri=True, timeout=5, check_same_thread=False)
+            db.execute("SELECT 1 FROM geocodes LIMIT 1")
+            self.read_only = True
+            return db
+        except sqlite3.Error:
+            return None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def lookup(self, address: str) -> Tuple[bool, Optional[Coordinates]]:
+        """``(found, coordinates)``; coordinates are None for a cached miss"""
+        key = normalize_address(address)
+        now = time.time()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[1] > now:
+                self._entries.move_to_end(key)
+                return True, self._count_hit(entry[0])
+
+            if self._db is not None:
+                row = self._db.execute(
+                    "SELECT lat, lng, expires_at FROM geocodes WHERE key = ? AND expires_at > ?",
+                    (key, now)).fetchone()
+                if row is not None:
+                    coords = (row[0], row[1]) if row[0] is not None else None
+                    self._remember(key, coords, row[2])
+                    self.disk_hits += 1
+                    return True, self._count_hit(coords)
+
+            self.misses += 1
+            return False, None
+
+    def put(self, address: str, coords: Optional[Coordinates]) -> Optional[Coordinates]:
+        """Cache a geocoder answer for ``address``; None records that it found nothing"""
+        key = normalize_address(address)
+        if coords is not None:
+            coords = (float(coords[0]), float(coords[1]))
+        expires_at = time.time() + (self.ttl if coords is not None else self.negative_ttl)
+        with self._lock:
+            self._remember(key, coords, expires_at)
+            if self._db is not None and not self.read_only:
+                lat, lng = coords if coords is not None else (None, None)
+                try:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO geocodes (key, lat, lng, expires_at) VALUES (?, ?, ?, ?)",
+                        (key, lat, lng, expires_at))
+                    self._db.commit()
+                except sqlite3.Error:
+                    self.read_only = True
+        return coords
+
+    def prune(self) -> int:
+        """Drop expired rows from the SQLite file; returns how many were removed"""
+        if self._db is None or self.read_only:
+            return 0
+        with self._lock:
+            removed = self._db.execute("DELETE FROM geocodes WHERE expires_at <= ?", (time.time(),)).rowcount
+            self._db.commit()
+        return removed
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters for this process"""
+        lookups = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "negative_hits": self.negative_hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+            "size": len(self._entries),
+            "persistent": self._db is not None,
+            "read_only": self.read_only,
+        }
+
+    def _count_hit(self, coords: Optional[Coordinates]) -> Optional[Coordinates]:
+        self.hits += 1
+        if coords is None:
+            self.negative_hits += 1
+        return coords
+
+    def _remember(self, key: str, coords: Optional[Coordinates], expires_at: float):
+        self._entries[key] = (coords, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,52 @@
+from typing import List, Dict, Any, Optional
+
+
+def _key(value) -> Optional[str]:
+    """Lowercased lookup key, or None for missing / non-string values"""
+    if isinstance(value, str):
+        return value.lower()
+    return None
+
+
+class CatalogLookup:
+    """Constant-time lookup tables for catalog properties by id, name, address and slug.
+
+    When several properties share a key the first one in catalog order wins,
+    matching the behaviour of the linear scans these tables replace.
+    """
+
+    def __init__(self, properties: List[Dict[str, Any]]):
+        self.by_id: Dict[Any, Dict[str, Any]] = {}
+        self.by_name: Dict[str, Dict[str, Any]] = {}
+        self.by_address: Dict[str, Dict[str, Any]] = {}
+        self.by_slug: Dict[str, Dict[str, Any]] = {}
+
+        for prop in properties:
+            property_id = prop.get("id")
+            if property_id is not None:
+                self.by_id.setdefault(property_id, prop)
+
+            name = _key(prop.get("name"))
+            if name is not None:
+                self.by_name.setdefault(name, prop)
+
+            address = _key(prop.get("fullAddress"))
+            if address is not None:
+                self.by_address.setdefault(address, prop)
+
+            slug = _key(prop.get("slug"))
+            if slug:
+                self.by_slug.setdefault(slug, prop)
+
+    def get(self, property_id) -> Optional[Dict[str, Any]]:
+        """Property by id"""
+        return self.by_id.get(property_id)
+
+    def get_by_slug(self, slug: str) -> Optional[Dict[str, Any]]:
+        """Property by slug (case-insensitive)"""
+        return self.by_slug.get(slug.lower())
+
+    def find_by_name(self, name: str) -> Optional[Dict[str, Any]]:
+        """Property whose name, or failing that full address, equals ``name`` (case-insensitive)"""
+        key = name.lower()
+        return self.by_name.get(key) or self.by_address.get(key)
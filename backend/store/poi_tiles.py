@@ -0,0 +1,126 @@
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+import math
+import threading
+import time
+
+_BASE32 = "0123456789bcdefghjkmnpqrstuvwxyz"
+_DECODE = {char: index for index, char in enumerate(_BASE32)}
+EARTH_RADIUS_M = 6_371_008.8
+# Slack for the gap between Overpass's spherical distances and the geodesic
+# ones the classifiers use
+COVERING_MARGIN_M = 50
+
+
+def geohash_encode(lat: float, lng: float, precision: int) -> str:
+    """Geohash of a point, ``precision`` characters long"""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    code, bits, value, even = [], 0, 0, True
+    while len(code) < precision:
+        bounds, coordinate = (lng_range, lng) if even else (lat_range, lat)
+        middle = (bounds[0] + bounds[1]) / 2
+        value <<= 1
+        if coordinate >= middle:
+            value |= 1
+            bounds[0] = middle
+        else:
+            bounds[1] = middle
+        even = not even
+        bits += 1
+        if bits == 5:
+            code.append(_BASE32[value])
+            bits, value = 0, 0
+    return "".join(code)
+
+
+def geohash_bounds(code: str) -> Tuple[float, float, float, float]:
+    """``(south, west, north, east)`` of a geohash cell"""
+    lat_range, lng_range = [-90.0, 90.0], [-180.0, 180.0]
+    even = True
+    for char in code:
+        value = _DECODE[char]
+        for shift in range(4, -1, -1):
+            bounds = lng_range if even else lat_range
+            middle = (bounds[0] + bounds[1]) / 2
+            if value >> shift & 1:
+                bounds[0] = middle
+            else:
+                bounds[1] = middle
+            even = not even
+    return lat_range[0], lng_range[0], lat_range[1], lng_range[1]
+
+
+def haversine_m(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    """Great-circle distance in meters"""
+    lat1, lng1, lat2, lng2 = map(math.radians, (a[0], a[1], b[0], b[1]))
+    h = math.sin((lat2 - lat1) / 2) ** 2 + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    return 2 * EARTH_RADIUS_M * math.asin(math.sqrt(h))
+
+
+class PoiTileCache:
+    """Neighborhood query answers stored per geohash cell and shared by every point in it.
+
+    A cell's entry is fetched once around the cell center at a covering
+    radius, the search radius plus the center-to-corner distance, so it
+    holds everything within the search radius of any point in the cell.
+    Properties on the same block therefore share one Overpass query, and
+    callers filter the places by their own distance. Entries expire after
+    ``ttl`` seconds; the least recently used cells are dropped past
+    ``max_tiles``. Hits and misses are counted for the health endpoint.
+    """
+
+    def __init__(self, precision: int = 6, max_tiles: int = 128, ttl: float = 24 * 3600):
+        self.precision = precision
+        self.max_tiles = max_tiles
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.fetches = 0
+        self._tiles: "OrderedDict[str, Tuple[List[Any], float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def tile(self, coords: Tuple[float, float]) -> str:
+        """Key of the cell containing a point"""
+        return geohash_encode(coords[0], coords[1], self.precision)
+
+    def covering_circle(self, tile: str, radius: float) -> Tuple[float, float, int]:
+        """``(lat, lng, radius_m)`` of the query that serves ``radius`` searches from anywhere in the cell"""
+        south, west, north, east = geohash_bounds(tile)
+        center = ((south + north) / 2, (west + east) / 2)
+        # The corner nearer the equator is the farthest from the center
+        corner = (south if abs(south) < abs(north) else north, east)
+        return center[0], center[1], int(math.ceil(radius + haversine_m(center, corner) + COVERING_MARGIN_M))
+
+    def get(self, tile: str) -> Optional[List[Any]]:
+        """Cached places of a cell, or None when it has to be fetched"""
+        with self._lock:
+            entry = self._tiles.get(tile)
+            if entry is not None and entry[1] > time.time():
+                self._tiles.move_to_end(tile)
+                self.hits += 1
+                return entry[0]
+            self.misses += 1
+            return None
+
+    def put(self, tile: str, places: List[Any]) -> List[Any]:
+        """Store a freshly fetched cell"""
+        with self._lock:
+            self.fetches += 1
+            self._tiles[tile] = (places, time.time() + self.ttl)
+            self._tiles.move_to_end(tile)
+            while len(self._tiles) > self.max_tiles:
+                self._tiles.popitem(last=False)
+        return places
+
+    def stats(self) -> Dict[str, Any]:
+        lookups = self.hits + self.misses
+        return {
+            "tiles": len(self._tiles),
+            "precision": self.precision,
+            "hits": self.hits,
+            "misses": self.misses,
+            "fetches": self.fetches,
+            # Lookups answered without a query of their own, counting the
+            # ones that waited on another lookup's fetch of the same cell
+            "hit_rate": round(1 - self.fetches / lookups, 4) if lookups else 0.0,
+        }
@@ -0,0 +1,107 @@
+from typing import List, Dict, Any, Optional
+import numpy as np
+
+from .fastjson import dumps
+
+# Fields never sent to clients; location_updated_at is the locations part's
+# freshness stamp (store.locations.UPDATED_FIELD)
+PRIVATE_FIELDS = frozenset(("embedding", "seoDescription", "location_updated_at"))
+# Detail fields the location enrichment may replace at request time
+LOCATION_FIELDS = ("coordinates", "nearby_schools", "nearby_attractions")
+
+
+def encode_json(data) -> bytes:
+    """Compact UTF-8 JSON for the pre-serialized fragments"""
+    return dumps(data)
+
+
+def card_projection(prop) -> Dict[str, Any]:
+    """Fields the /properties listing page shows for one property"""
+    return {
+        "id": prop.get("id", ""),
+        "name": prop.get("name", ""),
+        "description": prop.get("description", ""),
+        "salesPrice": prop.get("salesPrice"),
+        "fullAddress": prop.get("fullAddress", ""),
+        "location": prop.get("fullAddress", ""),
+        "bedroomCount": prop.get("bedroomCount"),
+        "bathCount": prop.get("bathCount"),
+        "squareFeet": prop.get("livingSpaceSize"),
+        "livingSpaceSize": prop.get("livingSpaceSize"),
+        "image": prop.get("media", []),
+        "media": prop.get("media", []),
+        "slug": prop.get("slug", "")
+    }
+
+
+def detail_projection(prop) -> Dict[str, Any]:
+    """Every public field of one property, as detail and search responses return it"""
+    return {key: value for key, value in prop.items() if key not in PRIVATE_FIELDS}
+
+
+def splice_object(head: bytes, fields: Dict[str, Any]) -> bytes:
+    """Append ``fields`` to a serialized object whose closing brace was cut off"""
+    if not fields:
+        return head + b"}"
+    tail = encode_json(fields)
+    return head + (b"," if len(head) > 1 else b"") + tail[1:]
+
+
+class Projections:
+    """Public views of each catalog row, built once per catalog load.
+
+    ``cards[row]`` is the listing-page card and ``details[row]`` the detail
+    view. These dicts are shared, so callers that hand one to code which may
+    modify it should copy it first. With ``serialize=True`` the cards and
+    the detail views (minus the location fields enrichment fills in) are
+    also kept as JSON bytes, so handlers can splice responses together
+    without encoding listings again.
+    """
+
+    def __init__(self, properties: List[Any], serialize: bool = False):
+        self.cards = [card_projection(prop) for prop in properties]
+        self.details = [detail_projection(prop) for prop in properties]
+        self.row_of: Dict[Any, int] = {}
+        for row, prop in enumerate(properties):
+            self.row_of.setdefault(prop.get("id"), row)
+
+        self.serialized = serialize
+        self.card_json: Optional[List[bytes]] = None
+        self.detail_head: Optional[List[bytes]] = None
+        if serialize:
+            self.card_json = [encode_json(card) for card in self.cards]
+            self.detail_head = [
+                encode_json({key: value for key, value in detail.items() if key not in LOCATION_FIELDS})[:-1]
+                for detail in self.details
+            ]
+
+    def __len__(self) -> int:
+        return len(self.cards)
+
+    def row(self, prop) -> Optional[int]:
+        """Catalog row of a property record"""
+        return self.row_of.get(prop.get("id"))
+
+    def detail(self, prop) -> Dict[str, Any]:
+        """Fresh copy of the detail view of a property record"""
+        row = self.row(prop)
+        return dict(self.details[row]) if row is not None else detail_projection(prop)
+
+    def listing_page_json(self, rows, pagination: Dict[str, Any]) -> bytes:
+        """A /properties response body spliced from the serialized cards"""
+        # A single join over plain ints: indexing with NumPy scalars and
+        # copying large intermediate bytes would cost more than encoding saves
+        card_json = self.card_json
+        parts = [b'{"properties":[']
+        for row in np.asarray(rows).tolist():
+            parts += (card_json[row], b",")
+        if len(parts) > 1:
+            parts.pop()
+        parts += (b'],"pagination":', encode_json(pagination), b"}")
+        return b"".join(parts)
+
+    def detail_json(self, row: int, location: Dict[str, Any]) -> bytes:
+        """A detail response body: the serialized view plus the current location fields"""
+        fields = {key: self.details[row][key] for key in LOCATION_FIELDS if key in self.details[row]}
+        fields.update({key: location[key] for key in LOCATION_FIELDS if key in location})
+        return splice_object(self.detail_head[row], fields)
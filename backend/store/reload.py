@@ -0,0 +1,84 @@
+from typing import Dict, Any, Optional
+import asyncio
+import os
+import threading
+import time
+
+from .catalog import Catalog, catalog_version, part_paths, parts_are_current, rebuild_catalog_parts
+
+
+class CatalogReloader:
+    """Holds the live catalog and swaps in rebuilt ones without a restart.
+
+    Requests take ``current`` once and keep using that snapshot, so a reload
+    never changes the data under a request that is already running. A reload
+    builds the new catalog and all of its indexes first, then replaces the
+    reference in one assignment; if building fails the old catalog stays live.
+    Split parts left behind by an edited ``data_file`` are rebuilt from it
+    first, so the new catalog serves the new data.
+    """
+
+    def __init__(self, data_file: str, preserialize: bool = False):
+        self.data_file = str(data_file)
+        self.preserialize = preserialize
+        self.current = Catalog(self.data_file, preserialize=preserialize)
+        self.reloads = 0
+        self.last_reload_at: Optional[float] = None
+        self.last_error: Optional[str] = None
+        self._lock = threading.Lock()
+
+    def is_stale(self) -> bool:
+        """True when the files on disk no longer match the live catalog"""
+        return catalog_version(self.data_file) != self.current.version
+
+    def reload(self, force: bool = False) -> Catalog:
+        """Build a fresh catalog from ``data_file`` and swap it in; returns the live catalog"""
+        with self._lock:
+            if not force and not self.is_stale():
+                return self.current
+            try:
+                if os.path.exists(part_paths(self.data_file)[0]) and not parts_are_current(self.data_file):
+                    rebuild_catalog_parts(self.data_file)
+                catalog = Catalog(self.data_file, preserialize=self.preserialize).warm()
+            except Exception as e:
+                self.last_error = str(e)
+                raise
+            self.current = catalog
+            self.reloads += 1
+            self.last_reload_at = time.time()
+            self.last_error = None
+            return catalog
+
+    async def areload(self, force: bool = False) -> Catalog:
+        """``reload`` on a worker thread, so the event loop keeps serving the old catalog meanwhile"""
+        return await asyncio.to_thread(self.reload, force)
+
+    async def watch(self, interval: float, logger=None) -> None:
+        """Poll the catalog files and reload once a changed version has stayed put for one interval"""
+        pending = None
+        while True:
+            await asyncio.sleep(interval)
+            version = catalog_version(self.data_file)
+            if version == self.current.version:
+                pending = None
+                continue
+            if version != pending:
+                # Still being written: wait for the files to settle
+                pending = version
+                continue
+            try:
+                catalog = await self.areload()
+                if logger:
+                    logger.info("Catalog reloaded", version=catalog.version)
+            except Exception as e:
+                if logger:
+                    logger.error("Catalog reload failed", error=str(e))
+            pending = None
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            **self.current.stats(),
+            "reloads": self.reloads,
+            "last_reload_at": self.last_reload_at,
+            "last_error": self.last_error,
+        }
@@ -0,0 +1,38 @@
+import os
+import shutil
+import sys
+
+import pytest
+
+BACKEND_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, BACKEND_DIR)
+
+# No API keys, no shared cache files and no network lookups
+os.environ["LLM_PROVIDER"] = "fake"
+os.environ["GEOCODE_CACHE_PATH"] = ""
+os.environ["POI_INDEX_PATH"] = ""
+os.environ["COMPRESS_RESPONSES"] = "false"
+
+
+@pytest.fixture
+def catalog_file(tmp_path):
+    """A copy of the bundled catalog with freshly built parts; returns the data file path"""
+    from store import rebuild_catalog_parts
+
+    data_file = str(tmp_path / "data_with_embeddings.json")
+    shutil.copy(os.path.join(BACKEND_DIR, "data_with_embeddings.json"), data_file)
+    rebuild_catalog_parts(data_file)
+    return data_file
+
+
+@pytest.fixture
+def client(catalog_file, monkeypatch):
+    """A TestClient whose live catalog is ``catalog_file``"""
+    from fastapi.testclient import TestClient
+    from config.config import catalog_reloader
+    from store import Catalog
+    from main import app
+
+    monkeypatch.setattr(catalog_reloader, "data_file", catalog_file)
+    monkeypatch.setattr(catalog_reloader, "current", Catalog(catalog_file))
+    return TestClient(app)
@@ -0,0 +1,16 @@
+import os
+
+import pytest
+
+from store import CatalogPartsWriter, part_paths, sidecar_paths
+
+
+def test_aborted_parts_build_leaves_no_temporary_files(tmp_path):
+    data_file = str(tmp_path / "catalog.json")
+    with pytest.raises(RuntimeError):
+        with CatalogPartsWriter(data_file, 2) as writer:
+            writer.add({"id": "a", "embedding": [1.0, 0.0], "embedding_text": "a"})
+            raise RuntimeError("embedding batch failed")
+
+    assert os.listdir(tmp_path) == []
+    assert not any(os.path.exists(path) for path in (*part_paths(data_file), *sidecar_paths(data_file)))
@@ -0,0 +1,48 @@
+import json
+
+import pytest
+
+from config.config import catalog_reloader
+from store import Catalog, parts_are_current
+
+
+async def _unchanged(prop):
+    return prop
+
+
+@pytest.fixture
+def admin(monkeypatch):
+    monkeypatch.setattr("controller.admin.ADMIN_TOKEN", "secret")
+    monkeypatch.setattr("controller.properties.enhance_property_with_location_data", _unchanged)
+    return {"X-Admin-Token": "secret"}
+
+
+def _rename_first_listing(catalog_file, name):
+    with open(catalog_file, "r", encoding="utf-8") as file:
+        records = json.load(file)
+    records[0]["name"] = name
+    with open(catalog_file, "w", encoding="utf-8") as file:
+        json.dump(records, file)
+    return records[0]["id"]
+
+
+def test_catalog_ignores_parts_built_from_older_data_file(catalog_file):
+    assert Catalog(catalog_file).is_split
+    _rename_first_listing(catalog_file, "Renamed listing")
+
+    catalog = Catalog(catalog_file)
+    assert not catalog.is_split
+    assert catalog.listings[0]["name"] == "Renamed listing"
+
+
+def test_reload_serves_edited_data_file(client, catalog_file, admin):
+    listing_id = _rename_first_listing(catalog_file, "Renamed listing")
+
+    response = client.post("/admin/reload-catalog", headers=admin)
+    assert response.status_code == 200
+    assert response.json()["status"] == "reloaded"
+
+    assert client.get(f"/properties/{listing_id}").json()["name"] == "Renamed listing"
+    # The stale parts were rebuilt, and the new catalog reads them
+    assert parts_are_current(catalog_file)
+    assert catalog_reloader.current.is_split
@@ -0,0 +1,47 @@
+import pytest
+
+CLARIFICATION = "Are you looking to buy or to rent?"
+
+
+@pytest.fixture
+def clarification(monkeypatch):
+    """Answer clarification turns with a fixed question"""
+    async def fixed_clarification(message, conversation_state):
+        return CLARIFICATION
+    monkeypatch.setattr("controller.chat.generate_smart_clarification", fixed_clarification)
+
+
+@pytest.fixture
+def embedding_calls(monkeypatch):
+    """Record the queries embedded by the chat handler"""
+    from controller import chat
+    calls = []
+    embed = chat.get_query_embedding
+
+    async def recording_embedding(query):
+        calls.append(query)
+        return await embed(query)
+    monkeypatch.setattr("controller.chat.get_query_embedding", recording_embedding)
+    return calls
+
+
+def test_clarification_turn_does_not_depend_on_the_embeddings_endpoint(client, clarification, monkeypatch):
+    async def failing_embedding(query):
+        raise TimeoutError("embeddings endpoint timed out")
+    monkeypatch.setattr("controller.chat.get_query_embedding", failing_embedding)
+
+    response = client.post("/chat", json={"message": "I need a 2 bedroom apartment in Brooklyn", "history": []})
+
+    assert response.status_code == 200
+    body = response.json()
+    assert body["response"] == CLARIFICATION
+    assert body["results"] == []
+
+
+def test_search_turn_uses_the_query_embedding(client, clarification, embedding_calls):
+    message = "I want to buy a 2 bedroom apartment in Manhattan"
+    response = client.post("/chat", json={"message": message, "history": []})
+
+    assert response.status_code == 200
+    assert response.json()["response"] != CLARIFICATION
+    assert embedding_calls == [message]
@@ -0,0 +1,40 @@
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from utils.responses import CompressionMiddleware
+
+
+@pytest.fixture
+def compressed_client():
+    app = FastAPI()
+    app.add_middleware(CompressionMiddleware, min_size=100)
+
+    @app.get("/large")
+    def large():
+        return {"text": "x" * 1000}
+
+    @app.get("/small")
+    def small():
+        return {"text": "x"}
+
+    return TestClient(app)
+
+
+@pytest.mark.parametrize("accept_encoding, encoding", [
+    ("gzip", "gzip"),
+    ("identity", None),
+    ("", None),
+])
+def test_compressible_response_varies_by_accept_encoding(compressed_client, accept_encoding, encoding):
+    response = compressed_client.get("/large", headers={"Accept-Encoding": accept_encoding})
+
+    assert response.headers.get("content-encoding") == encoding
+    assert response.headers["vary"] == "Accept-Encoding"
+
+
+def test_small_response_does_not_vary(compressed_client):
+    response = compressed_client.get("/small", headers={"Accept-Encoding": "gzip"})
+
+    assert "content-encoding" not in response.headers
+    assert "vary" not in response.headers
@@ -0,0 +1,31 @@
+import pytest
+
+from store import GeocodeCache, normalize_address
+from store.locations import apply_location, location_entry
+
+
+@pytest.mark.parametrize("address, expected", [
+    ("100 Main St, Miami, FL 33101", "100 main st, miami, fl 33101"),
+    ("100 Main Street, Floor 3, Miami, FL 33101", "100 main st, miami, fl 33101"),
+    ("12 Ocean Dr #5, Miami Beach, FL", "12 ocean dr, miami beach, fl"),
+    ("350 West 50th Street, Apt 4B, New York, NY 10019", "350 w 50th st, new york, ny 10019"),
+    ("9 Elm St, Suite 300, Boston, MA 02101", "9 elm st, boston, ma 02101"),
+    ("1 Suite Rd, Austin, TX 78701", "1 suite rd, austin, tx 78701"),
+])
+def test_normalize_address_keeps_state_and_zip(address, expected):
+    assert normalize_address(address) == expected
+
+
+def test_addresses_in_different_zips_do_not_share_a_cache_entry():
+    cache = GeocodeCache()
+    cache.put("100 Main St, Miami, FL 33101", (25.77, -80.19))
+
+    assert cache.lookup("100 Main St, Miami, FL 33101") == (True, (25.77, -80.19))
+    assert cache.lookup("100 Main St, Miami, FL 33139") == (False, None)
+
+
+def test_location_entry_is_not_applied_after_a_zip_change():
+    entry = location_entry("100 Main St, Miami, FL 33101", {"coordinates": {"lat": 25.77, "lng": -80.19}})
+    listing = apply_location({"fullAddress": "100 Main St, Miami, FL 33139"}, entry)
+
+    assert "coordinates" not in listing
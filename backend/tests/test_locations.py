@@ -0,0 +1,32 @@
+import json
+
+from store import location_entry, locations_path
+
+
+def _write_locations(catalog_file, listing):
+    entry = location_entry(listing["fullAddress"], {
+        "coordinates": {"lat": 40.7794, "lng": -73.9570},
+        "nearby_schools": [{"name": "PS 6", "type": "School", "distance": 0.2}],
+        "nearby_attractions": [],
+    })
+    with open(locations_path(catalog_file), "w", encoding="utf-8") as file:
+        json.dump({listing["id"]: entry}, file)
+
+
+def test_property_detail_serves_fresh_locations_without_the_freshness_stamp(client, catalog_file, monkeypatch):
+    with open(catalog_file, "r", encoding="utf-8") as file:
+        listing = json.load(file)[0]
+    _write_locations(catalog_file, listing)
+
+    lookups = []
+
+    async def geocode(address, turn=None):
+        lookups.append(address)
+
+    monkeypatch.setattr("utils.location.get_coordinates_from_address", geocode)
+
+    detail = client.get(f"/properties/{listing['id']}").json()
+    assert detail["coordinates"] == {"lat": 40.7794, "lng": -73.9570}
+    assert "location_updated_at" not in detail
+    # The precomputed fields were fresh, so nothing was looked up
+    assert lookups == []
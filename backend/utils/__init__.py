@@ -12,15 +12,18 @@ from .location import (
     find_nearby_schools,
     find_nearby_pois,
     find_nearby_attractions,
+    has_fresh_location,
+    fetch_neighborhood,
     enhance_property_with_location_data,
     extract_poi_type_from_query
 )
 
 # Property search
 from .search import (
-    cosine_similarity,
     find_property_by_name,
     extract_property_name_from_results,
+    get_query_embedding,
+    filter_rows_by_preferences,
     search_properties
 )
 
@@ -40,6 +43,18 @@ from .email import (
     send_tour_confirmation_email
 )
 
+# Per-turn shared state
+from .turn import TurnContext
+
+# Per-turn stage timings
+from .timing import (
+    StageTimer,
+    start_turn_timer,
+    current_turn_timer,
+    timed_stage,
+    pipeline_stage
+)
+
 from .constants import (
     system_message,
     
@@ -57,13 +72,16 @@ __all__ = [
     'find_nearby_schools',
     'find_nearby_pois',
     'find_nearby_attractions',
+    'has_fresh_location',
+    'fetch_neighborhood',
     'enhance_property_with_location_data',
     'extract_poi_type_from_query',
     
     # Property search
-    'cosine_similarity',
     'find_property_by_name',
     'extract_property_name_from_results',
+    'get_query_embedding',
+    'filter_rows_by_preferences',
     'search_properties',
     
     # Natural language processing
@@ -79,6 +97,16 @@ __all__ = [
     'send_email',
     'send_tour_confirmation_email',
 
+    # Per-turn shared state
+    'TurnContext',
+
+    # Per-turn stage timings
+    'StageTimer',
+    'start_turn_timer',
+    'current_turn_timer',
+    'timed_stage',
+    'pipeline_stage',
+
     # Constants
     'system_message',
    
@@ -0,0 +1,264 @@
+from typing import List, Dict, Any, Tuple, Callable
+import geopy.distance
+
+# One Overpass query at the widest radius any location question uses; the
+# per-question radius, distance cutoff and element filters are applied here
+NEIGHBORHOOD_RADIUS = 3000
+SCHOOL_RADIUS = 3000
+ATTRACTION_RADIUS = 2000
+POI_RADIUS = 3000
+MILES_PER_KM = 0.621371
+
+# Tags the classifiers read; everything else is dropped from cached places
+KEPT_TAGS = ("name", "amenity", "leisure", "shop", "tourism", "school:type", "isced:level")
+
+# (element type, lat, lng, tags) of one located OSM element
+Place = Tuple[str, float, float, Dict[str, str]]
+
+ATTRACTION_NODE_AMENITIES = frozenset(("restaurant", "cafe", "hospital", "pharmacy", "bank", "shopping", "supermarket", "park"))
+ATTRACTION_WAY_AMENITIES = frozenset(("restaurant", "cafe", "hospital", "pharmacy", "bank", "shopping", "supermarket"))
+LEISURE = frozenset(("park", "playground", "sports_centre", "swimming_pool"))
+ATTRACTION_SHOPS = frozenset(("supermarket", "mall", "shopping_centre"))
+TOURISM = frozenset(("attraction", "museum", "gallery"))
+ALL_POI_AMENITIES = frozenset(("restaurant", "cafe", "hospital", "pharmacy", "bank", "shopping", "supermarket", "school"))
+QUERY_NODE_AMENITIES = frozenset(("restaurant", "cafe", "fast_food", "hospital", "pharmacy", "bank", "fuel",
+                                   "shopping", "supermarket", "park"))
+
+
+def neighborhood_query(lat: float, lng: float, radius: int = NEIGHBORHOOD_RADIUS) -> str:
+    """Overpass QL for every element a school, attraction or POI lookup around a point can return"""
+    around = f"(around:{radius},{lat},{lng})"
+    return f"""
+        [out:json][timeout:25];
+        (
+          node["amenity"="school"]{around};
+          way["amenity"="school"]{around};
+          relation["amenity"="school"]{around};
+          node["amenity"~"^(restaurant|cafe|fast_food|hospital|pharmacy|bank|fuel|shopping|supermarket|park)$"]{around};
+          way["amenity"~"^(restaurant|cafe|hospital|pharmacy|bank|shopping|supermarket)$"]{around};
+          node["leisure"~"^(park|playground|sports_centre|swimming_pool)$"]{around};
+          way["leisure"~"^(park|playground|sports_centre|swimming_pool)$"]{around};
+          node["shop"]{around};
+          node["tourism"~"^(attraction|museum|gallery)$"]{around};
+        );
+        out center tags;
+        """
+
+
+def in_neighborhood_query(kind: str, tags: Dict[str, str]) -> bool:
+    """True for the elements neighborhood_query selects, used to filter OSM extracts the same way"""
+    if tags.get('amenity') == 'school':
+        return kind in ('node', 'way', 'relation')
+    if kind == 'node':
+        return (tags.get('amenity') in QUERY_NODE_AMENITIES or tags.get('leisure') in LEISURE
+                or 'shop' in tags or tags.get('tourism') in TOURISM)
+    if kind == 'way':
+        return tags.get('amenity') in ATTRACTION_WAY_AMENITIES or tags.get('leisure') in LEISURE
+    return False
+
+
+def parse_places(data: Dict[str, Any]) -> List[Place]:
+    """Located elements of an Overpass response, with only the tags the classifiers need"""
+    places = []
+    for element in data.get('elements', []):
+        if element['type'] == 'node':
+            lat, lng = element['lat'], element['lon']
+        elif 'center' in element:
+            lat, lng = element['center']['lat'], element['center']['lon']
+        else:
+            continue
+        tags = element.get('tags', {})
+        places.append((element['type'], lat, lng, {key: tags[key] for key in KEPT_TAGS if key in tags}))
+    return places
+
+
+# Which places each question selects, mirroring the Overpass filters it used
+# to send on its own: schools of any element type, attractions from nodes
+# and ways, POIs from nodes only
+def _is_school(kind: str, tags: Dict[str, str]) -> bool:
+    return tags.get('amenity') == 'school'
+
+
+def _is_attraction(kind: str, tags: Dict[str, str]) -> bool:
+    if kind == 'node':
+        return (tags.get('amenity') in ATTRACTION_NODE_AMENITIES or tags.get('leisure') in LEISURE
+                or tags.get('shop') in ATTRACTION_SHOPS or tags.get('tourism') in TOURISM)
+    if kind == 'way':
+        return tags.get('amenity') in ATTRACTION_WAY_AMENITIES or tags.get('leisure') in LEISURE
+    return False
+
+
+def _node_tag(key: str, values=None) -> Callable[[str, Dict[str, str]], bool]:
+    def matches(kind: str, tags: Dict[str, str]) -> bool:
+        return kind == 'node' and key in tags and (values is None or tags[key] in values)
+    return matches
+
+
+def _node_any(*matchers) -> Callable[[str, Dict[str, str]], bool]:
+    def matches(kind: str, tags: Dict[str, str]) -> bool:
+        return any(matcher(kind, tags) for matcher in matchers)
+    return matches
+
+
+POI_FILTERS = {
+    "hospitals": _node_tag('amenity', {'hospital'}),
+    "schools": _node_tag('amenity', {'school'}),
+    "parks": _node_tag('leisure', {'park'}),
+    "restaurants": _node_tag('amenity', {'restaurant', 'cafe', 'fast_food'}),
+    "shopping": _node_tag('shop'),
+    "banks": _node_tag('amenity', {'bank'}),
+    "pharmacies": _node_tag('amenity', {'pharmacy'}),
+    "gas_stations": _node_tag('amenity', {'fuel'}),
+    "attractions": _node_any(_node_tag('tourism', TOURISM), _node_tag('amenity', ATTRACTION_WAY_AMENITIES),
+                             _node_tag('leisure', LEISURE)),
+    "all": _node_any(_node_tag('amenity', ALL_POI_AMENITIES), _node_tag('leisure', LEISURE),
+                     _node_tag('shop', {'supermarket', 'mall'}), _node_tag('tourism', TOURISM)),
+}
+
+
+def _within(places: List[Place], coords: Tuple[float, float], radius: int, matches) -> List[Tuple[float, Dict[str, str]]]:
+    """(distance in miles, tags) of the matching places within ``radius`` meters"""
+    found = []
+    for kind, lat, lng, tags in places:
+        if not matches(kind, tags):
+            continue
+        distance_km = geopy.distance.distance(coords, (lat, lng)).kilometers
+        if distance_km * 1000 <= radius:
+            found.append((distance_km * MILES_PER_KM, tags))
+    return found
+
+
+def select_schools(places: List[Place], coords: Tuple[float, float]) -> List[Dict[str, Any]]:
+    """The five closest schools, as find_nearby_schools returns them"""
+    schools = []
+    for distance_miles, tags in _within(places, coords, SCHOOL_RADIUS, _is_school):
+        name = tags.get('name', 'Unnamed School')
+        school_type = "School"
+
+        if 'school:type' in tags:
+            school_type = tags['school:type'].title() + " School"
+        elif 'isced:level' in tags:
+            level = tags['isced:level']
+            if '0' in level or '1' in level:
+                school_type = "Elementary School"
+            elif '2' in level:
+                school_type = "Middle School"
+            elif '3' in level:
+                school_type = "High School"
+
+        if distance_miles > 5:
+            continue
+
+        schools.append({
+            "name": name,
+            "type": school_type,
+            "distance": round(distance_miles, 2),
+            "rating": None,
+            "description": f"{school_type} in the area"
+        })
+
+    schools.sort(key=lambda x: x['distance'])
+    return schools[:5]
+
+
+def select_pois(places: List[Place], coords: Tuple[float, float], poi_type: str = "all") -> List[Dict[str, Any]]:
+    """The ten closest POIs of one type, as find_nearby_pois returns them"""
+    matches = POI_FILTERS.get(poi_type.lower(), POI_FILTERS["all"])
+    pois = []
+    for distance_miles, tags in _within(places, coords, POI_RADIUS, matches):
+        name = tags.get('name', 'Unnamed Location')
+        poi_category = "Point of Interest"
+        description = "Location in the area"
+
+        if 'amenity' in tags:
+            amenity = tags['amenity']
+            if amenity == 'hospital':
+                poi_category = "Hospital"
+                description = "Medical facility"
+            elif amenity == 'school':
+                poi_category = "School"
+                description = "Educational institution"
+            elif amenity in ['restaurant', 'cafe', 'fast_food']:
+                poi_category = "Restaurant/Dining"
+                description = "Dining establishment"
+            elif amenity == 'pharmacy':
+                poi_category = "Pharmacy"
+                description = "Pharmacy/Drugstore"
+            elif amenity == 'bank':
+                poi_category = "Bank"
+                description = "Banking services"
+            elif amenity == 'fuel':
+                poi_category = "Gas Station"
+                description = "Fuel station"
+            elif amenity == 'park':
+                poi_category = "Park"
+                description = "Public park"
+        elif 'leisure' in tags:
+            leisure = tags['leisure']
+            if leisure in ['park', 'playground', 'garden']:
+                poi_category = "Park/Recreation"
+                description = "Recreational area"
+            elif leisure in ['sports_centre', 'swimming_pool']:
+                poi_category = "Sports/Fitness"
+                description = "Sports facility"
+        elif 'shop' in tags:
+            poi_category = "Shopping"
+            description = "Retail establishment"
+        elif 'tourism' in tags:
+            poi_category = "Tourism/Culture"
+            description = "Tourist attraction"
+
+        if distance_miles > 5:
+            continue
+
+        pois.append({
+            "name": name,
+            "type": poi_category,
+            "distance": round(distance_miles, 2),
+            "description": description
+        })
+
+    pois.sort(key=lambda x: x['distance'])
+    return pois[:10]
+
+
+def select_attractions(places: List[Place], coords: Tuple[float, float]) -> List[Dict[str, Any]]:
+    """The eight closest attractions and amenities, as find_nearby_attractions returns them"""
+    attractions = []
+    for distance_miles, tags in _within(places, coords, ATTRACTION_RADIUS, _is_attraction):
+        name = tags.get('name', 'Unnamed Location')
+        attr_type = "Point of Interest"
+
+        if 'amenity' in tags:
+            amenity = tags['amenity']
+            if amenity in ['restaurant', 'cafe']:
+                attr_type = "Restaurant/Dining"
+            elif amenity in ['hospital', 'pharmacy']:
+                attr_type = "Healthcare"
+            elif amenity in ['bank']:
+                attr_type = "Banking"
+            elif amenity in ['supermarket', 'shopping']:
+                attr_type = "Shopping"
+        elif 'leisure' in tags:
+            leisure = tags['leisure']
+            if leisure in ['park', 'playground']:
+                attr_type = "Park/Recreation"
+            elif leisure in ['sports_centre', 'swimming_pool']:
+                attr_type = "Sports/Fitness"
+        elif 'shop' in tags:
+            attr_type = "Shopping"
+        elif 'tourism' in tags:
+            attr_type = "Tourism/Culture"
+
+        if distance_miles > 3:
+            continue
+
+        attractions.append({
+            "name": name,
+            "type": attr_type,
+            "distance": round(distance_miles, 2),
+            "description": f"{attr_type} in the area"
+        })
+
+    attractions.sort(key=lambda x: x['distance'])
+    return attractions[:8]
@@ -1,10 +1,12 @@
 from typing import List, Dict, Any, Optional
 from config.config import llm, logger
 from langchain_core.output_parsers import JsonOutputParser
+from .timing import pipeline_stage
 import json
 
 
-def extract_parsed_filters(message: str, history: List[Dict[str, str]]) -> Optional[Dict[str, Any]]:
+@pipeline_stage("extract_filters")
+async def extract_parsed_filters(message: str, history: List[Dict[str, str]]) -> Optional[Dict[str, Any]]:
     """Extract parsed filters for frontend filter updates"""
     recent_context = ""
     for msg in history[-3:]:
@@ -47,7 +49,7 @@ def extract_parsed_filters(message: str, history: List[Dict[str, str]]) -> Optio
     """
     
     try:
-        response = llm.invoke(extraction_prompt).content
+        response = (await llm.ainvoke(extraction_prompt)).content
         parser = JsonOutputParser()
         parsed_filters = parser.parse(response)
         clean_filters = {k: v for k, v in parsed_filters.items() if v is not None and v != "null"}
@@ -58,7 +60,8 @@ def extract_parsed_filters(message: str, history: List[Dict[str, str]]) -> Optio
         return None
 
 
-def extract_user_preferences(message: str, history: List[Dict[str, str]], conversation_state: Dict[str, Any]) -> Dict[str, Any]:
+@pipeline_stage("extract_preferences")
+async def extract_user_preferences(message: str, history: List[Dict[str, str]], conversation_state: Dict[str, Any]) -> Dict[str, Any]:
     """Extract and update user preferences from current message and conversation history"""
     recent_context = ""
     for msg in history[-3:]:
@@ -96,7 +99,7 @@ def extract_user_preferences(message: str, history: List[Dict[str, str]], conver
     """
     
     try:
-        response = llm.invoke(extraction_prompt).content
+        response = (await llm.ainvoke(extraction_prompt)).content
         parser = JsonOutputParser()
         extracted = parser.parse(response)
         
@@ -113,7 +116,8 @@ def extract_user_preferences(message: str, history: List[Dict[str, str]], conver
         return {}
 
 
-def generate_smart_clarification(message: str, conversation_state: Dict[str, Any]) -> str:
+@pipeline_stage("response_generation")
+async def generate_smart_clarification(message: str, conversation_state: Dict[str, Any]) -> str:
     """Generate contextual clarification questions with location suggestions"""
     from .location import get_available_locations  # Import here to avoid circular imports
     
@@ -166,14 +170,15 @@ def generate_smart_clarification(message: str, conversation_state: Dict[str, Any
     """
     
     try:
-        response = llm.invoke(clarification_prompt).content.strip()
+        response = (await llm.ainvoke(clarification_prompt)).content.strip()
         return response
     except Exception as e:
         logger.error("Error generating clarification", error=str(e))
         return "I'd be happy to help you find properties! Could you tell me a bit more about what you're looking for?"
 
 
-def validate_search_criteria(query: str) -> Dict[str, Any]:
+@pipeline_stage("extract_filters")
+async def validate_search_criteria(query: str) -> Dict[str, Any]:
     """Validate if the query contains sufficient search criteria"""
     
     validation_prompt = f"""
@@ -212,7 +217,7 @@ def validate_search_criteria(query: str) -> Dict[str, Any]:
     """
     
     try:
-        response = llm.invoke(validation_prompt).content
+        response = (await llm.ainvoke(validation_prompt)).content
         parser = JsonOutputParser()
         return parser.parse(response)
     except Exception as e:
@@ -220,7 +225,8 @@ def validate_search_criteria(query: str) -> Dict[str, Any]:
         return {"is_sufficient": False, "missing_criteria": ["transaction_type", "location", "bedrooms", "price"]}
 
 
-def detect_unified_intent(context, query: str) -> Dict[str, Any]:
+@pipeline_stage("intent")
+async def detect_unified_intent(context, query: str) -> Dict[str, Any]:
     """Detect intent with unified categories and extract relevant information"""
     
     location_keywords = ["schools", "school", "near", "nearby", "close to", "around", "attractions", "attraction", "what's near", "what's around", "distance", "miles", "radius", "hospitals", "hospital", "parks", "park", "restaurants", "restaurant"]
@@ -290,14 +296,15 @@ def detect_unified_intent(context, query: str) -> Dict[str, Any]:
 
     parser = JsonOutputParser()
     try:
-        response = llm.invoke(gpt_input).content
+        response = (await llm.ainvoke(gpt_input)).content
         return parser.parse(response)
     except Exception as e:
         logger.error("Error detecting intent", error=str(e))
         return {"intent": "CONVERSATIONAL_QUERY", "transaction_type": "unknown", "property_name": ""}
 
 
-def get_gpt_response(query: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+@pipeline_stage("response_generation")
+async def get_gpt_response(query: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Generate a conversational response about property search results"""
     
     gpt_input = f"""
@@ -332,7 +339,7 @@ def get_gpt_response(query: str, results: List[Dict[str, Any]]) -> Dict[str, Any
     Would you like to know more about the school districts or schedule a tour?"
     """
     
-    natural_text = llm.invoke(gpt_input).content
+    natural_text = (await llm.ainvoke(gpt_input)).content
     property_ids = [prop.get("id") for prop in results if "id" in prop]
 
     return {"text": natural_text, "property_ids": property_ids}
\ No newline at end of file
@@ -0,0 +1,94 @@
+from fastapi import Response
+from pydantic import BaseModel
+from starlette.datastructures import Headers, MutableHeaders
+from config.config import FAST_JSON_RESPONSES
+from store.fastjson import dumps
+from store.compression import CompressedBodyCache, DEFAULT_MIN_SIZE, encode_body
+
+
+class FastJSONResponse(Response):
+    """JSON response rendered by ``store.fastjson.dumps`` (orjson when installed)"""
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        return dumps(content)
+
+
+def json_response(content):
+    """Serialize a controller result directly, skipping FastAPI's ``jsonable_encoder`` pass.
+
+    Only with FAST_JSON_RESPONSES; otherwise ``content`` goes back to FastAPI
+    unchanged. Controller results are already validated, so pydantic models
+    are dumped by their own serializer rather than re-encoded field by field,
+    and ready-made responses (pre-serialized pages) pass through.
+    """
+    if not FAST_JSON_RESPONSES or isinstance(content, Response):
+        return content
+    if isinstance(content, BaseModel):
+        return Response(content=content.model_dump_json(), media_type="application/json")
+    return FastJSONResponse(content)
+
+
+class CompressionMiddleware:
+    """Brotli/gzip compression negotiated from Accept-Encoding.
+
+    Bodies under ``min_size`` and responses that already carry a
+    Content-Encoding go out unchanged; every other body is marked
+    ``Vary: Accept-Encoding``, identity included. Streamed responses pass through too,
+    since compressing them would mean buffering the whole stream. Successful
+    GETs under ``cache_paths`` keep their compressed bodies in ``cache``, so
+    a hot listing page is compressed once per catalog version.
+    """
+
+    def __init__(self, app, min_size: int = DEFAULT_MIN_SIZE, cache: CompressedBodyCache = None,
+                 cache_paths=()):
+        self.app = app
+        self.min_size = min_size
+        self.cache = cache
+        self.cache_paths = tuple(cache_paths)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        accept_encoding = Headers(scope=scope).get("accept-encoding")
+
+        start = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                start = message
+                return
+            if message["type"] != "http.response.body":
+                await send(message)
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(raw=start["headers"])
+            if message.get("more_body") or "content-encoding" in headers:
+                passthrough = True
+                await send(start)
+                await send(message)
+                return
+
+            cache_key = None
+            if (self.cache is not None and start["status"] == 200 and scope["method"] == "GET"
+                    and scope["path"].startswith(self.cache_paths)):
+                cache_key = (scope["path"], scope["query_string"])
+            # Anything large enough to compress varies by Accept-Encoding,
+            # whichever coding this particular client got
+            if len(body) >= self.min_size:
+                headers.add_vary_header("Accept-Encoding")
+            body, encoding = encode_body(body, accept_encoding, self.min_size, self.cache, cache_key)
+            if encoding:
+                headers["Content-Encoding"] = encoding
+                headers["Content-Length"] = str(len(body))
+            await send(start)
+            await send({"type": "http.response.body", "body": body})
+
+        await self.app(scope, receive, send_compressed)
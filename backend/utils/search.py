@@ -1,161 +1,109 @@
 from typing import List, Dict, Any
-from config.config import (
-    embeddings_model, embedding_cache, CACHE_SIZE_LIMIT,
-    property_metadata, logger
-)
+from config.config import embeddings_model, embedding_cache, get_catalog, logger
+from store import Catalog
 import numpy as np
 import json
+from .timing import pipeline_stage, timed_stage
+from .turn import TurnContext
 
 
-def cosine_similarity(vec1, vec2):
-    """Calculate cosine similarity between two vectors"""
-    return np.dot(vec1, vec2) / (np.linalg.norm(vec1) * np.linalg.norm(vec2))
-
-
-def find_property_by_name(property_name: str) -> Dict[str, Any]:
+def find_property_by_name(property_name: str, catalog: Catalog = None) -> Dict[str, Any]:
     """Find a property in the metadata by its name or full address."""
-    property_name = property_name.lower()
-    
-    for prop in property_metadata:
-        name = prop.get("name")
-        if isinstance(name, str) and name.lower() == property_name:
-            return prop
-    
-    for prop in property_metadata:
-        full_address = prop.get("fullAddress")
-        if isinstance(full_address, str) and full_address.lower() == property_name:
-            return prop
-    
-    return {}
+    catalog = catalog or get_catalog()
+    match = catalog.lookup.find_by_name(property_name)
+    return catalog.projections.detail(match) if match else {}
 
 
 def extract_property_name_from_results(property_id: str) -> str:
     """Get the property name from the ID using the metadata"""
-    for prop in property_metadata:
-        if prop.get("id") == property_id:
-            return prop.get("name", "")
-    return ""
+    prop = get_catalog().lookup.get(property_id)
+    return prop.get("name", "") if prop else ""
 
 
-def search_properties(context, query: str, conversation_state: Dict[str, Any], top_k: int = 5) -> List[Dict[str, Any]]:
-    """Search for properties based on user query and intent"""
-    from .nlp import detect_unified_intent  
-    
-    
-    intent_data = detect_unified_intent(context, query)
-    intent = intent_data.get("intent", "CONVERSATIONAL_QUERY")
-    transaction_type = intent_data.get("transaction_type", "unknown")
-    property_name = intent_data.get("property_name", "")
-    prefs = conversation_state.get("user_preferences", {})
-    
-    
-    try:
-        if len(property_metadata) == 0:
-            return []
-    except Exception as e:
-        return []
-    
+@pipeline_stage("embedding")
+async def get_query_embedding(query: str):
+    """Embed a search query, reusing the shared query-embedding cache"""
+    query_embedding = embedding_cache.get(query)
+    if query_embedding is not None:
+        logger.debug("Using cached embedding for query", query=query)
+        return query_embedding
+    return embedding_cache.put(query, await embeddings_model.aembed_query(query))
+
+
+def filter_rows_by_preferences(prefs: Dict[str, Any], transaction_type: str = "unknown",
+                               catalog: Catalog = None) -> np.ndarray:
+    """Select catalog rows matching the gathered preferences with one fused boolean mask"""
+    index = (catalog or get_catalog()).attribute_index
+    mask = index.all()
     
     if transaction_type == "rent" or prefs.get("transaction_type") == "rent":
-        filtered_properties = [
-            prop for prop in property_metadata if prop.get("leaseProperty")]
+        mask &= index.lease
     elif transaction_type == "buy" or prefs.get("transaction_type") == "buy":
-        filtered_properties = [
-            prop for prop in property_metadata if prop.get("salesPrice")]
-    else:
-        filtered_properties = property_metadata
-    
-    if filtered_properties is None:
-        filtered_properties = []
+        mask &= index.for_sale
     
     if prefs.get("bedrooms"):
-        filtered_properties = [
-            prop for prop in filtered_properties 
-            if prop.get("bedroomCount") == prefs["bedrooms"]
-        ]
+        mask &= index.equals(index.bedrooms, prefs["bedrooms"])
     
     if prefs.get("bathrooms"):
-        filtered_properties = [
-            prop for prop in filtered_properties 
-            if prop.get("bathCount") == prefs["bathrooms"]
-        ]
-    
-    if prefs.get("location") and prefs["location"] is not None:
-        location_lower = prefs["location"].lower()
-        
-        def safe_string_lower(value):
-            """Safely convert value to lowercase string"""
-            if isinstance(value, str):
-                return value.lower()
-            elif value is None:
-                return ""
-            else:
-                return str(value).lower()
-        
-        filtered_properties = [
-            prop for prop in filtered_properties
-            if (location_lower in safe_string_lower(prop.get("fullAddress", "")) or
-                location_lower in safe_string_lower(prop.get("city")) or
-                location_lower in safe_string_lower(prop.get("neighborhood")))
-        ]
+        mask &= index.equals(index.bathrooms, prefs["bathrooms"])
     
     if prefs.get("property_type"):
-        type_lower = prefs["property_type"].lower()
-        filtered_properties = [
-            prop for prop in filtered_properties
-            if type_lower in prop.get("propertyType", "").lower()
-        ]
+        mask &= index.property_type_contains(prefs["property_type"])
+    
+    if prefs.get("min_price"):
+        min_price = float(prefs["min_price"])
+        mask &= ((index.for_sale & (index.sales_price >= min_price)) |
+                 (index.lease & (index.monthly_rent >= min_price)))
+    
+    if prefs.get("max_price"):
+        max_price = float(prefs["max_price"])
+        mask &= ((index.for_sale & (index.sales_price <= max_price)) |
+                 (index.lease & (index.monthly_rent <= max_price)))
+    
+    rows = index.rows(mask)
+    if prefs.get("location"):
+        rows = index.location_rows(rows, prefs["location"])
+    return rows
+
+
+async def search_properties(turn: TurnContext, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    """Search for properties based on user query and the turn's already detected intent"""
+    if not turn.intent_data:
+        from .nlp import detect_unified_intent
+        turn.intent_data = await detect_unified_intent(turn.context, query)
+    intent = turn.intent
+    transaction_type = turn.transaction_type
+    property_name = turn.property_name
+    prefs = turn.preferences
+    if turn.catalog is None:
+        turn.catalog = get_catalog()
+    catalog = turn.catalog
+    
     
-    if prefs.get("min_price") or prefs.get("max_price"):
-        
-        if prefs.get("min_price"):
-            min_price = prefs["min_price"]
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if ((prop.get("salesPrice") and int(prop.get("salesPrice", 0)) >= min_price) or
-                    (prop.get("leaseProperty") and int(prop.get("monthlyRent", 0)) >= min_price))
-            ]
-        
-        if prefs.get("max_price"):
-            max_price = prefs["max_price"]
-            filtered_properties = [
-                prop for prop in filtered_properties
-                if ((prop.get("salesPrice") and int(prop.get("salesPrice", 0)) <= max_price) or
-                    (prop.get("leaseProperty") and int(prop.get("monthlyRent", 0)) <= max_price))
-            ]
+    try:
+        if len(catalog.listings) == 0:
+            return []
+    except Exception as e:
+        return []
+    
+    
+    with timed_stage("filtering"):
+        candidate_rows = filter_rows_by_preferences(prefs, transaction_type, catalog)
 
     if intent == "PROPERTY_INTEREST" and property_name:
-        property_match = find_property_by_name(property_name)
+        property_match = find_property_by_name(property_name, catalog)
         if property_match:
-            excluded_keys = {"embedding", "seoDescription"}
-            return [{k: v for k, v in property_match.items() if k not in excluded_keys}]
+            return [property_match]
     
-    if not filtered_properties:
+    if candidate_rows.size == 0:
         return []
     
-    query_hash = hash(query.lower().strip())
-    if query_hash in embedding_cache:
-        query_embedding = embedding_cache[query_hash]
-        logger.debug("Using cached embedding for query", query=query)
-    else:
-        query_embedding = embeddings_model.embed_query(query)
-        if len(embedding_cache) >= CACHE_SIZE_LIMIT:
-            oldest_key = next(iter(embedding_cache))
-            del embedding_cache[oldest_key]
-        
-        embedding_cache[query_hash] = query_embedding
-
-    similarities = [
-        (prop, cosine_similarity(query_embedding, np.array(prop["embedding"])))
-        for prop in filtered_properties
-    ]
-    top_matches = sorted(
-        similarities, key=lambda x: x[1], reverse=True)[:top_k]
-    
-    excluded_keys = {"embedding", "seoDescription"}
-    final_results = [
-        {k: v for k, v in match[0].items() if k not in excluded_keys}
-        for match in top_matches
-    ]
+    query_embedding = turn.query_embeddings.get(query)
+    if query_embedding is None:
+        query_embedding = turn.query_embeddings[query] = await get_query_embedding(query)
+    with timed_stage("scoring"):
+        top_rows = catalog.vector_store.top_k(query_embedding, candidate_rows, top_k)
     
-    return final_results
\ No newline at end of file
+    # Copies: results end up in session state, which later turns may modify
+    details = catalog.projections.details
+    return [dict(details[row]) for row in top_rows]
\ No newline at end of file
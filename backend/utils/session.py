@@ -2,6 +2,7 @@ from typing import Dict, Any, Optional, Tuple
 from uuid import uuid4
 from schema.chat import ChatResponse
 from config.config import sessions
+from .timing import current_turn_timer
 
 
 def get_or_create_session(session_id: Optional[str] = None) -> Tuple[str, Dict]:
@@ -55,5 +56,8 @@ def create_chat_response(session_id: str, latest_property_results: list, convers
     """Create ChatResponse with session management"""
     save_session_data(session_id, latest_property_results, conversation_state)
     response_data["session_id"] = session_id
+    timer = current_turn_timer()
+    if timer is not None:
+        response_data["metadata"] = {**response_data.get("metadata", {}), "timings_ms": timer.summary()}
     
     return ChatResponse(**response_data)
\ No newline at end of file
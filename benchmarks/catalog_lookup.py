@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Microbenchmark: linear catalog scans vs CatalogLookup dict lookups.
+
+Usage:
+    python benchmarks/catalog_lookup.py [--sizes 1000 10000 100000] [--repeat 200]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend"))
+
+from store.lookup import CatalogLookup
+
+
+def make_catalog(size):
+    """Minimal listings with unique id, name, fullAddress and slug"""
+    return [
+        {
+            "id": f"prop_{i:07d}",
+            "name": f"Listing {i} on Main Street",
+            "fullAddress": f"{i} Main Street, New York, NY 10001",
+            "slug": f"listing-{i}-main-street",
+        }
+        for i in range(size)
+    ]
+
+
+def linear_get_by_id(catalog, property_id):
+    for prop in catalog:
+        if prop.get("id") == property_id:
+            return prop.copy()
+    return None
+
+
+def linear_find_by_name(catalog, property_name):
+    property_name = property_name.lower()
+    for prop in catalog:
+        name = prop.get("name")
+        if isinstance(name, str) and name.lower() == property_name:
+            return prop
+    for prop in catalog:
+        full_address = prop.get("fullAddress")
+        if isinstance(full_address, str) and full_address.lower() == property_name:
+            return prop
+    return {}
+
+
+def time_per_call(fn, keys, repeat):
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for key in keys:
+            fn(key)
+    return (time.perf_counter() - start) / (repeat * len(keys))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+
+    print(f"{'listings':>10} {'op':>14} {'linear (us)':>14} {'lookup (us)':>14} {'speedup':>10}")
+    for size in args.sizes:
+        catalog = make_catalog(size)
+        build_start = time.perf_counter()
+        lookup = CatalogLookup(catalog)
+        build_ms = (time.perf_counter() - build_start) * 1000
+
+        # First, middle and last listing, plus an address (second-pass) hit
+        positions = [0, size // 2, size - 1]
+        ids = [catalog[i]["id"] for i in positions]
+        addresses = [catalog[i]["fullAddress"].upper() for i in positions]
+        linear_repeat = max(1, args.repeat * 1_000 // size)
+
+        cases = [
+            ("get_by_id", ids,
+             lambda key: linear_get_by_id(catalog, key), lookup.get),
+            ("find_by_name", addresses,
+             lambda key: linear_find_by_name(catalog, key), lookup.find_by_name),
+        ]
+        for op, keys, linear_fn, lookup_fn in cases:
+            linear_us = time_per_call(linear_fn, keys, linear_repeat) * 1e6
+            lookup_us = time_per_call(lookup_fn, keys, args.repeat * 100) * 1e6
+            print(f"{size:>10} {op:>14} {linear_us:>14.2f} {lookup_us:>14.3f} {linear_us / lookup_us:>9.0f}x")
+        print(f"{size:>10} {'build index':>14} {'':>14} {build_ms:>11.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+Search scaling benchmark over synthetic catalogs.
+
+For each catalog size, generates a synthetic catalog (benchmarks/
+synthetic_catalog.py, cached in --data-dir) and measures the existing
+backend code paths in a fresh process:
+
+- load: importing config.config with DATA_FILE pointed at the catalog
+  (streaming the records plus building the vector store, attribute index
+  and lookup)
+- rss: resident memory after load
+- filter: filter_listing_rows and filter_rows_by_preferences for a few
+  typical filter combinations (median per call)
+- listing page: get_all_properties, first page with filters
+- top-k: VectorStore.top_k over the whole catalog and over a filtered
+  subset, and search_properties end to end with a precomputed embedding
+
+The catalog is streamed record by record and its embeddings are packed
+into a float32 matrix as they are read, so vectors cost 4 bytes per float:
+about 0.6 GB for 100k listings at 1536 dimensions, and up to twice that
+while the matrix doubles in size. Use --dimension to reach 1M listings on
+smaller machines. ``--sidecar`` also writes the split catalog parts with
+the float32 embedding sidecar, so the vector store is memory-mapped
+instead of built while streaming.
+
+Usage:
+    python benchmarks/catalog_scaling.py [--sizes 1000 10000 100000] [--dimension 1536] [--json results.json]
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+BACKEND_DIR = os.path.join(BENCHMARK_DIR, "..", "backend")
+
+LISTING_FILTERS = [
+    {},
+    {"transaction_type": "buy", "price_min": 500_000, "price_max": 1_500_000},
+    {"bedrooms": 2, "property_type": "apartment"},
+    {"location": "Brooklyn", "transaction_type": "rent"},
+    {"search": "river view"},
+]
+CHAT_PREFERENCES = [
+    {"transaction_type": "rent"},
+    {"transaction_type": "buy", "bedrooms": 3, "max_price": 1_200_000},
+    {"transaction_type": "rent", "location": "Williamsburg", "property_type": "apartment"},
+]
+
+
+def resident_mb():
+    """Current resident set size (falls back to peak where /proc is unavailable)"""
+    try:
+        with open("/proc/self/status", "r", encoding="utf-8") as status:
+            for line in status:
+                if line.startswith("VmRSS:"):
+                    return int(line.split()[1]) / 1024
+    except OSError:
+        pass
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def median_ms(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def measure(catalog_path, dimension, repeat):
+    """Run inside a fresh process: load the catalog through config.config and time the search paths"""
+    os.environ["DATA_FILE"] = os.path.abspath(catalog_path)
+    os.environ["LLM_PROVIDER"] = "fake"
+    os.environ["FAKE_EMBEDDING_DIMENSION"] = str(dimension)
+    sys.path.insert(0, BACKEND_DIR)
+    os.chdir(BACKEND_DIR)
+
+    import numpy as np
+
+    rss_before = resident_mb()
+    start = time.perf_counter()
+    import config.config as config
+    load_s = time.perf_counter() - start
+    rss_after = resident_mb()
+
+    import logging
+    logging.getLogger().setLevel(logging.WARNING)
+    from controller.properties import filter_listing_rows, get_all_properties
+    from utils.search import filter_rows_by_preferences, search_properties
+    from utils.turn import TurnContext
+
+    rng = np.random.default_rng(1)
+    query = rng.standard_normal(config.vector_store.dimension).astype(np.float32)
+    rent_rows = filter_rows_by_preferences({"transaction_type": "rent"})
+
+    listing_filter_ms = max(median_ms(lambda f=f: filter_listing_rows(**f), repeat) for f in LISTING_FILTERS)
+    chat_filter_ms = max(median_ms(lambda p=p: filter_rows_by_preferences(p), repeat) for p in CHAT_PREFERENCES)
+    listing_page_ms = median_ms(
+        lambda: asyncio.run(get_all_properties(page=1, limit=12, transaction_type="buy", bedrooms=2)), repeat
+    )
+    top_k_all_ms = median_ms(lambda: config.vector_store.top_k(query, k=5), repeat)
+    top_k_filtered_ms = median_ms(lambda: config.vector_store.top_k(query, rent_rows, k=5), repeat)
+
+    def search():
+        turn = TurnContext(
+            message="rent", context="",
+            conversation_state={"user_preferences": {"transaction_type": "rent"}},
+            intent_data={"intent": "PROPERTY_QUERY", "transaction_type": "rent"},
+            query_embeddings={"rent": query},
+        )
+        return asyncio.run(search_properties(turn, "rent"))
+
+    search_ms = median_ms(search, repeat)
+
+    return {
+        "listings": len(config.property_metadata),
+        "dimension": config.vector_store.dimension,
+        "load_s": round(load_s, 3),
+        "rss_mb": round(rss_after, 1),
+        "rss_catalog_mb": round(rss_after - rss_before, 1),
+        "listing_filter_ms": round(listing_filter_ms, 3),
+        "chat_filter_ms": round(chat_filter_ms, 3),
+        "listing_page_ms": round(listing_page_ms, 3),
+        "top_k_all_ms": round(top_k_all_ms, 3),
+        "top_k_filtered_ms": round(top_k_filtered_ms, 3),
+        "search_properties_ms": round(search_ms, 3),
+    }
+
+
+def catalog_file(data_dir, size, dimension, seed, sidecar=False):
+    from synthetic_catalog import write_catalog
+
+    path = os.path.join(data_dir, f"synthetic_{size}_{dimension}d_s{seed}.json")
+    if not os.path.exists(path):
+        print(f"generating {size} listings ...", file=sys.stderr)
+        write_catalog(path + ".tmp", size, dimension, seed)
+        os.replace(path + ".tmp", path)
+
+    sys.path.insert(0, BACKEND_DIR)
+    from store import part_paths, parts_are_current, parts_manifest_path, sidecar_paths, write_catalog_parts
+
+    if sidecar and not parts_are_current(path):
+        with open(path, "r", encoding="utf-8") as file:
+            write_catalog_parts(path, json.load(file), model="synthetic")
+    elif not sidecar:
+        for stale in (*part_paths(path), parts_manifest_path(path), *sidecar_paths(path)):
+            if os.path.exists(stale):
+                os.remove(stale)
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=20)
+    parser.add_argument("--data-dir", default=os.path.join(tempfile.gettempdir(), "propertysearch-catalogs"))
+    parser.add_argument("--sidecar", action="store_true", help="load from the split parts and float32 sidecar")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    parser.add_argument("--child", metavar="CATALOG", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child, args.dimension, args.repeat)))
+        return
+
+    os.makedirs(args.data_dir, exist_ok=True)
+    columns = [
+        ("listings", "listings", "d"), ("load_s", "load (s)", ".2f"), ("rss_mb", "RSS (MB)", ".0f"),
+        ("listing_filter_ms", "list filter", ".3f"), ("chat_filter_ms", "chat filter", ".3f"),
+        ("listing_page_ms", "list page", ".3f"), ("top_k_all_ms", "top-k all", ".3f"),
+        ("top_k_filtered_ms", "top-k filt", ".3f"), ("search_properties_ms", "search", ".3f"),
+    ]
+    print(f"dimension={args.dimension} sidecar={args.sidecar}; filter/top-k/search columns are median ms per call")
+    print(" ".join(f"{title:>12}" for _, title, _ in columns))
+    results = []
+    for size in args.sizes:
+        path = catalog_file(args.data_dir, size, args.dimension, args.seed, args.sidecar)
+        child = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--child", path,
+             "--dimension", str(args.dimension), "--repeat", str(args.repeat)],
+            capture_output=True, text=True,
+        )
+        if child.returncode != 0:
+            print(f"{size:>12} failed (exit {child.returncode}); see stderr below\n{child.stderr[-2000:]}")
+            continue
+        result = json.loads(child.stdout.strip().splitlines()[-1])
+        results.append(result)
+        print(" ".join(f"{result[key]:>12{fmt}}" for key, _, fmt in columns))
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
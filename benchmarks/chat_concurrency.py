@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Concurrency benchmark for backend/controller/chat.py::handle_chat.
+
+Runs the backend on the fake model provider (LLM_PROVIDER=fake) with a fixed
+injected latency, then runs property-search turns from an increasing number
+of concurrent sessions on one event loop. With non-blocking I/O the
+throughput grows with the number of sessions; ``--blocking`` makes the fake
+sleep synchronously to reproduce the old one-turn-at-a-time behaviour.
+
+Usage:
+    python benchmarks/chat_concurrency.py [--latency-ms 200] [--turns 3] [--blocking]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+BACKEND_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+sys.path.insert(0, BACKEND_DIR)
+os.chdir(BACKEND_DIR)
+
+
+def load_chat(latency_ms, blocking):
+    """Import the chat controller with the fake provider configured"""
+    latency = f"fixed:{latency_ms}"
+    os.environ["LLM_PROVIDER"] = "fake"
+    os.environ["FAKE_LLM_LATENCY"] = latency
+    os.environ["FAKE_EMBEDDING_LATENCY"] = latency
+    os.environ["FAKE_LLM_BLOCKING"] = "1" if blocking else ""
+    import controller.chat as chat
+    return chat
+
+
+async def run_session(chat, session_number, turns):
+    from schema.chat import ChatRequest
+
+    history = []
+    session_id = f"bench-{session_number}"
+    for turn in range(turns):
+        request = ChatRequest(
+            message=f"Show me apartments to rent, option {session_number}-{turn}",
+            history=history,
+            session_id=session_id,
+        )
+        response = await chat.handle_chat(request)
+        history = request.history + [{"role": "assistant", "content": response.response}]
+
+
+async def run_level(chat, concurrency, turns):
+    start = time.perf_counter()
+    await asyncio.gather(*(run_session(chat, i, turns) for i in range(concurrency)))
+    return time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=200)
+    parser.add_argument("--turns", type=int, default=3)
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 2, 4, 8, 16, 32])
+    parser.add_argument("--blocking", action="store_true", help="fake models block the event loop")
+    args = parser.parse_args()
+
+    chat = load_chat(args.latency_ms, args.blocking)
+    mode = "blocking" if args.blocking else "async"
+    print(f"mode={mode} latency={args.latency_ms:.0f}ms turns/session={args.turns}")
+    print(f"{'sessions':>9} {'wall (s)':>10} {'turns/s':>10} {'speedup':>9}")
+    baseline = None
+    for concurrency in args.concurrency:
+        elapsed = asyncio.run(run_level(chat, concurrency, args.turns))
+        throughput = concurrency * args.turns / elapsed
+        baseline = baseline or throughput
+        print(f"{concurrency:>9} {elapsed:>10.2f} {throughput:>10.2f} {throughput / baseline:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,293 @@
+#!/usr/bin/env python3
+"""
+End-to-end chat replay benchmark.
+
+Replays the recorded conversations in benchmarks/conversations.json (search,
+follow-up, location and tour-scheduling flows) through the chat endpoint of
+either deployment target:
+
+- ``fastapi``: the backend app (``backend/main.py``), driven in-process over
+  ASGI with httpx;
+- ``vercel``: the ``api/chat.py`` handler, served by a local threading HTTP
+  server and driven from a thread pool.
+
+Each replay is one session; ``--concurrency`` sessions run at a time. Models
+come from the fake provider (LLM_PROVIDER=fake) with the given latency specs,
+and EMAIL_PASSWORD is cleared so tour confirmations never send mail.
+Geocoding and Overpass lookups in the location flow still go to the network.
+
+Reports p50/p95/p99 turn latency, throughput and mean time per pipeline stage
+(from the ``metadata.timings_ms`` each response carries). ``--save-baseline``
+writes the results as JSON; ``--compare`` checks a run against a stored
+baseline and exits non-zero when p95 latency or throughput regress by more
+than ``--tolerance``.
+
+Usage:
+    python benchmarks/chat_replay.py --target fastapi [--concurrency 8] [--repeat 4]
+    python benchmarks/chat_replay.py --target vercel --compare benchmarks/baselines/chat_replay_vercel.json
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+import threading
+import time
+import urllib.request
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.server import ThreadingHTTPServer
+
+import numpy as np
+
+ROOT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..")
+BACKEND_DIR = os.path.join(ROOT_DIR, "backend")
+API_DIR = os.path.join(ROOT_DIR, "api")
+CONVERSATIONS_FILE = os.path.join(os.path.dirname(os.path.abspath(__file__)), "conversations.json")
+
+STAGES = (
+    "intent", "extract_filters", "extract_preferences", "embedding", "filtering",
+    "scoring", "geocoding", "enrichment", "response_generation",
+)
+
+
+def configure_environment(args):
+    os.environ["LLM_PROVIDER"] = args.provider
+    os.environ["FAKE_LLM_LATENCY"] = args.llm_latency
+    os.environ["FAKE_EMBEDDING_LATENCY"] = args.embedding_latency
+    os.environ["FAKE_LATENCY_SEED"] = str(args.seed)
+    os.environ["EMAIL_PASSWORD"] = ""
+
+
+def quiet_logging():
+    """Keep per-request application logs out of the report"""
+    logging.getLogger().setLevel(logging.WARNING)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+
+def turn_record(flow, started, response):
+    return {
+        "flow": flow,
+        "latency_ms": (time.perf_counter() - started) * 1000,
+        "timings_ms": response.get("metadata", {}).get("timings_ms", {}),
+    }
+
+
+async def replay_fastapi(sessions, concurrency):
+    """Replay sessions against the backend FastAPI app over ASGI"""
+    import httpx
+
+    sys.path.insert(0, BACKEND_DIR)
+    os.chdir(BACKEND_DIR)
+    from main import app
+    quiet_logging()
+
+    limit = asyncio.Semaphore(concurrency)
+    records = []
+
+    async def run_session(client, number, conversation):
+        async with limit:
+            history = []
+            session_id = f"replay-{number}"
+            for message in conversation["turns"]:
+                started = time.perf_counter()
+                response = await client.post("/chat", json={
+                    "message": message, "history": history, "session_id": session_id,
+                })
+                response.raise_for_status()
+                body = response.json()
+                records.append(turn_record(conversation["flow"], started, body))
+                history = history + [
+                    {"role": "user", "content": message},
+                    {"role": "assistant", "content": body["response"]},
+                ]
+
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://replay", timeout=None) as client:
+        started = time.perf_counter()
+        await asyncio.gather(*(
+            run_session(client, number, conversation) for number, conversation in enumerate(sessions)
+        ))
+        elapsed = time.perf_counter() - started
+    return records, elapsed
+
+
+def replay_vercel(sessions, concurrency):
+    """Replay sessions against the api/chat.py handler on a local HTTP server"""
+    import importlib.util
+
+    sys.path.insert(0, API_DIR)
+    spec = importlib.util.spec_from_file_location("vercel_chat", os.path.join(API_DIR, "chat.py"))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    quiet_logging()
+
+    class Handler(module.handler):
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}/"
+    records = []
+    lock = threading.Lock()
+
+    def post(payload):
+        data = json.dumps(payload).encode("utf-8")
+        request = urllib.request.Request(url, data=data, headers={"Content-Type": "application/json"})
+        with urllib.request.urlopen(request) as response:
+            return json.loads(response.read())
+
+    def run_session(number, conversation):
+        history = []
+        session_id = f"replay-{number}"
+        conversation_state = None
+        for message in conversation["turns"]:
+            started = time.perf_counter()
+            body = post({
+                "message": message, "history": history,
+                "session_id": session_id, "conversation_state": conversation_state,
+            })
+            record = turn_record(conversation["flow"], started, body)
+            with lock:
+                records.append(record)
+            conversation_state = body.get("conversation_state")
+            history = history + [
+                {"role": "user", "content": message},
+                {"role": "assistant", "content": body["response"]},
+            ]
+
+    try:
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as pool:
+            for future in [pool.submit(run_session, n, c) for n, c in enumerate(sessions)]:
+                future.result()
+        elapsed = time.perf_counter() - started
+    finally:
+        server.shutdown()
+    return records, elapsed
+
+
+def percentiles(values):
+    p50, p95, p99 = np.percentile(values, [50, 95, 99])
+    return {"p50": round(float(p50), 2), "p95": round(float(p95), 2), "p99": round(float(p99), 2)}
+
+
+def summarize(records, elapsed):
+    latencies = [record["latency_ms"] for record in records]
+    stage_totals = defaultdict(float)
+    for record in records:
+        for stage, ms in record["timings_ms"].items():
+            if stage != "total":
+                stage_totals[stage] += ms
+
+    flows = defaultdict(list)
+    for record in records:
+        flows[record["flow"]].append(record["latency_ms"])
+
+    return {
+        "turns": len(records),
+        "wall_s": round(elapsed, 3),
+        "throughput_turns_per_s": round(len(records) / elapsed, 2),
+        "latency_ms": percentiles(latencies),
+        "flows_latency_ms": {flow: percentiles(values) for flow, values in sorted(flows.items())},
+        "stage_mean_ms": {
+            stage: round(stage_totals[stage] / len(records), 2)
+            for stage in sorted(stage_totals, key=lambda s: STAGES.index(s) if s in STAGES else len(STAGES))
+        },
+    }
+
+
+def print_report(target, config, summary):
+    latency = summary["latency_ms"]
+    print(f"target={target} provider={config['provider']} llm={config['llm_latency']} "
+          f"embedding={config['embedding_latency']} concurrency={config['concurrency']}")
+    print(f"turns={summary['turns']} wall={summary['wall_s']:.2f}s "
+          f"throughput={summary['throughput_turns_per_s']:.2f} turns/s")
+    print(f"latency ms: p50={latency['p50']:.1f} p95={latency['p95']:.1f} p99={latency['p99']:.1f}")
+    print(f"\n{'flow':<12} {'p50':>9} {'p95':>9} {'p99':>9}")
+    for flow, values in summary["flows_latency_ms"].items():
+        print(f"{flow:<12} {values['p50']:>9.1f} {values['p95']:>9.1f} {values['p99']:>9.1f}")
+    print(f"\n{'stage':<20} {'mean ms/turn':>13}")
+    for stage, ms in summary["stage_mean_ms"].items():
+        print(f"{stage:<20} {ms:>13.2f}")
+
+
+def compare(summary, baseline, tolerance):
+    """Print deltas against a baseline and return whether the run regressed"""
+    base = baseline["summary"]
+    checks = (
+        ("p95 latency", summary["latency_ms"]["p95"], base["latency_ms"]["p95"], True),
+        ("p99 latency", summary["latency_ms"]["p99"], base["latency_ms"]["p99"], True),
+        ("throughput", summary["throughput_turns_per_s"], base["throughput_turns_per_s"], False),
+    )
+    regressed = False
+    print(f"\nvs baseline (tolerance {tolerance:.0%}):")
+    for name, current, previous, lower_is_better in checks:
+        change = (current - previous) / previous if previous else 0.0
+        worse = change > tolerance if lower_is_better else change < -tolerance
+        regressed |= worse
+        print(f"  {name:<12} {previous:>10.2f} -> {current:>10.2f} ({change:+.1%}){'  REGRESSION' if worse else ''}")
+    return regressed
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--target", choices=("fastapi", "vercel"), default="fastapi")
+    parser.add_argument("--concurrency", type=int, default=8, help="sessions in flight")
+    parser.add_argument("--repeat", type=int, default=4, help="replays of each recorded conversation")
+    parser.add_argument("--conversations", default=CONVERSATIONS_FILE)
+    parser.add_argument("--provider", default="fake", help="LLM_PROVIDER for the run")
+    parser.add_argument("--llm-latency", default="lognormal:200,0.3")
+    parser.add_argument("--embedding-latency", default="lognormal:40,0.3")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--save-baseline", metavar="PATH", help="write results as a JSON baseline")
+    parser.add_argument("--compare", metavar="PATH", help="compare against a JSON baseline")
+    parser.add_argument("--tolerance", type=float, default=0.2, help="allowed relative regression")
+    args = parser.parse_args()
+    # The fastapi target runs from backend/, so resolve paths first
+    for name in ("conversations", "save_baseline", "compare"):
+        if getattr(args, name):
+            setattr(args, name, os.path.abspath(getattr(args, name)))
+
+    with open(args.conversations, "r", encoding="utf-8") as file:
+        conversations = json.load(file)
+    sessions = [conversation for _ in range(args.repeat) for conversation in conversations]
+    configure_environment(args)
+
+    if args.target == "fastapi":
+        records, elapsed = asyncio.run(replay_fastapi(sessions, args.concurrency))
+    else:
+        records, elapsed = replay_vercel(sessions, args.concurrency)
+
+    config = {
+        "provider": args.provider,
+        "llm_latency": args.llm_latency,
+        "embedding_latency": args.embedding_latency,
+        "seed": args.seed,
+        "concurrency": args.concurrency,
+        "repeat": args.repeat,
+    }
+    summary = summarize(records, elapsed)
+    print_report(args.target, config, summary)
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as file:
+            json.dump({"target": args.target, "config": config, "summary": summary}, file, indent=2)
+            file.write("\n")
+        print(f"\nbaseline written to {args.save_baseline}")
+
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as file:
+            baseline = json.load(file)
+        if baseline.get("config") != config:
+            print("\nwarning: baseline was recorded with a different configuration")
+        if compare(summary, baseline, args.tolerance):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+Cold-start benchmark for the Vercel serverless functions.
+
+Starts a fresh Python process per function and measures what a cold
+invocation pays before its first response:
+
+- import: loading the function module (``api/<function>.py`` and ``_lib``,
+  including whatever catalog parts are read at import)
+- first response: serving one request through the handler, including any
+  catalog parts loaded lazily on first use
+- total: process spawn to first response, as seen from the parent
+- rss: resident memory after the first response
+
+``--before REF`` runs the same functions from a temporary git worktree at
+REF next to the current tree, e.g. ``--before HEAD~1`` to compare against
+the monolithic catalog load. Functions a tree cannot serve offline (chat
+before the fake provider existed) are reported as failed. ``--catalog``
+swaps in a larger catalog (e.g. from benchmarks/synthetic_catalog.py) and
+writes its split parts for both trees.
+
+Models come from the fake provider with zero latency. The property detail
+request geocodes the listing address, so it still goes to the network.
+Repeats reuse the page cache, so disk reads are warm after the first run.
+
+Usage:
+    python benchmarks/cold_start.py [--before HEAD~1] [--catalog /tmp/catalog_10k.json] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+ROOT_DIR = os.path.dirname(BENCHMARK_DIR)
+DATA_NAME = "data_with_embeddings.json"
+
+# function -> (module path under api/, method, request path, JSON body)
+FUNCTIONS = {
+    "health": ("health.py", "GET", "/api/health", None),
+    "properties": ("properties.py", "GET", "/api/properties?page=1&limit=12", None),
+    "property_detail": ("properties/[id].py", "GET", "/api/properties/{property_id}", None),
+    "chat": ("chat.py", "POST", "/api/chat", {"message": "2 bedroom apartment for rent in Brooklyn"}),
+}
+
+
+def resident_mb():
+    with open("/proc/self/status", "r", encoding="utf-8") as status:
+        for line in status:
+            if line.startswith("VmRSS:"):
+                return int(line.split()[1]) / 1024
+    return 0.0
+
+
+def measure(api_dir, function, property_id):
+    """Run inside a fresh process: import one function module and serve its first request"""
+    import importlib.util
+    import logging
+    import threading
+    import urllib.error
+    import urllib.request
+    from http.server import ThreadingHTTPServer
+
+    module_file, method, path, body = FUNCTIONS[function]
+    logging.disable(logging.CRITICAL)
+    sys.path.insert(0, api_dir)
+
+    start = time.perf_counter()
+    spec = importlib.util.spec_from_file_location(f"cold_{function}", os.path.join(api_dir, module_file))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    import_ms = (time.perf_counter() - start) * 1000
+
+    class Handler(module.handler):
+        def log_message(self, format, *args):
+            pass
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    url = f"http://127.0.0.1:{server.server_address[1]}{path.format(property_id=property_id)}"
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(url, data=data, method=method, headers={"Content-Type": "application/json"})
+
+    start = time.perf_counter()
+    try:
+        with urllib.request.urlopen(request) as response:
+            response.read()
+            status = response.status
+    except urllib.error.HTTPError as e:
+        status = e.code
+    first_response_ms = (time.perf_counter() - start) * 1000
+    server.shutdown()
+
+    return {
+        "import_ms": round(import_ms, 1),
+        "first_response_ms": round(first_response_ms, 1),
+        "rss_mb": round(resident_mb(), 1),
+        "status": status,
+    }
+
+
+def first_listing_id(data_file):
+    stem, _ = os.path.splitext(data_file)
+    listings_file = f"{stem}.listings.json"
+    with open(listings_file if os.path.exists(listings_file) else data_file, "r", encoding="utf-8") as file:
+        return json.load(file)[0]["id"]
+
+
+def prepare_tree(label, api_dir, work_dir, catalog):
+    """Copy api_dir under work_dir with ``catalog`` in place of the bundled data, split into parts"""
+    sys.path.insert(0, os.path.join(ROOT_DIR, "backend"))
+    from store import write_catalog_parts
+
+    target = os.path.join(work_dir, label, "api")
+    shutil.copytree(api_dir, target, ignore=shutil.ignore_patterns("__pycache__", "data_with_embeddings.*"))
+    data_file = os.path.join(target, "_lib", DATA_NAME)
+    os.symlink(os.path.abspath(catalog), data_file)
+    with open(catalog, "r", encoding="utf-8") as file:
+        write_catalog_parts(data_file, json.load(file))
+    return target
+
+
+def run_function(api_dir, function, property_id, env):
+    started = time.perf_counter()
+    child = subprocess.run(
+        [sys.executable, os.path.abspath(__file__), "--child", api_dir, function, "--property-id", property_id],
+        capture_output=True, text=True, env=env, cwd=api_dir,
+    )
+    total_ms = (time.perf_counter() - started) * 1000
+    if child.returncode != 0:
+        return None, child.stderr.strip().splitlines()[-1:] or [f"exit {child.returncode}"]
+    result = json.loads(child.stdout.strip().splitlines()[-1])
+    result["total_ms"] = round(total_ms, 1)
+    return result, None
+
+
+def median(values):
+    values = sorted(values)
+    return values[len(values) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--functions", nargs="+", choices=sorted(FUNCTIONS), default=list(FUNCTIONS))
+    parser.add_argument("--before", metavar="REF", help="also measure the api/ tree at this git ref")
+    parser.add_argument("--catalog", metavar="PATH", help="full catalog JSON to use instead of the bundled one")
+    parser.add_argument("--repeat", type=int, default=5, help="cold starts per function (median reported)")
+    parser.add_argument("--json", metavar="PATH", help="also write the results as JSON")
+    parser.add_argument("--child", nargs=2, metavar=("API_DIR", "FUNCTION"), help=argparse.SUPPRESS)
+    parser.add_argument("--property-id", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        print(json.dumps(measure(args.child[0], args.child[1], args.property_id)))
+        return
+
+    env = dict(os.environ, LLM_PROVIDER="fake", FAKE_LLM_LATENCY="0", FAKE_EMBEDDING_LATENCY="0",
+               OPENAI_API_KEY=os.environ.get("OPENAI_API_KEY", "unused"), EMAIL_PASSWORD="")
+    work_dir = tempfile.mkdtemp(prefix="propertysearch-cold-")
+    worktree = None
+    try:
+        trees = [("current", os.path.join(ROOT_DIR, "api"))]
+        if args.before:
+            worktree = os.path.join(work_dir, "worktree")
+            subprocess.run(["git", "-C", ROOT_DIR, "worktree", "add", "--detach", "-q", worktree, args.before], check=True)
+            trees.insert(0, (args.before, os.path.join(worktree, "api")))
+        if args.catalog:
+            trees = [(label, prepare_tree(f"tree{n}", api_dir, work_dir, args.catalog)) for n, (label, api_dir) in enumerate(trees)]
+
+        property_id = first_listing_id(os.path.join(trees[-1][1], "_lib", DATA_NAME))
+        columns = [("import_ms", "import ms"), ("first_response_ms", "first resp ms"), ("total_ms", "total ms"), ("rss_mb", "RSS MB")]
+        print(f"repeat={args.repeat} catalog={args.catalog or 'bundled'}; medians over fresh processes")
+        print(f"{'tree':<12} {'function':<16}" + "".join(f"{title:>14}" for _, title in columns))
+        results = []
+        for label, api_dir in trees:
+            for function in args.functions:
+                runs, error = [], None
+                for _ in range(args.repeat):
+                    result, error = run_function(api_dir, function, property_id, env)
+                    if result is None:
+                        break
+                    runs.append(result)
+                if error:
+                    print(f"{label:<12} {function:<16} failed: {error[0][:80]}")
+                    continue
+                summary = {key: median([run[key] for run in runs]) for key, _ in columns}
+                results.append({"tree": label, "function": function, **summary})
+                print(f"{label:<12} {function:<16}" + "".join(f"{summary[key]:>14.1f}" for key, _ in columns))
+    finally:
+        if worktree:
+            subprocess.run(["git", "-C", ROOT_DIR, "worktree", "remove", "--force", worktree], check=False)
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as file:
+            json.dump(results, file, indent=2)
+            file.write("\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Response serialization benchmark: default encoders vs the fast JSON path.
+
+Builds synthetic listings (benchmarks/synthetic_catalog.py, with media
+arrays and schools) into catalog records and projections, then times one
+response body per call for:
+
+- /properties pages of several sizes
+- a property detail with location data
+- a chat response carrying search results
+
+Encoders compared (median microseconds per body):
+
+- fastapi: jsonable_encoder plus JSONResponse.render, FastAPI's default
+- stdlib: json.dumps(...).encode(), what the Vercel handlers did
+- fast: store.fastjson.dumps (orjson when installed); for the chat
+  response, ChatResponse.model_dump_json without re-encoding
+- spliced: the page assembled from pre-serialized cards
+  (PRESERIALIZE_RESPONSES)
+
+Usage:
+    python benchmarks/json_encoding.py [--pages 12 50 200 1000] [--repeat 200]
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARK_DIR, "..", "backend"))
+sys.path.insert(0, BENCHMARK_DIR)
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
+
+from schema.chat import ChatResponse
+from store import Projections, build_records
+from store.fastjson import FAST_JSON_AVAILABLE, dumps
+from synthetic_catalog import make_listing
+
+
+def median_us(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def fastapi_render(content):
+    return JSONResponse(content=None).render(jsonable_encoder(content))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[12, 50, 200, 1000])
+    parser.add_argument("--repeat", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    size = max(args.pages)
+    records = build_records(make_listing(number, rng) for number in range(size))
+    projections = Projections(records, serialize=True)
+
+    detail = dict(projections.details[0])
+    detail["coordinates"] = {"lat": 40.7794, "lng": -73.9558}
+    detail["nearby_schools"] = [
+        {"name": f"PS {i}", "type": "school", "distance": 0.2 + i / 10, "rating": 8} for i in range(8)]
+    detail["nearby_attractions"] = [
+        {"name": f"Attraction {i}", "type": "park", "distance": 0.5 + i / 10} for i in range(8)]
+    chat = ChatResponse(
+        response="Here are a few places that match.", response_type="search_results", intent="PROPERTY_QUERY",
+        results=[dict(projections.details[row]) for row in range(5)],
+        metadata={"timings_ms": {"intent": 812.4, "embedding": 120.9, "scoring": 0.4, "total": 1804.2}},
+        session_id="0f8a1c52-1d7e-4b0c-9d4e-3c8f1a2b6d90",
+    )
+
+    print(f"encoder: {'orjson' if FAST_JSON_AVAILABLE else 'json (orjson not installed)'}; median us per response body")
+    print(f"{'payload':>18} {'KB':>8} {'fastapi':>10} {'stdlib':>10} {'fast':>10} {'spliced':>10} {'speedup':>8}")
+
+    def report(label, content, fast, spliced=None):
+        kb = len(fast()) / 1024
+        fastapi_us = median_us(lambda: fastapi_render(content), args.repeat)
+        stdlib_us = median_us(lambda: json.dumps(content).encode(), args.repeat)
+        fast_us = median_us(fast, args.repeat)
+        best_us = fast_us
+        spliced_column = f"{'':>10}"
+        if spliced is not None:
+            spliced_us = median_us(spliced, args.repeat)
+            best_us = min(fast_us, spliced_us)
+            spliced_column = f"{spliced_us:>10.1f}"
+        print(f"{label:>18} {kb:>8.1f} {fastapi_us:>10.1f} {stdlib_us:>10.1f} {fast_us:>10.1f} "
+              f"{spliced_column} {fastapi_us / best_us:>7.0f}x")
+
+    for limit in args.pages:
+        rows = np.arange(limit)
+        pagination = {"page": 1, "limit": limit, "total": size, "totalPages": -(-size // limit),
+                      "hasNext": limit < size, "hasPrev": False}
+        page = {"properties": [projections.cards[row] for row in rows], "pagination": pagination}
+        report(f"page of {limit}", page, lambda: dumps(page),
+               lambda: projections.listing_page_json(rows, pagination))
+
+    report("property detail", detail, lambda: dumps(detail),
+           lambda: projections.detail_json(0, detail))
+    report("chat response", chat.model_dump(), lambda: chat.model_dump_json().encode())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,84 @@
+#!/usr/bin/env python3
+"""
+Offline POI index benchmark: what a neighborhood lookup costs without Overpass.
+
+Writes synthetic places around a city center into a temporary POI index
+(store/poi_index.py) and, for random property points, reports:
+
+- median microseconds to load a geohash cell's covering circle from the
+  R-tree, what the first lookup in a cell costs
+- median microseconds for a lookup whose cell is already in the
+  PoiTileCache, what every later lookup in the cell costs
+- places returned per cell
+
+Usage:
+    python benchmarks/poi_index.py [--places 50000] [--points 200] [--precision 6]
+"""
+
+import argparse
+import os
+import random
+import sys
+import tempfile
+import time
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARK_DIR, "..", "backend"))
+
+from store.poi_index import PoiIndex, PoiIndexWriter
+from store.poi_tiles import PoiTileCache
+
+CENTER = (40.75, -73.98)
+SPREAD = 0.25
+RADIUS = 3000
+TAGS = ({"amenity": "school"}, {"amenity": "restaurant"}, {"leisure": "park"}, {"shop": "bakery"},
+        {"tourism": "museum"}, {"amenity": "bank"})
+
+
+def median(samples):
+    samples = sorted(samples)
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--places", type=int, default=50_000)
+    parser.add_argument("--points", type=int, default=200)
+    parser.add_argument("--precision", type=int, default=6)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "pois.sqlite3")
+        with PoiIndexWriter(path) as writer:
+            writer.add((rng.choice(("node", "way")),
+                        CENTER[0] + rng.uniform(-SPREAD, SPREAD), CENTER[1] + rng.uniform(-SPREAD, SPREAD),
+                        dict(rng.choice(TAGS), name=f"Place {number}"))
+                       for number in range(args.places))
+            writer.add_coverage((CENTER[0] - SPREAD, CENTER[1] - SPREAD, CENTER[0] + SPREAD, CENTER[1] + SPREAD))
+        index = PoiIndex(path)
+        tiles = PoiTileCache(precision=args.precision, max_tiles=args.points)
+
+        points = [(CENTER[0] + rng.uniform(-0.1, 0.1), CENTER[1] + rng.uniform(-0.1, 0.1)) for _ in range(args.points)]
+        cold, warm, sizes = [], [], []
+        for coords in points:
+            start = time.perf_counter()
+            tile = tiles.tile(coords)
+            if tiles.get(tile) is None:
+                lat, lng, radius = tiles.covering_circle(tile, RADIUS)
+                if index.covers((lat, lng), radius):
+                    sizes.append(len(tiles.put(tile, index.places_within((lat, lng), radius))))
+                    cold.append((time.perf_counter() - start) * 1e6)
+            start = time.perf_counter()
+            tiles.get(tiles.tile(coords))
+            warm.append((time.perf_counter() - start) * 1e6)
+
+    print(f"{len(index):,} places, {args.points} points, {len(cold)} cells loaded (precision {args.precision})")
+    if cold:
+        print(f"cell load from R-tree: {median(cold):10.1f} us median, {median(sizes):,} places per cell")
+    print(f"tile cache hit:        {median(warm):10.1f} us median")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""
+Memory benchmark: raw JSON listing dicts vs compact PropertyRecord objects.
+
+Writes synthetic listings (benchmarks/synthetic_catalog.py, without
+embeddings) to a listings file and measures, with tracemalloc, the bytes
+per listing held by:
+
+- json.load: one parse of the whole array (what the loaders did before the
+  catalog was streamed; the decoder shares key strings across the document)
+- streamed dicts: records parsed one at a time by iter_json_records, where
+  every record carries its own copy of each key
+- records: the same stream built into PropertyRecord objects, as
+  Catalog.listings holds them now
+
+Usage:
+    python benchmarks/record_memory.py [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import gc
+import json
+import os
+import sys
+import tempfile
+import tracemalloc
+
+import numpy as np
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARK_DIR, "..", "backend"))
+sys.path.insert(0, BENCHMARK_DIR)
+
+from store import build_records, iter_json_records
+from synthetic_catalog import make_listing
+
+
+def write_listings(path, size, seed=0):
+    rng = np.random.default_rng(seed)
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("[\n")
+        for number in range(size):
+            listing = make_listing(number, rng)
+            listing.pop("embedding_text")
+            file.write(("" if number == 0 else ",\n") + json.dumps(listing))
+        file.write("\n]\n")
+
+
+def held_bytes(load):
+    """Bytes still allocated by ``load()``'s result once it returns"""
+    gc.collect()
+    tracemalloc.start()
+    result = load()
+    gc.collect()
+    held, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return held
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    def json_load(path):
+        with open(path, "r", encoding="utf-8") as file:
+            return json.load(file)
+
+    loaders = [
+        ("json.load", json_load),
+        ("streamed dicts", lambda path: list(iter_json_records(path))),
+        ("records", lambda path: build_records(iter_json_records(path))),
+    ]
+    print(f"{'listings':>10} " + " ".join(f"{name:>16}" for name, _ in loaders) + "   (bytes per listing)")
+    with tempfile.TemporaryDirectory() as tmp:
+        for size in args.sizes:
+            path = os.path.join(tmp, f"listings_{size}.json")
+            write_listings(path, size, args.seed)
+            per_listing = [held_bytes(lambda: load(path)) / size for _, load in loaders]
+            saving = 1 - per_listing[-1] / per_listing[0]
+            print(f"{size:>10} " + " ".join(f"{value:>16,.0f}" for value in per_listing)
+                  + f"   records save {saving:.0%} vs json.load")
+
+
+if __name__ == "__main__":
+    main()
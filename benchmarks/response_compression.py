@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""
+Response compression benchmark: bytes on the wire and CPU per response.
+
+Builds synthetic listings (benchmarks/synthetic_catalog.py) into
+pre-serialized projections and, for /properties pages of several sizes
+plus a chat response echoing its conversation state, reports:
+
+- raw, gzip and br sizes (br only when the brotli package is installed)
+- median microseconds to compress each body
+- median microseconds for a CompressedBodyCache hit, what a repeated
+  listing page costs once its compressed body is cached
+
+Usage:
+    python benchmarks/response_compression.py [--pages 12 50 200] [--repeat 50]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+import numpy as np
+
+BENCHMARK_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(BENCHMARK_DIR, "..", "backend"))
+sys.path.insert(0, BENCHMARK_DIR)
+
+from store import Projections, build_records
+from store.compression import ENCODINGS, CompressedBodyCache, compress
+from store.fastjson import dumps
+from synthetic_catalog import make_listing
+
+
+def median_us(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - start) * 1e6)
+    samples.sort()
+    return samples[len(samples) // 2]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--pages", type=int, nargs="+", default=[12, 50, 200])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    size = max(args.pages)
+    records = build_records(make_listing(number, rng) for number in range(size))
+    projections = Projections(records, serialize=True)
+
+    bodies = []
+    for limit in args.pages:
+        pagination = {"page": 1, "limit": limit, "total": size, "totalPages": -(-size // limit),
+                      "hasNext": limit < size, "hasPrev": False}
+        bodies.append((f"page of {limit}", projections.listing_page_json(np.arange(limit), pagination)))
+    results = [dict(projections.details[row]) for row in range(5)]
+    bodies.append(("chat response", dumps({
+        "response": "Here are a few places that match.",
+        "response_type": "search_results",
+        "results": results,
+        "conversation_state": {"latest_property_results": results, "conversation_history": []},
+    })))
+
+    print(f"encodings: {', '.join(ENCODINGS)}; sizes in KB, times in median us")
+    header = f"{'payload':>16} {'raw KB':>8}"
+    for encoding in ENCODINGS:
+        header += f" {encoding + ' KB':>9} {encoding + ' us':>9} {'cached us':>10}"
+    print(header)
+
+    for label, body in bodies:
+        line = f"{label:>16} {len(body) / 1024:>8.1f}"
+        for encoding in ENCODINGS:
+            compressed = compress(body, encoding)
+            compress_us = median_us(lambda: compress(body, encoding), args.repeat)
+            cache = CompressedBodyCache()
+            cache.compress(label, body, encoding)
+            # A fresh copy of the body, as a new request would build it
+            fresh = bytes(bytearray(body))
+            cached_us = median_us(lambda: cache.compress(label, fresh, encoding), args.repeat)
+            line += f" {len(compressed) / 1024:>9.1f} {compress_us:>9.0f} {cached_us:>10.1f}"
+        print(line)
+
+
+if __name__ == "__main__":
+    main()
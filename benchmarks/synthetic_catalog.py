@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+Synthetic property catalog generator.
+
+Writes listings shaped like backend/data_with_embeddings.json (plus the slug,
+media and livingSpaceSize fields the listing endpoints read), with prices,
+bed/bath counts and sizes drawn per borough and neighborhood, roughly a
+quarter of listings for lease, and a random unit embedding per listing.
+Listings are streamed to disk one at a time, so the generator itself stays
+small at any catalog size. The output is reproducible for a given seed.
+
+A 1536-dimension JSON catalog takes about 20 KB per listing on disk, so
+1M listings at full dimension is ~20 GB; use --dimension to scale down.
+
+Usage:
+    python benchmarks/synthetic_catalog.py --size 10000 --output /tmp/catalog_10k.json [--dimension 1536]
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+# (borough, neighborhood, zip code, price multiplier)
+NEIGHBORHOODS = [
+    ("New York", "Upper East Side", "10028", 1.6), ("New York", "Upper West Side", "10024", 1.5),
+    ("New York", "Midtown West", "10019", 1.4), ("New York", "SoHo", "10012", 2.0),
+    ("New York", "Greenwich Village", "10014", 1.9), ("New York", "Financial District", "10038", 1.4),
+    ("New York", "Harlem", "10027", 0.9), ("New York", "Chelsea", "10011", 1.8),
+    ("Brooklyn", "Williamsburg", "11249", 1.3), ("Brooklyn", "DUMBO", "11201", 1.6),
+    ("Brooklyn", "Park Slope", "11215", 1.4), ("Brooklyn", "Prospect Heights", "11238", 1.2),
+    ("Brooklyn", "Bushwick", "11237", 0.9), ("Brooklyn", "Bay Ridge", "11209", 0.8),
+    ("Forest Hills", "Forest Hills", "11375", 0.9), ("Long Island City", "Long Island City", "11101", 1.2),
+    ("Astoria", "Astoria", "11102", 0.85), ("Flushing", "Flushing", "11354", 0.75),
+    ("Bronx", "Fordham", "10458", 0.55), ("Bronx", "Riverdale", "10471", 0.7),
+    ("Staten Island", "Tottenville", "10307", 0.6), ("Staten Island", "St. George", "10301", 0.55),
+]
+PROPERTY_TYPES = ["apartment", "condo", "house", "coop", "loft", "townhouse", "penthouse", "brownstone"]
+PROPERTY_TYPE_WEIGHTS = [0.4, 0.16, 0.15, 0.12, 0.07, 0.05, 0.03, 0.02]
+BEDROOMS = [0, 1, 2, 3, 4, 5]
+BEDROOM_WEIGHTS = [0.1, 0.22, 0.32, 0.22, 0.1, 0.04]
+STREETS = [
+    "Main Street", "Park Avenue", "Broadway", "Kent Avenue", "Bedford Avenue", "Court Street",
+    "Atlantic Avenue", "Ocean Parkway", "Queens Boulevard", "Grand Concourse", "Hylan Boulevard",
+    "West End Avenue", "Lexington Avenue", "Flatbush Avenue", "Steinway Street", "Jerome Avenue",
+]
+ADJECTIVES = ["Luxury", "Modern", "Spacious", "Sunny", "Renovated", "Charming", "Historic", "Affordable", "Family"]
+AMENITIES = [
+    "doorman", "gym", "rooftop", "parking", "updated_kitchen", "hardwood_floors", "laundry",
+    "elevator", "pets_allowed", "balcony", "garden", "washer_dryer", "central_air", "fireplace",
+    "near_park", "near_schools", "river_view", "skyline_view", "pool", "concierge", "storage",
+]
+SCHOOLS = ["PS 6", "PS 41", "PS 87", "PS 321", "IS 318", "MS 51", "Stuyvesant HS", "Brooklyn Tech HS", "Bronx Science HS"]
+IMAGE_BASE = "https://images.example.com/listings"
+
+
+def listing_rows(size, dimension, seed=0, chunk=4096):
+    """Yield (listing, embedding) pairs; embeddings are float32 unit vectors"""
+    rng = np.random.default_rng(seed)
+    for start in range(0, size, chunk):
+        count = min(chunk, size - start)
+        vectors = rng.standard_normal((count, dimension), dtype=np.float32)
+        vectors /= np.linalg.norm(vectors, axis=1, keepdims=True)
+        for offset in range(count):
+            yield make_listing(start + offset, rng), vectors[offset]
+
+
+def make_listing(number, rng):
+    borough, neighborhood, zip_code, multiplier = NEIGHBORHOODS[rng.integers(len(NEIGHBORHOODS))]
+    property_type = PROPERTY_TYPES[rng.choice(len(PROPERTY_TYPES), p=PROPERTY_TYPE_WEIGHTS)]
+    bedrooms = int(rng.choice(BEDROOMS, p=BEDROOM_WEIGHTS))
+    if property_type in ("house", "townhouse", "brownstone"):
+        bedrooms = max(bedrooms, 2)
+    bathrooms = int(max(1, min(bedrooms, round(bedrooms * rng.uniform(0.5, 1.0)))))
+    square_feet = int(round((450 + bedrooms * 380 + rng.normal(0, 120)) / 10) * 10)
+    square_feet = max(square_feet, 300)
+
+    lease = bool(rng.random() < 0.28)
+    base_price = square_feet * 1100 * multiplier * rng.lognormal(0, 0.2)
+    sales_price = None if lease else int(round(base_price, -3))
+    lease_price = int(round(base_price / 230, -1)) if lease or rng.random() < 0.4 else None
+
+    street_number = int(rng.integers(1, 400))
+    street = STREETS[rng.integers(len(STREETS))]
+    state_city = "New York" if borough == "New York" else borough
+    full_address = f"{street_number} {street}, {state_city}, NY {zip_code}"
+    bedroom_label = "Studio" if bedrooms == 0 else f"{bedrooms}BR"
+    adjective = ADJECTIVES[rng.integers(len(ADJECTIVES))]
+    transaction = "for Rent" if lease else "for Sale"
+    name = f"{adjective} {bedroom_label} {property_type.title()} {transaction} in {neighborhood} #{number}"
+    amenities = [AMENITIES[i] for i in rng.choice(len(AMENITIES), size=int(rng.integers(3, 9)), replace=False)]
+    description = (
+        f"{adjective} {bedrooms}-bedroom, {bathrooms}-bathroom {property_type} in {neighborhood}, "
+        f"{borough}. About {square_feet} square feet with {', '.join(a.replace('_', ' ') for a in amenities[:4])}."
+    )
+    slug = f"{bedroom_label}-{property_type}-{neighborhood}-{number}".lower().replace(" ", "-").replace(".", "")
+
+    listing = {
+        "id": f"prop_{number:07d}",
+        "name": name,
+        "description": description,
+        "salesPrice": sales_price,
+        "leasePrice": lease_price,
+        "leaseProperty": lease,
+        "fullAddress": full_address,
+        "addressCity": borough,
+        "city": neighborhood,
+        "bedroomCount": bedrooms,
+        "bathCount": bathrooms,
+        "propertyType": property_type,
+        "squareFeet": str(square_feet),
+        "livingSpaceSize": str(square_feet),
+        "amenities": amenities,
+        "nearby_schools": [
+            {
+                "name": SCHOOLS[i],
+                "distance": round(float(rng.uniform(0.1, 2.0)), 1),
+                "rating": int(rng.integers(5, 11)),
+            }
+            for i in rng.choice(len(SCHOOLS), size=int(rng.integers(1, 4)), replace=False)
+        ],
+        "slug": slug,
+        "media": [
+            {
+                f"{size}Url": f"{IMAGE_BASE}/{number}/{image}-{size}.jpg"
+                for size in ("small", "medium", "large", "xLarge", "xxLarge")
+            } | {"height": 1080, "width": 1620}
+            for image in range(int(rng.integers(2, 5)))
+        ],
+    }
+    listing["embedding_text"] = f"{name}. {description}"
+    return listing
+
+
+def write_catalog(path, size, dimension=1536, seed=0, model="synthetic"):
+    """Stream ``size`` listings with embeddings to ``path`` as a JSON array"""
+    with open(path, "w", encoding="utf-8") as file:
+        file.write("[\n")
+        for number, (listing, vector) in enumerate(listing_rows(size, dimension, seed)):
+            listing["embedding"] = np.round(vector.astype(np.float64), 8).tolist()
+            listing["embedding_model"] = model
+            if number:
+                file.write(",\n")
+            file.write(json.dumps(listing))
+        file.write("\n]\n")
+    return path
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--size", type=int, required=True, help="number of listings (e.g. 1000, 10000, 100000, 1000000)")
+    parser.add_argument("--output", required=True)
+    parser.add_argument("--dimension", type=int, default=1536)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    write_catalog(args.output, args.size, args.dimension, args.seed)
+    size_mb = os.path.getsize(args.output) / 1e6
+    print(f"wrote {args.size} listings ({args.dimension}-d embeddings) to {args.output} ({size_mb:.1f} MB)", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -27,6 +27,9 @@ if [ -d "venv" ]; then
         sleep 2
     fi
     
+    echo -e "${BLUE}Building catalog parts...${NC}"
+    python create_embeddings.py --parts-only
+
     echo -e "${GREEN}Starting backend on http://localhost:8000${NC}"
     python main.py &
     BACKEND_PID=$!